@@ -8,13 +8,16 @@ streamlit run app.py
 
 import streamlit as st
 import pandas as pd
-import requests
-import time
-import os
-import json
 
-# Doğru BASE URL
-BASE_URL = "https://raw.githubusercontent.com/statsbomb/open-data/refs/heads/master/data/"
+from core.loaders import BASE_URL, url_to_local_path, read_json, raw_exists, matches_path, file_version
+from core.catalog import load_catalog, catalog_path, available_seasons
+from core.match_index import MatchIndex
+from core.export import CHUNK_ROWS, season_event_chunks
+from core.prefetch import PrefetchQueue, neighbours
+from core.perf import span, trace_page, show_perf_panel
+from core.cache import observed, evict_season
+from core.watch import start_watcher
+from ui.export_panel import export_panel
 
 # Sayfa konfigürasyonu
 st.set_page_config(
@@ -42,36 +45,24 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Maç listesi sayfalama
+PAGE_SIZES = [25, 50, 100]
+ROW_HEIGHT = 35
+
 def load_from_local(url):
     """Lokal dosyadan veri oku"""
-    import os
-    import json
-    
-    # URL'den dosya yolunu çıkar
-    # Örnek: ".../data/events/123.json" → "data/events/123.json"
-    if "/competitions.json" in url:
-        local_path = "data/competitions.json"
-    elif "/matches/" in url:
-        parts = url.split("/matches/")[1]  # "11/90.json"
-        local_path = f"data/matches/{parts}"
-    elif "/events/" in url:
-        parts = url.split("/events/")[1]  # "3895292.json"
-        local_path = f"data/events/{parts}"
-    elif "/lineups/" in url:
-        parts = url.split("/lineups/")[1]
-        local_path = f"data/lineups/{parts}"
-    else:
+    local_path = url_to_local_path(url)
+    if local_path is None:
         return None
     
-    # Dosya varsa oku
-    if os.path.exists(local_path):
-        with open(local_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    # Dosya varsa oku (sıkıştırılmış hali de)
+    if raw_exists(local_path):
+        return read_json(local_path)
     else:
         st.error(f"❌ File not found: {local_path}")
         return None
 
-@st.cache_data(ttl=3600)
+@observed(st.cache_data(ttl=3600), "Home", "loader", ttl=3600)
 def load_competition_info(competition_id, season_id):
     """Turnuva ve sezon bilgilerini getir"""
     url = f"{BASE_URL}competitions.json"
@@ -103,50 +94,46 @@ def load_competition_info(competition_id, season_id):
         st.error(f"❌ Error processing data: {e}")
         return None
 
-@st.cache_data(ttl=3600)
-def load_matches(competition_id, season_id):
-    """Maçları yükle ve işle"""
-    url = f"{BASE_URL}matches/{competition_id}/{season_id}.json"
-    
-    st.info(f"📡 Loading matches: {url}")
-    data = load_from_local(url)
+@observed(st.cache_data(ttl=3600), "Home", "loader", ttl=3600)
+def load_competitions():
+    """Tüm turnuva/sezon listesi ve lokal olarak mevcut olanlar"""
+    data = load_from_local(f"{BASE_URL}competitions.json")
     
     if data is None:
-        return None
+        return None, set()
+    
+    return pd.DataFrame(data), available_seasons(data)
+
+@observed(st.cache_data(ttl=3600), "Home", "loader", ttl=3600)
+def load_matches(competition_id, season_id, version=None):
+    """Maçları yükle (hazır katalogdan, yoksa oluştur)"""
+    st.info(f"📡 Loading matches: {catalog_path(competition_id, season_id)}")
     
     try:
-        matches = pd.DataFrame(data)
-        st.success(f"✅ {len(matches)} matches loaded!")
-        
-        # Dictionary kolonlarını aç
-        matches['home_team_id'] = matches['home_team'].apply(lambda x: x['home_team_id'])
-        matches['home_team_name'] = matches['home_team'].apply(lambda x: x['home_team_name'])
-        matches['away_team_id'] = matches['away_team'].apply(lambda x: x['away_team_id'])
-        matches['away_team_name'] = matches['away_team'].apply(lambda x: x['away_team_name'])
-        
-        # Stadium bilgisi
-        matches['stadium_name'] = matches['stadium'].apply(
-            lambda x: x.get('name', 'Unknown') if isinstance(x, dict) else 'Unknown'
-        )
-        
-        # Match week number (rakam olarak)
-        matches['match_week'] = matches['match_week'].astype(int)
-        
-        # Tarih formatı düzelt
-        matches['match_date'] = pd.to_datetime(matches['match_date'])
-        matches['formatted_date'] = matches['match_date'].dt.strftime('%d.%m.%Y')
-        matches['formatted_time'] = matches['kick_off'].apply(
-            lambda x: x if pd.notna(x) else '—'
-        )
-        
-        # Sıralama: Önce match_week, sonra tarih (küçükten büyüğe)
-        matches = matches.sort_values(['match_week', 'match_date'], ascending=[True, True])
-        
-        return matches
-        
+        matches = load_catalog(competition_id, season_id)
     except Exception as e:
         st.error(f"❌ Error processing data: {e}")
         return None
+    
+    if matches is None:
+        st.error(f"❌ File not found: {matches_path(competition_id, season_id)}")
+        return None
+    
+    st.success(f"✅ {len(matches)} matches loaded!")
+    return matches
+
+@observed(st.cache_resource, "Home", "index")
+def get_match_index(competition_id, season_id, version=None):
+    """Sezon kataloğu için indeksler (oturumlar arasında paylaşılır)"""
+    matches = load_matches(competition_id, season_id, version)
+    if matches is None:
+        return None
+    return MatchIndex(matches)
+
+@st.cache_resource
+def get_prefetch_queue():
+    """Seçilen maç için arka plan ön yükleme kuyruğu (oturumlar arasında paylaşılır)"""
+    return PrefetchQueue()
 
 def display_match_list(matches_df):
     """Maç listesini tablo olarak göster"""
@@ -205,21 +192,50 @@ def main():
     # Başlık
     st.markdown("# ⚽ StatsBomb Match List")
     
-    # Parametreler
+    # data/ izleyicisi: değişen maç dosyalarının önbelleğini arka planda siler
+    start_watcher()
+    
+    # Turnuva / sezon seçimi
+    competitions, available = load_competitions()
+    
     COMPETITION_ID = 9
     SEASON_ID = 281
     
+    if competitions is not None:
+        st.sidebar.header("🏆 Competition")
+        
+        season_options = {
+            f"{'✅' if (row['competition_id'], row['season_id']) in available else '☁️'} "
+            f"{row['competition_name']} ({row['country_name']}) - {row['season_name']}":
+            (row['competition_id'], row['season_id'])
+            for _, row in competitions.iterrows()
+        }
+        labels = list(season_options)
+        default_index = list(season_options.values()).index((COMPETITION_ID, SEASON_ID)) \
+            if (COMPETITION_ID, SEASON_ID) in season_options.values() else 0
+        
+        selected_season = st.sidebar.selectbox(
+            "Competition & Season",
+            labels,
+            index=default_index,
+            help="✅ = available locally, ☁️ = run build_catalogs.py --download first"
+        )
+        COMPETITION_ID, SEASON_ID = season_options[selected_season]
+    
     st.markdown(f"""
         <div style='text-align: center; padding: 1rem; background-color: #f0f2f6; border-radius: 10px; margin-bottom: 1rem;'>
             <p><strong>Competition ID:</strong> {COMPETITION_ID} | <strong>Season ID:</strong> {SEASON_ID}</p>
         </div>
     """, unsafe_allow_html=True)
     
-    # Manuel yenileme butonu
+    # Maç dosyasının sürümü önbellek anahtarının parçası: dosya değişince katalog yeniden okunur
+    version = file_version(matches_path(COMPETITION_ID, SEASON_ID))
+    
+    # Manuel yenileme butonu (yalnızca bu sezon; diğer önbellekler korunur)
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
-        if st.button("🔄 Reload Data", use_container_width=True):
-            st.cache_data.clear()
+        if st.button("🔄 Refresh Season", use_container_width=True):
+            evict_season(COMPETITION_ID, SEASON_ID)
             st.rerun()
     
     st.markdown("---")
@@ -227,10 +243,14 @@ def main():
     # Loading göstergesi
     with st.spinner('📥 Loading data...'):
         # Turnuva bilgisi
-        comp_info = load_competition_info(COMPETITION_ID, SEASON_ID)
+        with span("load_competition_info", "load"):
+            comp_info = load_competition_info(COMPETITION_ID, SEASON_ID)
         
         # Maçları yükle
-        matches = load_matches(COMPETITION_ID, SEASON_ID)
+        with span("load_matches", "load"):
+            matches = load_matches(COMPETITION_ID, SEASON_ID, version)
+        with span("get_match_index", "compute"):
+            index = get_match_index(COMPETITION_ID, SEASON_ID, version)
     
     if matches is None or len(matches) == 0:
         st.error("❌ Failed to load match data!")
@@ -240,7 +260,7 @@ def main():
         1. **Check your internet connection**
         2. **Try disabling VPN if you're using one**
         3. **Wait a few minutes and try again**
-        4. **Click the "Reload Data" button above**
+        4. **Click the "Refresh Season" button above**
         5. **Clear browser cache** (Ctrl+Shift+Delete)
         """)
         
@@ -278,65 +298,80 @@ def main():
         st.metric("📈 Goals per Match", f"{avg_goals:.2f}")
     
     with col4:
-        unique_teams = pd.concat([
-            matches['home_team_name'], 
-            matches['away_team_name']
-        ]).nunique()
-        st.metric("👥 Teams", unique_teams)
+        st.metric("👥 Teams", len(index.teams))
     
     st.markdown("---")
     
     # Filtreler
     st.sidebar.header("🔍 Filters")
     
-    # Takım filtresi
-    all_teams = sorted(list(set(
-        matches['home_team_name'].tolist() + 
-        matches['away_team_name'].tolist()
-    )))
-    
+    # Takım filtresi (selectbox yazarak arama destekler)
     selected_team = st.sidebar.selectbox(
         "Select Team (Optional)",
-        ["All"] + all_teams
+        ["All"] + index.teams
     )
     
     # Hafta filtresi
-    all_weeks = sorted(matches['match_week'].unique().tolist())
     selected_week = st.sidebar.selectbox(
         "Select Week (Optional)",
-        ["All"] + all_weeks
+        ["All"] + index.weeks
     )
     
-    # Filtreleme uygula
-    filtered_matches = matches.copy()
-    
-    if selected_team != "All":
-        filtered_matches = filtered_matches[
-            (filtered_matches['home_team_name'] == selected_team) |
-            (filtered_matches['away_team_name'] == selected_team)
-        ]
-    
-    if selected_week != "All":
-        filtered_matches = filtered_matches[
-            filtered_matches['match_week'] == selected_week
-        ]
+    # Tarih aralığı filtresi
+    first_date, last_date = index.date_range
+    date_from = date_to = None
+    if first_date is not None:
+        date_range = st.sidebar.date_input(
+            "Date Range",
+            value=(first_date, last_date),
+            min_value=first_date,
+            max_value=last_date
+        )
+        date_from, date_to = (date_range + (None,))[:2] if isinstance(date_range, tuple) else (date_range, None)
+        # Tüm aralık seçiliyse filtre yok: tarihi bilinmeyen maçlar da listede kalır
+        if (date_from, date_to) == (first_date, last_date):
+            date_from = date_to = None
+    
+    # Filtreleme: indeks kesişimi (DataFrame kopyası/maske yok)
+    with span("index_query", "compute"):
+        positions = index.query(
+            team=None if selected_team == "All" else selected_team,
+            week=None if selected_week == "All" else selected_week,
+            date_from=date_from,
+            date_to=date_to
+        )
     
     # Filtrelenmiş sonuç sayısı
-    if len(filtered_matches) < len(matches):
-        st.info(f"🔍 Filtered results: {len(filtered_matches)} matches")
+    if len(positions) < len(index):
+        st.info(f"🔍 Filtered results: {len(positions)} matches")
     
     # Maç listesini göster
-    if len(filtered_matches) > 0:
-        display_df, full_df = display_match_list(filtered_matches)
-        
+    if len(positions) > 0:
         st.markdown("### 📋 Match List")
         
+        # Sayfalama
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, index=0)
+        page_count = MatchIndex.page_count(positions, page_size)
+        with col2:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        with col3:
+            st.markdown(f"<div style='padding-top: 2rem;'>Page {page} of {page_count}</div>", unsafe_allow_html=True)
+        
+        # Sadece görünen sayfa oluşturulur
+        with span("display_match_list", "render"):
+            display_df, full_df = display_match_list(index.page(positions, page, page_size))
+        
         # Match ID seçimi için
         st.info("💡 **Select a match** from the dropdown below to view details or pass analysis")
         
         match_options = [
-            f"{row['🏠 Home Team']} vs {row['✈️ Away Team']} ({row['📅 Date']}) - ID: {row['Match ID']}"
-            for _, row in full_df.iterrows()
+            f"{home} vs {away} ({date}) - ID: {match_id}"
+            for home, away, date, match_id in zip(
+                full_df['🏠 Home Team'], full_df['✈️ Away Team'],
+                full_df['📅 Date'], full_df['Match ID']
+            )
         ]
         
         selected_match = st.selectbox(
@@ -351,6 +386,18 @@ def main():
             # Session state'e kaydet
             st.session_state.selected_match_id = match_id
             
+            # Detay sayfaları sıcak açılsın: seçilen maç ve filtrelenmiş listedeki komşuları arka planda
+            prefetch = get_prefetch_queue()
+            if st.session_state.get('prefetched_match_id') != match_id:
+                filtered_ids = index.catalog['match_id'].to_numpy()[positions].tolist()
+                prefetch.select(match_id, neighbours(filtered_ids, match_id))
+                st.session_state.prefetched_match_id = match_id
+            status = prefetch.status(match_id)
+            if status == 'ready':
+                st.caption("⚡ Match data is ready - detail pages will open instantly")
+            elif status in ('queued', 'running'):
+                st.caption("⏳ Preparing match data in the background...")
+            
             col1, col2 = st.columns(2)
             
             with col1:
@@ -383,22 +430,27 @@ def main():
                     </div>
                 """, unsafe_allow_html=True)
         
-        # Tablo gösterimi - interaktif
-        st.dataframe(
-            display_df,
-            use_container_width=True,
-            height=600,
-            hide_index=True
-        )
+        # Tablo gösterimi - yükseklik satır sayısına göre
+        with span("match_table", "transfer"):
+            st.dataframe(
+                display_df,
+                use_container_width=True,
+                height=ROW_HEIGHT * (len(display_df) + 1) + 3,
+                hide_index=True
+            )
         
-        # İndirme butonu
-        csv = display_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button(
-            label="📥 Download as CSV",
-            data=csv,
-            file_name=f"matches_{COMPETITION_ID}_{SEASON_ID}.csv",
-            mime="text/csv"
-        )
+        # Export - tüm filtrelenmiş maçlar, parça parça ve arka planda
+        def match_list_chunks():
+            for start in range(0, len(positions), CHUNK_ROWS):
+                yield display_match_list(index.catalog.iloc[positions[start:start + CHUNK_ROWS]])[0]
+        
+        filtered_ids = index.catalog['match_id'].to_numpy()[positions].tolist()
+        export_panel("matches_export", {
+            "Match list": (f"matches_{COMPETITION_ID}_{SEASON_ID}", match_list_chunks),
+            "Events of filtered matches (local)": (
+                f"events_{COMPETITION_ID}_{SEASON_ID}", lambda: season_event_chunks(filtered_ids)
+            ),
+        })
     else:
         st.warning("⚠️ No matches found matching the filters.")
     
@@ -411,4 +463,6 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with trace_page("Home") as trace:
+        main()
+    show_perf_panel(trace)
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Client-side vs Matplotlib Rendering Benchmark
+Sunucu tarafı süre ve gönderilen veri boyutu karşılaştırması
+
+Matplotlib yolu: figure oluştur + st.pyplot gibi PNG'ye kaydet (dpi=200, bbox_inches='tight')
+Tarayıcı yolu: payload + Vega-Lite şablonu oluştur + JSON'a çevir
+
+Kullanım:
+python benchmarks/client_render.py
+python benchmarks/client_render.py --match 3895292 --repeat 10
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.loaders import load_events_df, load_season_matches
+from core.metrics import analyze_passes
+from core.plots import plot_shot_map, plot_pass_network, plot_pass_diagram
+from core.payloads import shot_map_payload, pass_network_payload, pass_diagram_payload, vega_lite_spec
+
+
+def png_path(build):
+    """Figure çiz ve PNG'ye kaydet (st.pyplot ile aynı ayarlar)"""
+    fig = build()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def payload_path(build):
+    """Payload ve şablonu JSON olarak hazırla (st.vega_lite_chart'a giden veri)"""
+    return json.dumps(vega_lite_spec(build()), separators=(',', ':')).encode('utf-8')
+
+
+def measure(fn, build, repeat):
+    """En iyi süre (ms) ve çıktı boyutu (byte)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = fn(build)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, len(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare matplotlib PNG and client-side chart payloads")
+    parser.add_argument("--match", type=int, default=3895292)
+    parser.add_argument("--competition", type=int, default=9)
+    parser.add_argument("--season", type=int, default=281)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    events = load_events_df(args.match)
+    if events is None:
+        print(f"❌ Events not found for match {args.match}")
+        return
+
+    match = next(m for m in load_season_matches(args.competition, args.season) if m['match_id'] == args.match)
+    home_team = match['home_team']['home_team_name']
+
+    # En çok paslaşan ikili (pas diyagramı için)
+    pass_df = analyze_passes(events, home_team, True)
+    passer, receiver = pass_df.groupby(['from', 'to']).size().idxmax()
+
+    charts = [
+        ("shot_map",
+         lambda: plot_shot_map(events, home_team),
+         lambda: shot_map_payload(events, home_team)),
+        ("pass_network",
+         lambda: plot_pass_network(events, home_team, min_passes=2),
+         lambda: pass_network_payload(events, home_team, min_passes=2)),
+        ("pass_diagram",
+         lambda: plot_pass_diagram(events, home_team, passer, receiver, True),
+         lambda: pass_diagram_payload(events, home_team, passer, receiver, True)),
+    ]
+
+    results = []
+    print(f"{'chart':<14}{'png ms':>10}{'png KB':>10}{'json ms':>10}{'json KB':>10}{'speedup':>10}{'size':>8}")
+    for name, build_fig, build_payload in charts:
+        png_ms, png_bytes = measure(png_path, build_fig, args.repeat)
+        json_ms, json_bytes = measure(payload_path, build_payload, args.repeat)
+        results.append({
+            'chart': name,
+            'matplotlib_ms': round(png_ms, 2),
+            'matplotlib_bytes': png_bytes,
+            'payload_ms': round(json_ms, 2),
+            'payload_bytes': json_bytes,
+        })
+        print(f"{name:<14}{png_ms:>10.1f}{png_bytes / 1024:>10.1f}{json_ms:>10.1f}{json_bytes / 1024:>10.1f}"
+              f"{png_ms / json_ms:>9.1f}x{png_bytes / json_bytes:>7.1f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'match_id': args.match, 'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"\n📄 Results: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Page Import Profile
+Her sayfanın soğuk başlangıç süresi, import maliyeti ve bellek kullanımı
+
+Her sayfa ayrı ve temiz bir Python sürecinde (python -X importtime) AppTest ile
+bir kez çalıştırılır. Streamlit'in kendi import'u ayrı ölçülür; sayfanın
+getirdiği modüller importtime çıktısından paket bazında toplanır. Rapor:
+soğuk başlangıç (süreç başı → ilk rerun sonu), ilk rerun, RSS ve en pahalı
+import'lar; ayrıca ağır paketlerin (matplotlib, seaborn, requests...) ilk
+rerun sonunda yüklenip yüklenmediği.
+
+Kullanım:
+python benchmarks/import_profile.py
+python benchmarks/import_profile.py --pages Home "Project Info" --top 5
+python benchmarks/import_profile.py --json imports.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+START = time.perf_counter()
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+HEAVY_PACKAGES = ('pandas', 'numpy', 'matplotlib', 'seaborn', 'scipy', 'requests', 'pyarrow')
+MARKER = "--- page imports ---"
+
+
+def child(path):
+    """Alt süreç: Streamlit'i yükle, işaret bas, sayfayı bir kez çalıştır"""
+    import resource
+
+    from streamlit.testing.v1 import AppTest
+
+    framework_ms = (time.perf_counter() - START) * 1000
+    print(MARKER, file=sys.stderr, flush=True)
+
+    rerun_start = time.perf_counter()
+    at = AppTest.from_file(path, default_timeout=120).run()
+    rerun_ms = (time.perf_counter() - rerun_start) * 1000
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        'framework_ms': round(framework_ms, 1),
+        'first_rerun_ms': round(rerun_ms, 1),
+        'cold_start_ms': round((time.perf_counter() - START) * 1000, 1),
+        'peak_rss_mb': round(peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024, 1),
+        'exceptions': len(at.exception),
+        'loaded': [p for p in HEAVY_PACKAGES if p in sys.modules],
+    }))
+
+
+def parse_importtime(stderr):
+    """İşaretten sonraki importtime satırları → üst düzey paket → kümülatif ms"""
+    packages = {}
+    after_marker = False
+    for line in stderr.splitlines():
+        if line.startswith(MARKER):
+            after_marker = True
+            continue
+        if not after_marker or not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            cumulative_us = int(cumulative.strip())
+        except ValueError:
+            continue  # başlık satırı
+        # Girinti yoksa başka bir import tarafından tetiklenmemiş demektir
+        if name.startswith(" ") and not name.startswith("  "):
+            package = name.strip().split(".")[0]
+            packages[package] = packages.get(package, 0.0) + cumulative_us / 1000
+    return packages
+
+
+def profile_page(path):
+    env = dict(os.environ, PYTHONPATH=REPO_DIR, STATSBOMB_PERF_LOG="")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child", path],
+        capture_output=True, text=True, cwd=REPO_DIR, env=env
+    )
+    lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "child failed")
+    result = json.loads(lines[-1])
+    result['imports_ms'] = parse_importtime(proc.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile cold start, imports and RSS of every page")
+    parser.add_argument("--pages", nargs="+", help="Page names to include (default: all)")
+    parser.add_argument("--top", type=int, default=8, help="Most expensive imports to list per page")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return 0
+
+    # Alt süreçleri kirletmemek için yalnızca ana süreçte
+    from benchmarks.load_test import discover_pages
+
+    pages = discover_pages()
+    if args.pages:
+        pages = {name: path for name, path in pages.items() if name in args.pages}
+
+    results = {}
+    print(f"{'page':<20}{'cold ms':>10}{'rerun ms':>10}{'imports ms':>12}{'RSS MB':>9}  heavy packages loaded")
+    for name, path in pages.items():
+        try:
+            result = profile_page(path)
+        except RuntimeError as e:
+            print(f"❌ {name}: {e}")
+            continue
+        results[name] = result
+        print(f"{name:<20}{result['cold_start_ms']:>10.0f}{result['first_rerun_ms']:>10.0f}"
+              f"{sum(result['imports_ms'].values()):>12.0f}{result['peak_rss_mb']:>9.0f}  "
+              f"{', '.join(result['loaded']) or '-'}")
+        top = sorted(result['imports_ms'].items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+        print("    " + "  ".join(f"{package} {ms:.0f}" for package, ms in top))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
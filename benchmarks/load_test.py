@@ -0,0 +1,281 @@
+"""
+Concurrent Session Load Test
+Home.py ve pages/ altındaki tüm sayfaları eşzamanlı sanal kullanıcılarla çalıştır
+
+Her kullanıcı bir thread'dir ve Streamlit'in AppTest API'si ile kendi oturumunu
+açar; sayfayı açar ve gerçekçi etkileşimler yapar (takım/hafta filtresi, sayfa
+değiştirme, maç seçimi, pas bağlantısı seçimi, çizim modu...). Oturumlar aynı
+süreçte çalıştığı için st.cache_data, matplotlib ve GIL gerçek sunucudaki gibi
+paylaşılır. Her rerun süresi ölçülür; p50/p95/p99, throughput ve tepe bellek raporlanır.
+
+Kullanım:
+python benchmarks/load_test.py
+python benchmarks/load_test.py --users 8 --duration 60
+python benchmarks/load_test.py --users 4 --pages Home "Pass Networks" --json results.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from streamlit.testing.v1 import AppTest
+
+
+def widget(elements, label):
+    """Etikete göre widget bul"""
+    for element in elements:
+        if element.label == label:
+            return element
+    return None
+
+
+def choose(rng, options, exclude=()):
+    candidates = [o for o in options if o not in exclude]
+    return rng.choice(candidates) if candidates else None
+
+
+# --- Senaryolar: her adım çalıştırılacak widget'ı döndürür (widget.run() rerun yapar) ---
+
+def home_steps(at, rng):
+    team = widget(at.sidebar.selectbox, "Select Team (Optional)")
+    if team is not None:
+        yield team.select(choose(rng, team.options, exclude=("All",)))
+        team = widget(at.sidebar.selectbox, "Select Team (Optional)")
+        if team is not None:
+            yield team.select("All")
+
+    week = widget(at.sidebar.selectbox, "Select Week (Optional)")
+    if week is not None:
+        yield week.select(choose(rng, week.options, exclude=("All",)))
+        week = widget(at.sidebar.selectbox, "Select Week (Optional)")
+        if week is not None:
+            yield week.select("All")
+
+    page = widget(at.number_input, "Page")
+    if page is not None and page.proto.has_max and page.proto.max > 1:
+        yield page.set_value(rng.randint(2, int(page.proto.max)))
+
+    match = widget(at.main.selectbox, "Select a match to analyze")
+    if match is not None and len(match.options) > 1:
+        yield match.select(choose(rng, match.options, exclude=("None",)))
+
+
+def overview_steps(at, rng):
+    render = widget(at.sidebar.radio, "🖼️ Chart Rendering")
+    if render is not None:
+        yield render.set_value("Interactive (browser)")
+        render = widget(at.sidebar.radio, "🖼️ Chart Rendering")
+        if render is not None:
+            yield render.set_value("Static (matplotlib)")
+
+
+def pass_network_steps(at, rng):
+    team = widget(at.sidebar.selectbox, "Select Team")
+    if team is not None:
+        yield team.select(choose(rng, team.options, exclude=(team.value,)))
+
+    sort_by = widget(at.sidebar.selectbox, "Sort by")
+    if sort_by is not None:
+        yield sort_by.select(rng.choice(sort_by.options))
+
+    slider = widget(at.sidebar.slider, "Minimum passes to show")
+    if slider is not None:
+        yield slider.set_value(rng.randint(1, 8))
+
+    connection = widget(at.main.selectbox, "Select a connection to visualize (5+ passes only)")
+    if connection is not None and len(connection.options) > 1:
+        yield connection.select(choose(rng, connection.options, exclude=("None",)))
+
+    render = widget(at.sidebar.radio, "🖼️ Chart Rendering")
+    if render is not None:
+        yield render.set_value("Interactive (browser)")
+
+
+def no_steps(at, rng):
+    return iter(())
+
+
+# Sayfa adı (dosya adındaki) → etkileşim senaryosu
+SCENARIOS = {
+    'Home': home_steps,
+    'Match Overview': overview_steps,
+    'Pass Networks': pass_network_steps,
+    'Advanced Metrics': no_steps,
+    'Project Info': no_steps,
+    'Cache Monitor': no_steps,
+}
+
+
+def discover_pages():
+    """Home.py ve pages/*.py → {sayfa adı: dosya yolu}"""
+    pages = {'Home': os.path.join(REPO_DIR, "Home.py")}
+    for path in sorted(glob.glob(os.path.join(REPO_DIR, "pages", "*.py"))):
+        # "2_🔗_Pass_Networks.py" → "Pass Networks"
+        name = os.path.splitext(os.path.basename(path))[0].split("_", 2)[-1].replace("_", " ")
+        pages[name] = path
+    return pages
+
+
+class Recorder:
+    """Thread'ler arası paylaşılan ölçüm kaydı"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.messages = {}
+
+    def fail(self, page, error):
+        with self.lock:
+            self.errors[page] = self.errors.get(page, 0) + 1
+            self.messages.setdefault(type(error).__name__ + ": " + str(error)[:200], page)
+
+    def add(self, page, seconds, failed):
+        with self.lock:
+            self.latencies.setdefault(page, []).append(seconds)
+            if failed:
+                self.errors[page] = self.errors.get(page, 0) + 1
+
+
+def timed_run(target, page, recorder, timeout):
+    """Tek rerun: süreyi ve hata durumunu kaydet"""
+    start = time.perf_counter()
+    try:
+        at = target.run(timeout=timeout)
+        failed = len(at.exception) > 0
+    except Exception:
+        at, failed = None, True
+    recorder.add(page, time.perf_counter() - start, failed)
+    return at
+
+
+def user(user_id, pages, deadline, recorder, seed, timeout):
+    """Sanal kullanıcı: süre dolana kadar sayfaları gezip etkileşim yapar"""
+    rng = random.Random(seed + user_id)
+    names = list(pages)
+    while time.perf_counter() < deadline:
+        page = rng.choice(names)
+        at = timed_run(AppTest.from_file(pages[page], default_timeout=timeout), page, recorder, timeout)
+        if at is None:
+            continue
+        try:
+            for target in SCENARIOS.get(page, no_steps)(at, rng):
+                if time.perf_counter() >= deadline:
+                    break
+                at = timed_run(target, page, recorder, timeout)
+                if at is None:
+                    break
+                # Kullanıcı düşünme süresi
+                time.sleep(rng.uniform(0, 0.2))
+        except Exception as e:
+            # Sayfa beklenen widget'ı üretmediyse (ör. veri yok) senaryo biter
+            recorder.fail(page, e)
+
+
+def percentiles(values):
+    ms = np.array(values) * 1000
+    return {
+        'count': len(values),
+        'p50_ms': round(float(np.percentile(ms, 50)), 1),
+        'p95_ms': round(float(np.percentile(ms, 95)), 1),
+        'p99_ms': round(float(np.percentile(ms, 99)), 1),
+        'max_ms': round(float(ms.max()), 1),
+    }
+
+
+def peak_rss_mb():
+    """Sürecin tepe RSS değeri (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta byte
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test all Streamlit pages with concurrent sessions")
+    parser.add_argument("--users", type=int, default=4, help="Concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=30, help="Test duration in seconds")
+    parser.add_argument("--pages", nargs="+", help="Page names to include (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120, help="Per-rerun timeout in seconds")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    # Sayfalar data/ yolunu göreli kullanır
+    os.chdir(REPO_DIR)
+
+    pages = discover_pages()
+    if args.pages:
+        unknown = set(args.pages) - set(pages)
+        if unknown:
+            print(f"❌ Unknown pages: {', '.join(sorted(unknown))} (available: {', '.join(pages)})")
+            return 1
+        pages = {name: pages[name] for name in args.pages}
+
+    print(f"🚀 {args.users} users × {args.duration:.0f}s on {', '.join(pages)}\n")
+    rss_before = peak_rss_mb()
+
+    recorder = Recorder()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    threads = [
+        threading.Thread(target=user, args=(i, pages, deadline, recorder, args.seed, args.timeout), daemon=True)
+        for i in range(args.users)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    all_latencies = [s for values in recorder.latencies.values() for s in values]
+    if not all_latencies:
+        print("❌ No reruns completed")
+        return 1
+
+    results = {
+        'users': args.users,
+        'duration_s': round(wall, 2),
+        'reruns': len(all_latencies),
+        'throughput_rps': round(len(all_latencies) / wall, 2),
+        'errors': sum(recorder.errors.values()),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rss_before_mb': round(rss_before, 1),
+        'overall': percentiles(all_latencies),
+        'pages': {
+            page: {**percentiles(values), 'errors': recorder.errors.get(page, 0)}
+            for page, values in recorder.latencies.items()
+        },
+    }
+
+    print(f"{'page':<20}{'reruns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for page, stats in results['pages'].items():
+        print(f"{page:<20}{stats['count']:>8}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['errors']:>8}")
+    overall = results['overall']
+    print(f"{'all':<20}{overall['count']:>8}{overall['p50_ms']:>10.1f}{overall['p95_ms']:>10.1f}"
+          f"{overall['p99_ms']:>10.1f}{results['errors']:>8}")
+    for message, page in recorder.messages.items():
+        print(f"⚠️  {page}: {message}")
+    print(f"\n⚡ Throughput: {results['throughput_rps']:.2f} reruns/s")
+    print(f"🧠 Peak RSS: {results['peak_rss_mb']:.0f} MB (before: {results['rss_before_mb']:.0f} MB)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📄 Results: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Event Memory Footprint Benchmark
+Maç başına olay verisinin bellekteki derin boyutu: ham sözlükler ve kompakt kayıtlar
+
+Önce: sayfaların tuttuğu pd.DataFrame(read_json(...)) (object kolonlarda iç içe sözlükler)
+Sonra: EventRecord listesi (__slots__, intern edilmiş adlar) ve compact_frame()
+(category adlar, dar sayı tipleri). Boyutlar core.records.deep_size ile ölçülür.
+
+Kullanım:
+python benchmarks/memory_footprint.py
+python benchmarks/memory_footprint.py --matches 3895292 --json footprint.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.loaders import DATA_DIR, RAW_SUFFIXES, events_path, read_json
+from core.records import compact_frame, decode_events, deep_size
+
+
+def local_match_ids():
+    """data/events altındaki (sıkıştırılmış dahil) maç ID'leri"""
+    ids = set()
+    for suffix in RAW_SUFFIXES:
+        for path in glob.glob(os.path.join(DATA_DIR, "events", f"*.json{suffix}")):
+            ids.add(int(os.path.basename(path).split(".")[0]))
+    return sorted(ids)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure deep memory of raw vs compact event data per match")
+    parser.add_argument("--matches", type=int, nargs="+", help="Match IDs (default: all local events files)")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    match_ids = args.matches or local_match_ids()
+    if not match_ids:
+        print(f"❌ No events files in {DATA_DIR}/events/")
+        return
+
+    results = []
+    print(f"{'match':>10}{'events':>8}{'raw MB':>9}{'records MB':>12}{'compact MB':>12}"
+          f"{'reduction':>11}{'raw ms':>9}{'compact ms':>12}")
+    for match_id in match_ids:
+        path = events_path(match_id)
+        raw, raw_ms = timed(lambda: pd.DataFrame(read_json(path)))
+        raw_bytes = deep_size(raw)
+        del raw
+
+        records, records_ms = timed(lambda: decode_events(path))
+        compact, frame_ms = timed(lambda: compact_frame(records))
+        records_bytes = deep_size(records)
+        compact_bytes = deep_size(compact)
+
+        results.append({
+            'match_id': match_id,
+            'events': len(records),
+            'raw_bytes': raw_bytes,
+            'records_bytes': records_bytes,
+            'compact_bytes': compact_bytes,
+            'raw_ms': round(raw_ms, 1),
+            'compact_ms': round(records_ms + frame_ms, 1),
+        })
+        print(f"{match_id:>10}{len(records):>8}{raw_bytes / 1e6:>9.2f}{records_bytes / 1e6:>12.2f}"
+              f"{compact_bytes / 1e6:>12.2f}{raw_bytes / compact_bytes:>10.1f}x"
+              f"{raw_ms:>9.1f}{records_ms + frame_ms:>12.1f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'results': results}, f, indent=2)
+        print(f"\n📄 Results: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Performance Span Report
+Sayfa span loglarından (core/perf.py) gecikme histogramları üret
+
+Her satır bir span'dır; (sayfa, aşama, span) gruplarına göre sayım,
+p50/p95/p99 ve logaritmik kovalı bir ASCII histogram yazdırılır.
+
+Kullanım:
+python benchmarks/perf_report.py
+python benchmarks/perf_report.py --page "Match Overview" --stage render
+python benchmarks/perf_report.py --log /tmp/spans.jsonl --json report.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.perf import DEFAULT_PERF_LOG, PERF_LOG
+
+# Histogram kova sınırları (ms)
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+BAR_WIDTH = 40
+
+
+def read_spans(path):
+    """JSON satırlarını oku; bozuk satırları atla"""
+    spans = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def group_spans(spans, page=None, stage=None):
+    """(sayfa, aşama, span) → süre listesi (ms)"""
+    groups = {}
+    for s in spans:
+        if page and s['page'] != page:
+            continue
+        if stage and s['stage'] != stage:
+            continue
+        groups.setdefault((s['page'], s['stage'], s['span']), []).append(s['ms'])
+    return groups
+
+
+def histogram(values):
+    """Kova etiketi → sayım"""
+    edges = [0] + BUCKETS_MS + [float('inf')]
+    counts, _ = np.histogram(values, bins=edges)
+    labels = [f"<{edge:g}" for edge in BUCKETS_MS] + [f">={BUCKETS_MS[-1]:g}"]
+    return dict(zip(labels, counts.tolist()))
+
+
+def summarize(values):
+    ms = np.array(values)
+    return {
+        'count': len(values),
+        'p50_ms': round(float(np.percentile(ms, 50)), 2),
+        'p95_ms': round(float(np.percentile(ms, 95)), 2),
+        'p99_ms': round(float(np.percentile(ms, 99)), 2),
+        'max_ms': round(float(ms.max()), 2),
+        'histogram': histogram(ms),
+    }
+
+
+def print_histogram(buckets):
+    peak = max(buckets.values()) or 1
+    for label, count in buckets.items():
+        if count:
+            print(f"      {label:>8} ms |{'█' * max(1, round(count / peak * BAR_WIDTH)):<{BAR_WIDTH}} {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate performance span logs into latency histograms")
+    parser.add_argument("--log", default=PERF_LOG or DEFAULT_PERF_LOG,
+                        help="Span log file (default: STATSBOMB_PERF_LOG, else data/cache/perf/spans.jsonl)")
+    parser.add_argument("--page", help="Only this page")
+    parser.add_argument("--stage", help="Only this stage (page/load/compute/render/transfer)")
+    parser.add_argument("--histograms", action="store_true", help="Print a histogram for every span")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args()
+
+    if not args.log or not os.path.exists(args.log):
+        print(f"❌ Span log not found: {args.log}")
+        return 1
+
+    spans = read_spans(args.log)
+    groups = group_spans(spans, args.page, args.stage)
+    if not groups:
+        print("❌ No matching spans")
+        return 1
+
+    traces = len({s['trace_id'] for s in spans})
+    print(f"📄 {args.log}: {len(spans)} spans from {traces} reruns\n")
+
+    report = {}
+    print(f"{'page':<18}{'stage':<10}{'span':<26}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for (page, stage, name), values in sorted(groups.items()):
+        stats = summarize(values)
+        report.setdefault(page, {}).setdefault(stage, {})[name] = stats
+        print(f"{page:<18}{stage:<10}{name:<26}{stats['count']:>7}{stats['p50_ms']:>10.1f}"
+              f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}")
+        # Kök span (tüm rerun) histogramı her zaman gösterilir
+        if args.histograms or stage == 'page':
+            print_histogram(stats['histogram'])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📄 Report: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+StatsBomb Analytics Benchmark Suite
+Yükleme, metrik ve çizim katmanlarının süre ölçümü ve baseline karşılaştırması
+
+Gerçek maç (3895292) ve çoğaltılmış olay setleri (10x, 100x) üzerinde
+her adım ölçülür. Sonuçlar JSON olarak kaydedilir ve kayıtlı baseline ile
+karşılaştırılır; eşikten yavaş adımlar regresyon olarak işaretlenir.
+
+Kullanım:
+python benchmarks/suite.py
+python benchmarks/suite.py --scales 1 10 --repeat 5
+python benchmarks/suite.py --save-baseline
+python benchmarks/suite.py --strict --threshold 0.2
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.event_store import freeze_events
+from core.event_stream import stream_flat_events
+from core.events import events_frame
+from core.loaders import BASE_URL, events_path, load_season_matches, open_raw, read_json, url_to_local_path
+from core.metrics import (
+    analyze_passes, calculate_team_stats,
+    calculate_attacking_metrics, calculate_passing_metrics, calculate_defensive_metrics,
+)
+from core.plots import plot_shot_map, plot_pass_network
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def scaled_events_file(match_id, scale, directory):
+    """Olay dosyasını scale kez art arda ekleyerek büyük bir JSON dosyası yaz"""
+    with open_raw(events_path(match_id)) as f:
+        body = f.read().decode('utf-8').strip()[1:-1].strip()
+
+    path = os.path.join(directory, f"{match_id}_x{scale}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for i in range(scale):
+            if i:
+                f.write(',')
+            f.write(body)
+        f.write(']')
+    return path
+
+
+def scaled_events_df(events_df, scale):
+    """Olay tablosunu scale kez çoğalt (olay nesneleri paylaşılır, index yeniden numaralanır)"""
+    if scale == 1:
+        return events_df
+    scaled = pd.concat([events_df] * scale, ignore_index=True)
+    scaled['index'] = np.arange(1, len(scaled) + 1)
+    return scaled
+
+
+def render_png(fig):
+    """Figure'ı st.pyplot ile aynı ayarlarla PNG'ye çevir"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def measure(fn, repeat):
+    """fn'i repeat kez çalıştır, süreleri (ms) döndür"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def result_row(name, scale, n_events, timings):
+    print(f"  {name:<30}{scale:>5}x{min(timings):>12.1f} ms")
+    return {
+        'name': name,
+        'scale': scale,
+        'events': n_events,
+        'repeat': len(timings),
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+    }
+
+
+def benchmark_scale(match_id, home_team, away_team, scale, repeat, tmp_dir):
+    """Tek ölçek için tüm adımlar"""
+    rows = []
+
+    # Yükleme: dosya yolu çözümü + JSON parse + kod kolonlu DataFrame (sayfalardaki gibi)
+    if scale == 1:
+        path = url_to_local_path(f"{BASE_URL}events/{match_id}.json")
+    else:
+        path = scaled_events_file(match_id, scale, tmp_dir)
+
+    parsed = {}
+
+    def load():
+        parsed['events'] = events_frame(read_json(path))
+
+    timings = measure(load, repeat)
+    n_events = len(parsed['events'])
+    rows.append(result_row('load_from_local', scale, n_events, timings))
+    rows.append(result_row('json_parse', scale, n_events, measure(lambda: read_json(path), repeat)))
+    # Akış halinde okuma: tüm olaylar ve yalnızca şutlar (diğer olaylar çözülmeden atlanır)
+    rows.append(result_row('stream_flat', scale, n_events, measure(lambda: stream_flat_events(path), repeat)))
+    rows.append(result_row('stream_shots', scale, n_events,
+                           measure(lambda: stream_flat_events(path, types=['Shot']), repeat)))
+
+    # Büyük ham listeyi bırak; hesaplamalar paylaşılan nesnelerle çoğaltılmış tabloda
+    del parsed['events']
+    if scale != 1:
+        os.remove(path)
+
+    # Sayfalardaki gibi kod kolonlu, paylaşılan salt okunur tablo: hesaplamalar kopya almadan
+    # ve with_codes() yedeğine düşmeden çalışır
+    events = freeze_events(scaled_events_df(events_frame(read_json(events_path(match_id))), scale))
+
+    steps = [
+        ('calculate_team_stats', lambda: calculate_team_stats(events, home_team)),
+        ('calculate_attacking_metrics', lambda: calculate_attacking_metrics(events, home_team)),
+        ('calculate_passing_metrics', lambda: calculate_passing_metrics(events, home_team)),
+        ('calculate_defensive_metrics', lambda: calculate_defensive_metrics(events, home_team)),
+        ('analyze_passes', lambda: analyze_passes(events, home_team, True)),
+        ('plot_pass_network', lambda: render_png(plot_pass_network(events, home_team, min_passes=2))),
+        ('plot_shot_map', lambda: render_png(plot_shot_map(events, away_team))),
+    ]
+
+    for name, fn in steps:
+        rows.append(result_row(name, scale, n_events, measure(fn, repeat)))
+
+    return rows
+
+
+def environment():
+    """Sonuçları yorumlamak için ortam bilgisi"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'commit': commit,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Baseline ile karşılaştır; regresyon listesini döndür"""
+    previous = {(r['name'], r['scale']): r for r in baseline['results']}
+    regressions = []
+
+    print(f"\n{'step':<30}{'scale':>6}{'baseline ms':>14}{'now ms':>12}{'change':>10}")
+    for row in results:
+        base = previous.get((row['name'], row['scale']))
+        if base is None:
+            continue
+        change = row['min_ms'] / base['min_ms'] - 1 if base['min_ms'] > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            flag = " ⚠️"
+            regressions.append({**row, 'baseline_ms': base['min_ms'], 'change': round(change, 4)})
+        print(f"{row['name']:<30}{row['scale']:>5}x{base['min_ms']:>14.1f}{row['min_ms']:>12.1f}{change:>+10.1%}{flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loaders, metrics and rendering")
+    parser.add_argument("--match", type=int, default=3895292)
+    parser.add_argument("--competition", type=int, default=9)
+    parser.add_argument("--season", type=int, default=281)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown before flagging (0.15 = 15%%)")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    if not os.path.exists(events_path(args.match)):
+        print(f"❌ Events not found for match {args.match}")
+        return 1
+
+    match = next(
+        (m for m in load_season_matches(args.competition, args.season) if m['match_id'] == args.match),
+        None
+    )
+    if match is None:
+        print(f"❌ Match {args.match} not found in matches/{args.competition}/{args.season}.json")
+        return 1
+    home_team = match['home_team']['home_team_name']
+    away_team = match['away_team']['away_team_name']
+
+    print(f"🚀 Benchmarking match {args.match} ({home_team} vs {away_team}), scales {args.scales}\n")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in args.scales:
+            results.extend(benchmark_scale(args.match, home_team, away_team, scale, args.repeat, tmp_dir))
+
+    report = {
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'match_id': args.match,
+        'environment': environment(),
+        'results': results,
+    }
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results: {out}")
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} steps slower than baseline by more than {args.threshold:.0%}")
+        else:
+            print("\n✅ No regressions against baseline")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📌 Baseline saved: {args.baseline}")
+
+    return 1 if regressions and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+StatsBomb Match Catalog Builder
+competitions.json içindeki tüm turnuva/sezonlar için maç kataloglarını oluştur
+
+Kullanım:
+python build_catalogs.py
+python build_catalogs.py --download --workers 8
+"""
+
+import argparse
+import os
+import time
+
+from core.loaders import BASE_URL, DATA_DIR, matches_path, read_json, raw_exists
+from core.catalog import CATALOG_DIR, build_all_catalogs
+from download_data import download_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build match catalogs for every competition/season")
+    parser.add_argument("--download", action="store_true", help="Download missing matches files first")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    competitions = read_json(os.path.join(DATA_DIR, "competitions.json"))
+    seasons = [(c['competition_id'], c['season_id']) for c in competitions]
+    print(f"🚀 {len(seasons)} competition/seasons in competitions.json\n")
+
+    if args.download:
+        missing = [s for s in seasons if not raw_exists(matches_path(*s))]
+        print(f"📥 Downloading {len(missing)} missing matches files...")
+        for competition_id, season_id in missing:
+            download_file(
+                f"{BASE_URL}matches/{competition_id}/{season_id}.json",
+                matches_path(competition_id, season_id)
+            )
+        print()
+
+    start = time.perf_counter()
+    results = build_all_catalogs(seasons, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    built = [r for r in results if r[2] is not None]
+    total_matches = sum(r[2] for r in built)
+
+    print(f"✅ Built {len(built)}/{len(seasons)} catalogs ({total_matches} matches) in {elapsed:.2f}s")
+    print(f"📁 {CATALOG_DIR}/")
+    skipped = len(seasons) - len(built)
+    if skipped:
+        print(f"⚠️  {skipped} seasons have no matches file (use --download)")
+
+
+if __name__ == "__main__":
+    main()
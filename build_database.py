@@ -0,0 +1,44 @@
+"""
+StatsBomb SQL Database Builder
+Lokal maç, olay ve kadro dosyalarından SQLite veritabanını oluştur/güncelle
+
+Yalnızca dosyası değişen sezon ve maçlar yeniden yüklenir (core/sql.py).
+
+Kullanım:
+python build_database.py
+python build_database.py --rebuild
+python build_database.py --query "SELECT player, COUNT(*) FROM shots GROUP BY player"
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from core.sql import DB_PATH, build_database, query
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the SQLite database over local StatsBomb data")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the database and load everything again")
+    parser.add_argument("--matches", type=int, nargs="+", help="Only these match IDs (default: all local)")
+    parser.add_argument("--query", help="Run a query after building and print the result")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = build_database(args.matches, rebuild=args.rebuild)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {DB_PATH} updated in {elapsed:.2f}s")
+    print(f"   {counts['seasons']} seasons ({counts['matches']} matches), {counts['events']} events, "
+          f"{counts['lineups']} lineup players loaded; {counts['skipped']} matches unchanged")
+
+    if args.query:
+        start = time.perf_counter()
+        result = query(args.query)
+        elapsed = (time.perf_counter() - start) * 1000
+        with pd.option_context('display.max_rows', 50, 'display.width', 200):
+            print(f"\n{result}\n\n⏱️  {len(result)} rows in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+StatsBomb Minutes Builder
+Sezon başına oyuncu dakikaları ve 90 dakika başına oranları hesapla/kaydet
+
+Sahada kalma aralıkları olaylardan (Starting XI, Substitution, kırmızı kart),
+events dosyası yoksa kadro positions girdilerinden kurulur (core/intervals.py).
+Tablo data/cache/minutes/ altına yazılır; kaynak dosyalar değişmediyse diskten okunur.
+
+Kullanım:
+python build_minutes.py
+python build_minutes.py --competition 9 --season 281 --min-minutes 450 --top 20
+python build_minutes.py --match 3895292 --at 63
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from core.catalog import local_seasons
+from core.intervals import load_season_minutes, match_intervals
+
+
+def show_match(match_id, minute):
+    intervals = match_intervals(match_id)
+    if intervals is None:
+        print(f"❌ No events or lineups for match {match_id}")
+        return
+    print(f"⚽ Match {match_id}: {len(intervals)} intervals from {intervals.source}, "
+          f"{intervals.clock.duration / 60:.1f} minutes played")
+    with pd.option_context('display.max_rows', 60, 'display.width', 200):
+        print(intervals.frame().drop(columns=['player_id', 'team_id']).to_string(index=False))
+    if minute is not None:
+        start = time.perf_counter()
+        on = intervals.on_pitch(minute)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n👀 On the pitch at {minute}': {len(on)} players ({elapsed:.3f} ms)")
+        for player_id in on:
+            print(f"   {intervals.players.get(player_id)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute minutes played and per-90 rates per season")
+    parser.add_argument("--competition", type=int, help="Competition ID (default: all local seasons)")
+    parser.add_argument("--season", type=int, help="Season ID (with --competition)")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute even if the saved table is fresh")
+    parser.add_argument("--min-minutes", type=float, default=0, help="Only list players with at least this many minutes")
+    parser.add_argument("--top", type=int, default=10, help="Players to list per season, by xG per 90")
+    parser.add_argument("--match", type=int, help="Print the on-pitch intervals of one match instead")
+    parser.add_argument("--at", type=int, help="With --match: list the players on the pitch at this minute")
+    args = parser.parse_args()
+
+    if args.match:
+        show_match(args.match, args.at)
+        return
+
+    if args.competition and args.season:
+        seasons = [(args.competition, args.season)]
+    else:
+        seasons = local_seasons()
+
+    for competition_id, season_id in seasons:
+        start = time.perf_counter()
+        rates = load_season_minutes(competition_id, season_id, rebuild=args.rebuild)
+        elapsed = time.perf_counter() - start
+        print(f"✅ {competition_id}/{season_id}: {len(rates)} players in {elapsed:.2f}s")
+        listed = rates[rates['minutes'] >= args.min_minutes].sort_values('xg_90', ascending=False)
+        columns = ['player', 'team', 'matches', 'starts', 'minutes', 'passes_90', 'shots_90', 'goals_90', 'xg_90']
+        with pd.option_context('display.width', 200):
+            print(listed[columns].head(args.top).to_string(index=False), "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+StatsBomb Player Index Builder
+Lokal kadro dosyalarından oyuncu/takım → maç indeksini oluştur/güncelle
+
+Yalnızca yeni veya dosyası değişen kadrolar işlenir (core/player_index.py).
+
+Kullanım:
+python build_player_index.py
+python build_player_index.py --search "wirtz"
+python build_player_index.py --search "xhaka" --started
+"""
+
+import argparse
+import time
+
+from core.player_index import INDEX_PATH, get_player_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the player/team index over local lineups")
+    parser.add_argument("--search", help="Search players by name prefix and list their matches")
+    parser.add_argument("--started", action="store_true", help="With --search: only matches the player started")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_player_index(update=False)
+    changed = index.update()
+    elapsed = time.perf_counter() - start
+    print(f"✅ {INDEX_PATH} updated in {elapsed:.2f}s ({changed} lineups processed)")
+    print(f"   {len(index.by_player)} players, {len(index.by_team)} teams, {len(index.by_match)} matches")
+
+    if args.search:
+        start = time.perf_counter()
+        results = index.search(args.search)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n🔎 '{args.search}': {len(results)} players in {elapsed:.2f} ms")
+        for player_id, name, count in results:
+            matches = index.matches(player_id, started=True if args.started else None)
+            print(f"   {player_id:>7}  {name} ({count} matches): {', '.join(map(str, matches))}")
+
+
+if __name__ == "__main__":
+    main()
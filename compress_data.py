@@ -0,0 +1,100 @@
+"""
+StatsBomb Raw Data Compressor
+data/ altındaki ham JSON dosyalarını gzip/zstd olarak sakla
+
+Uygulama ve tüm betikler sıkıştırılmış dosyaları aynı yollarla, akış halinde
+açarak okur (core/loaders.py); bu betik yalnızca diskteki hali değiştirir.
+
+Kullanım:
+python compress_data.py --report --sample 20
+python compress_data.py --format zstd --train-dict
+python compress_data.py --format gzip --kinds lineups matches
+python compress_data.py --decompress
+"""
+
+import argparse
+import glob
+import os
+import random
+import time
+
+from core.compression import FORMATS, benchmark, compress_file, latest_dictionary, train_dictionary
+from core.loaders import DATA_DIR, RAW_SUFFIXES
+
+KINDS = ("events", "lineups", "matches")
+
+
+def logical_paths(kind):
+    """Klasördeki mantıksal .json yolları (hangi halde saklandığından bağımsız)"""
+    pattern = os.path.join(DATA_DIR, kind, "**", "*.json")
+    paths = set()
+    for suffix in RAW_SUFFIXES:
+        for path in glob.glob(pattern + suffix, recursive=True):
+            paths.add(path[:len(path) - len(suffix)] if suffix else path)
+    return sorted(paths)
+
+
+def print_report(kind, paths, level, dictionary):
+    results = benchmark(paths, kind, level, dictionary)
+    print(f"\n📊 {kind}: {len(paths)} files, {results['json']['raw_mb']:.1f} MB plain JSON")
+    print(f"   {'format':<10} {'disk MB':>9} {'ratio':>7} {'write MB/s':>11} {'cold read MB/s':>15}")
+    for name, r in results.items():
+        print(f"   {name:<10} {r['disk_mb']:>9.2f} {r['ratio']:>6.2f}x {r['write_mb_s']:>11.1f} {r['read_mb_s']:>15.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress raw StatsBomb JSON files in data/")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="zstd",
+                        help="Storage format ('json' keeps files uncompressed)")
+    parser.add_argument("--decompress", action="store_true", help="Same as --format json")
+    parser.add_argument("--level", type=int, default=None, help="Compression level")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--train-dict", action="store_true", help="Train a zstd dictionary per folder first")
+    parser.add_argument("--report", action="store_true",
+                        help="Only measure ratio and cold-read throughput (files are not changed)")
+    parser.add_argument("--sample", type=int, default=20, help="Files per folder for training/report")
+    args = parser.parse_args()
+
+    fmt = "json" if args.decompress else args.format
+    random.seed(0)
+
+    for kind in args.kinds:
+        paths = logical_paths(kind)
+        if not paths:
+            print(f"⚠️  No {kind} files in {DATA_DIR}/{kind}/")
+            continue
+        sample = random.sample(paths, min(args.sample, len(paths)))
+
+        dictionary = None
+        if args.train_dict or (args.report and fmt == "zstd"):
+            if args.train_dict or latest_dictionary(kind) is None:
+                print(f"🧠 Training {kind} dictionary on {len(sample)} files...")
+                dictionary = train_dictionary(kind, sample)
+                print(f"   dict_id={dictionary.dict_id()} ({len(dictionary.as_bytes()) / 1024:.0f} KB)")
+            else:
+                dictionary = latest_dictionary(kind)
+        elif fmt == "zstd":
+            dictionary = latest_dictionary(kind)
+
+        if args.report:
+            print_report(kind, sample, args.level, dictionary)
+            continue
+
+        print(f"📦 {kind}: {len(paths)} files → {fmt}"
+              + (f" (dict_id={dictionary.dict_id()})" if dictionary is not None else ""))
+        start = time.perf_counter()
+        raw_total = disk_total = converted = 0
+        for path in paths:
+            raw_bytes, disk_bytes = compress_file(path, fmt, args.level, dictionary)
+            disk_total += disk_bytes
+            if raw_bytes is not None:
+                raw_total += raw_bytes
+                converted += 1
+        elapsed = time.perf_counter() - start
+        ratio = f", {raw_total / max(disk_total, 1):.2f}x" if converted == len(paths) else ""
+        print(f"✅ {converted} converted, {len(paths) - converted} already {fmt} "
+              f"in {elapsed:.1f}s ({disk_total / 1024 / 1024:.1f} MB on disk{ratio})")
+
+
+if __name__ == "__main__":
+    main()
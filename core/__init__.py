@@ -0,0 +1,4 @@
+"""
+StatsBomb Analytics - Ortak modüller
+Sayfalar ve komut satırı araçları tarafından paylaşılan kod (Streamlit'e bağımlı değil)
+"""
@@ -0,0 +1,311 @@
+"""
+StatsBomb Cache Registry
+Streamlit önbellek katmanlarının gözlemlenmesi ve hedefli temizlenmesi
+
+st.cache_data / st.cache_resource içeriklerini dışarıdan göremiyoruz; bu modül
+önbelleğe alınan fonksiyonu iki katmanla sarar: içteki sarmalayıcı yalnızca
+gerçek hesaplamada (miss) çalışır ve girdinin boyutunu/yaşını kaydeder, dıştaki
+her çağrıyı sayar. Böylece katman başına giriş sayısı, derin bellek boyutu,
+hit/miss oranı, yaş ve tahliye sayıları tutulur. Girdiler maç ID'si ile
+etiketlenir; evict_match() bir maçın tüm katmanlardaki girdilerini
+Streamlit'in clear(*args) çağrısıyla tek tek siler; evict_season() aynısını
+competition_id/season_id parametreli girdiler için yapar (core/watch.py).
+İkisi de paylaşılan olay deposundaki (core/event_store.py) tabloları da
+bırakır: en büyük nesne önbellek katmanı dışında bellekte kalmaz.
+
+Kayıt süreç genelidir (sayfalar her rerun'da yeniden çalışsa da core
+modülleri bir kez import edilir). Streamlit burada import edilmez.
+
+Kullanım:
+@observed(st.cache_data(ttl=3600), "Match Overview", "loader", ttl=3600, match_arg="match_id")
+def load_events(match_id): ...
+"""
+
+import functools
+import inspect
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.catalog import load_catalog
+from core.event_store import forget_match, shared_match_ids
+
+LAYER_KINDS = ('loader', 'index', 'metric', 'figure')
+
+# object sütunlarında ve uzun listelerde derin boyut bu kadar örnekle tahmin edilir
+SIZE_SAMPLE = 500
+
+_registry = {}
+_registry_lock = threading.Lock()
+_local = threading.local()
+
+
+def _object_size(obj, seen):
+    """Python nesnesinin derin boyutu (byte); paylaşılan nesneler bir kez sayılır"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, (pd.DataFrame, pd.Series, np.ndarray)):
+        return deep_size(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _object_size(key, seen) + _object_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _object_size(item, seen)
+    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += _object_size(vars(obj), seen)
+    return size
+
+
+def _column_size(column):
+    """Sütunun derin boyutu; object sütunlarındaki iç içe dict/list'ler örneklenir"""
+    if column.dtype != object or len(column) == 0:
+        return int(column.memory_usage(deep=True, index=False))
+
+    values = column.to_numpy()
+    step = max(1, len(values) // SIZE_SAMPLE)
+    sample = values[::step]
+    seen = set()
+    sampled = sum(_object_size(v, seen) for v in sample)
+    return int(values.nbytes + sampled * len(values) / len(sample))
+
+
+def deep_size(obj):
+    """Önbellek girdisinin tahmini derin bellek boyutu (byte)"""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.index.memory_usage(deep=True)) + sum(_column_size(obj[c]) for c in obj.columns)
+    if isinstance(obj, pd.Series):
+        return int(obj.index.memory_usage(deep=True)) + _column_size(obj)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, list) and len(obj) > SIZE_SAMPLE:
+        # Ham JSON listesi (olaylar): elemanlar örneklenir
+        step = len(obj) // SIZE_SAMPLE
+        sample = obj[::step]
+        seen = set()
+        sampled = sum(_object_size(v, seen) for v in sample)
+        return sys.getsizeof(obj) + int(sampled * len(obj) / len(sample))
+    return _object_size(obj, set())
+
+
+class CacheEntry:
+    """Bir önbellek girdisinin gölge kaydı (değerin kendisi tutulmaz)"""
+
+    __slots__ = ('args', 'kwargs', 'params', 'match_id', 'created', 'last_access', 'hits', 'size')
+
+    def __init__(self, args, kwargs, params, match_id, size):
+        self.args = args
+        self.kwargs = kwargs
+        self.params = params
+        self.match_id = match_id
+        self.created = self.last_access = time.time()
+        self.hits = 0
+        self.size = size
+
+
+class CacheLayer:
+    """Önbelleğe alınmış tek bir fonksiyonun istatistikleri"""
+
+    def __init__(self, page, function, kind, ttl=None):
+        self.page = page
+        self.function = function
+        self.kind = kind
+        self.ttl = ttl
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = {'ttl': 0, 'manual': 0, 'external': 0}
+        self.cached = None
+        self.lock = threading.Lock()
+
+    @property
+    def name(self):
+        return f"{self.page} · {self.function}"
+
+    def record_miss(self, key, args, kwargs, params, match_id, value):
+        size = deep_size(value)
+        with self.lock:
+            self.misses += 1
+            previous = self.entries.get(key)
+            if previous is not None:
+                # Aynı anahtar yeniden hesaplandı: süresi dolmuş ya da dışarıdan
+                # (st.cache_data.clear()) silinmiş
+                expired = self.ttl is not None and time.time() - previous.created > self.ttl
+                self.evictions['ttl' if expired else 'external'] += 1
+            self.entries[key] = CacheEntry(args, kwargs, params, match_id, size)
+
+    def record_hit(self, key):
+        with self.lock:
+            self.hits += 1
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry.hits += 1
+                entry.last_access = time.time()
+
+    def expire(self):
+        """Süresi dolmuş gölge girdileri düşür (Streamlit onları zaten atmıştır)"""
+        if self.ttl is None:
+            return
+        now = time.time()
+        with self.lock:
+            expired = [k for k, e in self.entries.items() if now - e.created > self.ttl]
+            for key in expired:
+                del self.entries[key]
+            self.evictions['ttl'] += len(expired)
+
+    def evict(self, keys):
+        """Verilen girdileri Streamlit önbelleğinden sil"""
+        with self.lock:
+            entries = [(k, self.entries.pop(k)) for k in keys if k in self.entries]
+            self.evictions['manual'] += len(entries)
+        for _, entry in entries:
+            if self.cached is not None:
+                self.cached.clear(*entry.args, **entry.kwargs)
+        return len(entries)
+
+    def evict_match(self, match_id):
+        with self.lock:
+            keys = [k for k, e in self.entries.items() if e.match_id == match_id]
+        return self.evict(keys)
+
+    def evict_season(self, competition_id, season_id):
+        with self.lock:
+            keys = [k for k, e in self.entries.items()
+                    if e.params.get('competition_id') == competition_id and e.params.get('season_id') == season_id]
+        return self.evict(keys)
+
+    def clear(self):
+        """Katmanın tamamını temizle"""
+        with self.lock:
+            self.evictions['manual'] += len(self.entries)
+            self.entries.clear()
+        if self.cached is not None:
+            self.cached.clear()
+
+    def stats(self):
+        self.expire()
+        with self.lock:
+            calls = self.hits + self.misses
+            now = time.time()
+            return {
+                'Page': self.page,
+                'Function': self.function,
+                'Kind': self.kind,
+                'Entries': len(self.entries),
+                'Size (MB)': round(sum(e.size for e in self.entries.values()) / 1024 / 1024, 2),
+                'Hits': self.hits,
+                'Misses': self.misses,
+                'Hit Ratio (%)': round(self.hits / calls * 100, 1) if calls else 0.0,
+                'Oldest (s)': round(max((now - e.created for e in self.entries.values()), default=0.0)),
+                'TTL Evictions': self.evictions['ttl'],
+                'Manual Evictions': self.evictions['manual'],
+                'External Evictions': self.evictions['external'],
+            }
+
+    def entry_rows(self):
+        now = time.time()
+        with self.lock:
+            return [
+                {
+                    'Key': key,
+                    'Match ID': entry.match_id,
+                    'Size (KB)': round(entry.size / 1024, 1),
+                    'Hits': entry.hits,
+                    'Age (s)': round(now - entry.created),
+                    'Idle (s)': round(now - entry.last_access),
+                }
+                for key, entry in self.entries.items()
+            ]
+
+
+def layers():
+    """Kayıtlı tüm katmanlar (kayıt sırasıyla)"""
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def get_layer(page, function, kind, ttl=None):
+    with _registry_lock:
+        layer = _registry.get((page, function))
+        if layer is None:
+            layer = _registry[(page, function)] = CacheLayer(page, function, kind, ttl)
+        return layer
+
+
+def cached_match_ids():
+    """Herhangi bir katmanda girdisi olan maç ID'leri"""
+    ids = set()
+    for layer in layers():
+        with layer.lock:
+            ids.update(e.match_id for e in layer.entries.values() if e.match_id is not None)
+    return sorted(ids)
+
+
+def evict_match(match_id):
+    """Bir maçın tüm katmanlardaki ve paylaşılan depodaki girdilerini sil; silinen girdi sayısı"""
+    return sum(layer.evict_match(match_id) for layer in layers()) + forget_match(match_id)
+
+
+def evict_season(competition_id, season_id):
+    """competition_id/season_id parametreli tüm girdileri ve sezon maçlarının paylaşılan
+    tablolarını sil; silinen girdi sayısı"""
+    removed = sum(layer.evict_season(competition_id, season_id) for layer in layers())
+    shared = shared_match_ids()
+    if shared:
+        catalog = load_catalog(competition_id, season_id)
+        season_ids = set() if catalog is None else set(catalog['match_id'].tolist())
+        removed += sum(forget_match(match_id) for match_id in shared if match_id in season_ids)
+    return removed
+
+
+def observed(cache, page, kind, ttl=None, match_arg=None):
+    """st.cache_data(...) / st.cache_resource ile sarılan fonksiyonu kayda al"""
+    def decorator(fn):
+        layer = get_layer(page, fn.__name__, kind, ttl)
+        signature = inspect.signature(fn)
+
+        def bind(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            key = ", ".join(f"{name}={value!r}" for name, value in params.items())
+            match_id = params.get(match_arg) if match_arg else None
+            return key, params, match_id
+
+        @functools.wraps(fn)
+        def compute(*args, **kwargs):
+            value = fn(*args, **kwargs)
+            key, params, match_id = bind(args, kwargs)
+            layer.record_miss(key, args, kwargs, params, match_id, value)
+            # İç içe önbellekli çağrılar bayrağı kendi değerine geri koyar
+            _local.computed = True
+            return value
+
+        cached = cache(compute)
+        layer.cached = cached
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            outer = getattr(_local, 'computed', False)
+            _local.computed = False
+            try:
+                value = cached(*args, **kwargs)
+                if not _local.computed:
+                    layer.record_hit(bind(args, kwargs)[0])
+            finally:
+                _local.computed = outer
+            return value
+
+        wrapper.clear = cached.clear
+        wrapper.evict = lambda *args, **kwargs: layer.evict([bind(args, kwargs)[0]])
+        wrapper.layer = layer
+        return wrapper
+
+    return decorator
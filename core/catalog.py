@@ -0,0 +1,165 @@
+"""
+StatsBomb Match Catalog
+Maç listelerini tipli kolonlara tek geçişte açan ve diske (parquet) kaydeden katalog
+
+Her turnuva/sezon için data/matches/<competition_id>/<season_id>.json dosyasından
+data/catalogs/<competition_id>_<season_id>.parquet üretilir. Katalog zaten
+hafta ve tarihe göre sıralı kaydedilir, okurken tekrar işlem gerekmez.
+"""
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from core.loaders import DATA_DIR, RAW_SUFFIXES, matches_path, read_json, raw_exists, raw_mtime
+
+CATALOG_DIR = os.path.join(DATA_DIR, "catalogs")
+
+# Kategorik (tekrar eden metin) kolonlar
+CATEGORY_COLUMNS = [
+    'competition_name', 'season_name', 'competition_stage', 'home_team_name',
+    'away_team_name', 'stadium_name', 'referee_name', 'match_status',
+]
+
+_INT_COLUMNS = {
+    'match_id': 'int64', 'competition_id': 'int32', 'season_id': 'int32',
+    'home_team_id': 'int32', 'away_team_id': 'int32',
+    'home_score': 'int16', 'away_score': 'int16', 'match_week': 'int16',
+}
+
+
+def _field(records, key, sub=None):
+    """Tek alanın kolon listesi (iç içe sözlükte sub anahtarı); yoksa None"""
+    if sub is None:
+        return [m.get(key) for m in records]
+    return [v.get(sub) if isinstance(v := m.get(key), dict) else None for m in records]
+
+
+def _text(values, default):
+    """Boş/eksik metinleri varsayılanla doldur (ham veride `or` ile yapılanın kolon hali)"""
+    return values.where(values.notna() & (values != ''), default)
+
+
+_COLUMNS = [
+    'match_id', 'competition_id', 'season_id', 'competition_name', 'season_name',
+    'match_date', 'formatted_date', 'formatted_time', 'match_week', 'competition_stage',
+    'home_team_id', 'home_team_name', 'away_team_id', 'away_team_name',
+    'home_score', 'away_score', 'stadium_name', 'referee_name', 'match_status',
+]
+
+
+def build_match_catalog(records):
+    """Ham maç listesini tipli, sıralı bir DataFrame'e çevir
+
+    Kayıtlardan her alan bir kez liste olarak toplanır; varsayılanlar, tarih
+    biçimi ve tipler kolonlar üzerinde toplu uygulanır.
+    """
+    catalog = pd.DataFrame({
+        'match_id': _field(records, 'match_id'),
+        'competition_id': _field(records, 'competition', 'competition_id'),
+        'season_id': _field(records, 'season', 'season_id'),
+        'competition_name': _field(records, 'competition', 'competition_name'),
+        'season_name': _field(records, 'season', 'season_name'),
+        'match_date': _field(records, 'match_date'),
+        'kick_off': _field(records, 'kick_off'),
+        'match_week': _field(records, 'match_week'),
+        'competition_stage': _field(records, 'competition_stage', 'name'),
+        'home_team_id': _field(records, 'home_team', 'home_team_id'),
+        'home_team_name': _field(records, 'home_team', 'home_team_name'),
+        'away_team_id': _field(records, 'away_team', 'away_team_id'),
+        'away_team_name': _field(records, 'away_team', 'away_team_name'),
+        'home_score': _field(records, 'home_score'),
+        'away_score': _field(records, 'away_score'),
+        'stadium_name': _field(records, 'stadium', 'name'),
+        'referee_name': _field(records, 'referee', 'name'),
+        'match_status': _field(records, 'match_status'),
+    }, dtype=object)
+
+    for column in ('competition_name', 'season_name', 'competition_stage', 'stadium_name',
+                   'referee_name', 'match_status'):
+        catalog[column] = _text(catalog[column], 'Unknown')
+    for column in ('competition_id', 'season_id', 'match_week', 'home_score', 'away_score'):
+        catalog[column] = catalog[column].fillna(0)
+
+    dates = _text(catalog['match_date'], '').astype(str)
+    catalog['match_date'] = dates
+    # "2024-04-14" → "14.04.2024" (strftime'dan çok daha hızlı)
+    catalog['formatted_date'] = dates.str[8:10] + '.' + dates.str[5:7] + '.' + dates.str[:4]
+    catalog['formatted_time'] = _text(catalog['kick_off'], '—').astype(str)
+    catalog = catalog[_COLUMNS]
+
+    catalog = catalog.astype(_INT_COLUMNS)
+    catalog[CATEGORY_COLUMNS] = catalog[CATEGORY_COLUMNS].astype('category')
+
+    # Eksik/bozuk tarih → NaT (katalog yine kurulur; tarih filtresi bu maçları dışarıda bırakır)
+    catalog['match_date'] = pd.to_datetime(catalog['match_date'], format='%Y-%m-%d', errors='coerce')
+    catalog.loc[catalog['match_date'].isna(), 'formatted_date'] = '—'
+
+    # Sıralama: Önce match_week, sonra tarih (küçükten büyüğe) - sadece build sırasında
+    catalog = catalog.sort_values(['match_week', 'match_date'], ascending=[True, True], kind='stable')
+    return catalog.reset_index(drop=True)
+
+
+def catalog_path(competition_id, season_id):
+    """Katalog dosya yolu"""
+    return os.path.join(CATALOG_DIR, f"{competition_id}_{season_id}.parquet")
+
+
+def build_catalog(competition_id, season_id):
+    """Tek sezonun kataloğunu oluştur ve kaydet (maç sayısı, dosya yoksa None)"""
+    source = matches_path(competition_id, season_id)
+    if not raw_exists(source):
+        return None
+
+    catalog = build_match_catalog(read_json(source))
+    os.makedirs(CATALOG_DIR, exist_ok=True)
+    catalog.to_parquet(catalog_path(competition_id, season_id), index=False)
+    return len(catalog)
+
+
+def load_catalog(competition_id, season_id):
+    """Kataloğu oku; yoksa veya maç dosyası daha yeniyse yeniden oluştur"""
+    source = matches_path(competition_id, season_id)
+    path = catalog_path(competition_id, season_id)
+
+    if os.path.exists(path) and (not raw_exists(source) or os.path.getmtime(path) >= raw_mtime(source)):
+        return pd.read_parquet(path)
+
+    if build_catalog(competition_id, season_id) is None:
+        return None
+    return pd.read_parquet(path)
+
+
+def _build_one(key):
+    competition_id, season_id = key
+    return competition_id, season_id, build_catalog(competition_id, season_id)
+
+
+def build_all_catalogs(seasons, workers=None):
+    """Verilen (competition_id, season_id) listesinin kataloglarını paralel oluştur"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_one, seasons))
+
+
+def available_seasons(competitions):
+    """Katalog veya maç dosyası lokal olarak bulunan (competition_id, season_id) ikilileri"""
+    return {
+        (c['competition_id'], c['season_id'])
+        for c in competitions
+        if os.path.exists(catalog_path(c['competition_id'], c['season_id']))
+        or raw_exists(matches_path(c['competition_id'], c['season_id']))
+    }
+
+
+def local_seasons():
+    """data/matches altındaki (sıkıştırılmış dahil) sezon dosyaları: [(competition_id, season_id)]"""
+    seasons = set()
+    for suffix in RAW_SUFFIXES:
+        for path in glob.glob(os.path.join(DATA_DIR, "matches", "*", f"*.json{suffix}")):
+            competition = os.path.basename(os.path.dirname(path))
+            season = os.path.basename(path).split(".")[0]
+            if competition.isdigit() and season.isdigit():
+                seasons.add((int(competition), int(season)))
+    return sorted(seasons)
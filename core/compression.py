@@ -0,0 +1,195 @@
+"""
+StatsBomb Raw Compression
+Ham JSON dosyalarını gzip/zstd olarak sıkıştırma, zstd sözlüğü eğitme ve ölçüm
+
+Okuma tarafı core/loaders.py'dedir (open_raw, read_json): sıkıştırılmış
+dosyalar aynı mantıksal .json yoluyla okunur. Bu modül yazma tarafıdır:
+compress_file() dosyayı parça parça (bellekte tamamı tutulmadan) sıkıştırır,
+açıp doğrular ve ardından diğer halleri siler. StatsBomb olayları binlerce
+kez tekrar eden anahtarlardan oluştuğu için zstd sözlüğü küçük dosyalarda
+(kadrolar, maç listeleri) belirgin kazanç sağlar.
+"""
+
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+from core.lazy import lazy_module
+from core.loaders import (
+    DICT_DIR, RAW_SUFFIXES, dictionary_path, open_compressed, open_raw, raw_kind, resolve_raw,
+)
+
+zstandard = lazy_module("zstandard")
+
+FORMATS = {'json': "", 'gzip': ".gz", 'zstd': ".zst"}
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 12}
+
+# Sözlük eğitimi: dosyalardan alınan örnek parçalar
+DICT_SIZE = 112 * 1024
+SAMPLE_BYTES = 16 * 1024
+MAX_SAMPLES = 2000
+
+CHUNK_BYTES = 1024 * 1024
+
+
+def _copy(reader, writer):
+    """Akıştan akışa kopyala; kopyalanan byte sayısı"""
+    total = 0
+    while True:
+        chunk = reader.read(CHUNK_BYTES)
+        if not chunk:
+            return total
+        writer.write(chunk)
+        total += len(chunk)
+
+
+def _digest(f):
+    digest = hashlib.blake2b()
+    while True:
+        chunk = f.read(CHUNK_BYTES)
+        if not chunk:
+            return digest.digest()
+        digest.update(chunk)
+
+
+def write_compressed(reader, target, fmt, level=None, dictionary=None):
+    """Akışı target dosyasına fmt biçiminde yaz; yazılan ham byte sayısı"""
+    level = level or DEFAULT_LEVELS.get(fmt)
+    with open(target, 'wb') as raw_out:
+        if fmt == 'gzip':
+            with gzip.GzipFile(fileobj=raw_out, mode='wb', compresslevel=level, mtime=0) as out:
+                return _copy(reader, out)
+        if fmt == 'zstd':
+            compressor = zstandard.ZstdCompressor(level=level, dict_data=dictionary, write_checksum=True)
+            with compressor.stream_writer(raw_out, closefd=False) as out:
+                return _copy(reader, out)
+        return _copy(reader, raw_out)
+
+
+def latest_dictionary(kind):
+    """Klasör için en son eğitilmiş sözlük (yoksa None)"""
+    if not os.path.isdir(DICT_DIR):
+        return None
+    candidates = [e for e in os.scandir(DICT_DIR) if e.name.startswith(f"{kind}-") and e.name.endswith(".dict")]
+    if not candidates:
+        return None
+    latest = max(candidates, key=lambda e: e.stat().st_mtime)
+    with open(latest.path, 'rb') as f:
+        return zstandard.ZstdCompressionDict(f.read())
+
+
+def compress_file(path, fmt, level=None, dictionary=None):
+    """Mantıksal .json dosyasını fmt biçimine çevir; (ham byte, disk byte)
+
+    Yeni hal açılıp içeriği eskisiyle karşılaştırılır; eşleşirse diğer haller
+    silinir. Dosya zaten bu biçimdeyse dokunulmaz.
+    """
+    source = resolve_raw(path)
+    if source is None:
+        raise FileNotFoundError(path)
+    target = path + FORMATS[fmt]
+    if source == target:
+        return None, os.path.getsize(target)
+
+    # Uzantı sonda kalmalı: doğrulama okuyucusu biçimi uzantıdan seçer
+    partial = f"{path}.{os.getpid()}.partial{FORMATS[fmt]}"
+    with open_raw(path) as reader:
+        raw_bytes = write_compressed(reader, partial, fmt, level, dictionary)
+
+    with open_raw(path) as original, open_compressed(partial, raw_kind(path)) as written:
+        if _digest(original) != _digest(written):
+            os.remove(partial)
+            raise ValueError(f"verification failed for {path}")
+
+    os.replace(partial, target)
+    for suffix in RAW_SUFFIXES:
+        if path + suffix != target and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return raw_bytes, os.path.getsize(target)
+
+
+def train_dictionary(kind, paths, dict_size=DICT_SIZE):
+    """Dosyalardan örnek parçalarla zstd sözlüğü eğit ve data/dicts/ altına kaydet"""
+    samples = []
+    per_file = max(1, MAX_SAMPLES // max(len(paths), 1))
+    for path in paths:
+        with open_raw(path) as f:
+            data = f.read()
+        step = max(SAMPLE_BYTES, len(data) // per_file)
+        samples.extend(data[i:i + SAMPLE_BYTES] for i in range(0, len(data), step))
+    dictionary = zstandard.train_dictionary(dict_size, samples[:MAX_SAMPLES])
+
+    os.makedirs(DICT_DIR, exist_ok=True)
+    with open(dictionary_path(kind, dictionary.dict_id()), 'wb') as f:
+        f.write(dictionary.as_bytes())
+    return dictionary
+
+
+def drop_page_cache(path):
+    """Dosyanın sayfa önbelleğini boşalt (soğuk okuma ölçümü için; destek yoksa sessiz)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except (AttributeError, OSError):
+        pass
+
+
+def cold_read(actual, kind=None):
+    """Diskteki dosyayı soğuk okuyup aç; (ham byte, saniye)"""
+    drop_page_cache(actual)
+    start = time.perf_counter()
+    with open_compressed(actual, kind) as f:
+        total = 0
+        while True:
+            chunk = f.read(CHUNK_BYTES)
+            if not chunk:
+                break
+            total += len(chunk)
+    return total, time.perf_counter() - start
+
+
+def benchmark(paths, kind, level=None, dictionary=None):
+    """Örnek dosyaları her biçimde geçici klasöre yaz; biçim → boyut ve soğuk okuma hızı"""
+    variants = {'json': None, 'gzip': None, 'zstd': None}
+    if dictionary is not None:
+        variants['zstd+dict'] = dictionary
+
+    workdir = tempfile.mkdtemp(prefix="statsbomb_compress_")
+    results = {}
+    try:
+        for name, dict_data in variants.items():
+            fmt = name.split("+")[0]
+            raw_total = disk_total = 0
+            write_seconds = read_seconds = 0.0
+            for i, path in enumerate(paths):
+                target = os.path.join(workdir, f"{i}.json{FORMATS[fmt]}")
+                start = time.perf_counter()
+                with open_raw(path) as reader:
+                    raw_total += write_compressed(reader, target, fmt, level, dict_data)
+                write_seconds += time.perf_counter() - start
+                disk_total += os.path.getsize(target)
+
+                if dict_data is not None:
+                    # Okuyucu sözlüğü ID ile data/dicts/ altında bulur
+                    _, seconds = cold_read(target, kind)
+                else:
+                    _, seconds = cold_read(target)
+                read_seconds += seconds
+                os.remove(target)
+            results[name] = {
+                'raw_mb': raw_total / 1024 / 1024,
+                'disk_mb': disk_total / 1024 / 1024,
+                'ratio': raw_total / disk_total if disk_total else 0.0,
+                'write_mb_s': raw_total / 1024 / 1024 / write_seconds if write_seconds else 0.0,
+                'read_mb_s': raw_total / 1024 / 1024 / read_seconds if read_seconds else 0.0,
+            }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
@@ -0,0 +1,166 @@
+"""
+StatsBomb Density Maps
+Sezon ölçeğinde şut/pas/pres yoğunluk haritaları
+
+Her maç için olay konumları sabit bir ızgarada sayılır (binned arrays) ve diske kaydedilir.
+Sezon haritası bu ızgaraların toplamıdır, yani çizim maliyeti olay sayısından bağımsızdır.
+Az nokta varsa ham noktalar (scatter), çok nokta varsa yoğunluk (grid/hexbin) çizilir.
+"""
+
+import os
+
+import numpy as np
+
+from core.lazy import lazy_module
+from core.event_stream import stream_flat_events
+from core.loaders import DATA_DIR, events_path, raw_exists, raw_mtime
+from core.plots import draw_pitch
+
+plt = lazy_module("matplotlib.pyplot")
+patches = lazy_module("matplotlib.patches")
+
+PITCH_LENGTH = 120
+PITCH_WIDTH = 80
+
+# 2m x 2m hücreler
+GRID_SHAPE = (60, 40)
+
+# Bu sayının üstünde scatter yerine yoğunluk çizilir
+MAX_SCATTER_POINTS = 2000
+
+# Katman adı → (olay tipi, ağırlık)
+LAYERS = {
+    'shots': ('Shot', None),
+    'shots_xg': ('Shot', 'xg'),
+    'passes': ('Pass', None),
+    'pressures': ('Pressure', None),
+}
+
+GRID_CACHE_DIR = os.path.join(DATA_DIR, "cache", "grids")
+
+
+def event_points(flat, team_name, event_type):
+    """Takımın belirli tipteki olaylarının konumları: (x, y, xg) (düz olay tablosundan)"""
+    rows = flat[(flat['team'] == team_name) & (flat['type'] == event_type)].dropna(subset=['x', 'y'])
+    if len(rows) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+
+    x = rows['x'].to_numpy(dtype=float)
+    y = rows['y'].to_numpy(dtype=float)
+    if event_type == 'Shot':
+        xg = rows['xg'].fillna(0).to_numpy(dtype=float)
+    else:
+        xg = np.zeros(len(x))
+    return x, y, xg
+
+
+def bin_points(x, y, weights=None):
+    """Konumları sabit ızgarada say"""
+    grid, _, _ = np.histogram2d(
+        x, y, bins=GRID_SHAPE,
+        range=[[0, PITCH_LENGTH], [0, PITCH_WIDTH]],
+        weights=weights
+    )
+    return grid.astype(np.float32)
+
+
+def match_grids(flat, team_name):
+    """Bir maç için tüm katmanların ızgaraları ve ham noktaları"""
+    result = {}
+    for layer, (event_type, weight) in LAYERS.items():
+        x, y, xg = event_points(flat, team_name, event_type)
+        weights = xg if weight == 'xg' else None
+        result[f"{layer}_grid"] = bin_points(x, y, weights)
+        result[f"{layer}_points"] = np.column_stack([x, y, xg]).astype(np.float32)
+    return result
+
+
+def _grid_cache_path(match_id, team_name):
+    team_slug = "".join(c if c.isalnum() else "_" for c in team_name)
+    return os.path.join(GRID_CACHE_DIR, f"{match_id}_{team_slug}.npz")
+
+
+def load_match_grids(match_id, team_name):
+    """Maç ızgaralarını diskten oku, yoksa/eskiyse hesapla ve kaydet"""
+    source = events_path(match_id)
+    if not raw_exists(source):
+        return None
+
+    cache_path = _grid_cache_path(match_id, team_name)
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= raw_mtime(source):
+        with np.load(cache_path) as cached:
+            return dict(cached)
+
+    # Yalnızca katmanlardaki tipler ve bu takım: diğer olaylar çözülmeden atlanır
+    layer_types = {event_type for event_type, _ in LAYERS.values()}
+    grids = match_grids(stream_flat_events(source, types=layer_types, teams=[team_name]), team_name)
+    os.makedirs(GRID_CACHE_DIR, exist_ok=True)
+    np.savez_compressed(cache_path, **grids)
+    return grids
+
+
+def season_layer(match_ids, team_name, layer):
+    """Sezon katmanı: ızgaraların toplamı, nokta sayısı ve (azsa) ham noktalar"""
+    total = np.zeros(GRID_SHAPE, dtype=np.float32)
+    points = []
+    n_points = 0
+
+    for match_id in match_ids:
+        grids = load_match_grids(match_id, team_name)
+        if grids is None:
+            continue
+        total += grids[f"{layer}_grid"]
+        match_points = grids[f"{layer}_points"]
+        n_points += len(match_points)
+        # Eşik aşıldıktan sonra ham noktaları tutmaya gerek yok
+        if n_points <= MAX_SCATTER_POINTS:
+            points.append(match_points)
+
+    points = np.concatenate(points) if points and n_points <= MAX_SCATTER_POINTS else None
+    return total, n_points, points
+
+
+def coarsen(grid, factor):
+    """Izgarayı factor x factor bloklar halinde topla (detay seviyesi)"""
+    nx, ny = grid.shape
+    return grid[:nx - nx % factor, :ny - ny % factor].reshape(
+        nx // factor, factor, ny // factor, factor
+    ).sum(axis=(1, 3))
+
+
+def plot_density_map(grid, title, n_points, points=None, weighted=False, style='grid', factor=2, cmap='YlOrRd'):
+    """Yoğunluk haritası: az noktada scatter, çok noktada grid veya hexbin
+
+    weighted: scatter'da nokta boyutu xG'ye göre
+    """
+    fig, ax = plt.subplots(figsize=(12, 8))
+    draw_pitch(ax)
+
+    if points is not None and n_points <= MAX_SCATTER_POINTS:
+        sizes = points[:, 2] * 1000 if weighted else 30
+        ax.scatter(points[:, 0], points[:, 1], s=sizes, c='red', alpha=0.6,
+                   edgecolors='white', linewidths=1, zorder=3)
+    else:
+        coarse = coarsen(grid, factor)
+        if style == 'hex':
+            # Hücre merkezlerini ağırlık olarak ver: maliyet nokta sayısından bağımsız
+            cell_x = np.linspace(0, PITCH_LENGTH, coarse.shape[0], endpoint=False) + PITCH_LENGTH / coarse.shape[0] / 2
+            cell_y = np.linspace(0, PITCH_WIDTH, coarse.shape[1], endpoint=False) + PITCH_WIDTH / coarse.shape[1] / 2
+            cx, cy = np.meshgrid(cell_x, cell_y, indexing='ij')
+            mask = coarse.ravel() > 0
+            hexes = ax.hexbin(cx.ravel()[mask], cy.ravel()[mask], C=coarse.ravel()[mask],
+                              reduce_C_function=np.sum, gridsize=(coarse.shape[0] // 2, coarse.shape[1] // 3),
+                              extent=(0, PITCH_LENGTH, 0, PITCH_WIDTH), cmap=cmap, alpha=0.85, zorder=1.5)
+            # Saha dışına taşan altıgenleri kes
+            hexes.set_clip_path(patches.Rectangle((0, 0), PITCH_LENGTH, PITCH_WIDTH, transform=ax.transData))
+        else:
+            masked = np.ma.masked_where(coarse.T == 0, coarse.T)
+            ax.imshow(masked, origin='lower', extent=(0, PITCH_LENGTH, 0, PITCH_WIDTH),
+                      cmap=cmap, alpha=0.85, interpolation='nearest', zorder=1.5)
+
+    # imshow/hexbin eksen sınırlarını değiştirir
+    ax.set_xlim(-2, PITCH_LENGTH + 2)
+    ax.set_ylim(-2, PITCH_WIDTH + 2)
+    ax.set_title(f'{title} ({n_points} events)', fontsize=16, color='white', pad=20)
+    fig.patch.set_facecolor('#0e1117')
+    return fig
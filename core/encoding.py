@@ -0,0 +1,211 @@
+"""
+StatsBomb Dictionary Encoding
+Takım, oyuncu, pozisyon, olay tipi ve sonuçlar için tam sayı kodları
+
+Kodlar StatsBomb ID'leridir (core/events.py düz tabloda type_id, team_id,
+player_id, ... kolonları; yoksa -1). Böylece aynı oyuncu her maçta ve her
+çalıştırmada aynı kodu alır, aynı adlı iki oyuncu ayrı kalır; sezon boyu
+toplamlar oyuncu ID'sine göre gruplanabilir.
+
+Her alanın bir sözlüğü (Vocabulary) yalnızca ID → ad çözümü için tutulur ve
+data/cache/encoding/<alan>.json dosyasında saklanır. save() dosya kilidi
+altında diskteki sözlüğü yeniden okuyup birleştirir; aynı anda yazan iki süreç
+birbirinin adlarını silmez. Oyuncu sözlüğü pası atan ve alan
+(player/recipient), takım sözlüğü team ve possession_team kolonları için
+ortaktır.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from core.events import MISSING, OUTCOME_IDS, TYPE_IDS
+from core.loaders import DATA_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: kilit yalnızca süreç içi
+    fcntl = None
+
+ENCODING_DIR = os.path.join(DATA_DIR, "cache", "encoding")
+
+# Sözlük adı → bu sözlükle çözülen (ID kolonu, ad kolonu) çiftleri
+FIELDS = {
+    'team': (('team_id', 'team'), ('possession_team_id', 'possession_team')),
+    'player': (('player_id', 'player'), ('recipient_id', 'recipient')),
+    'position': (('position_id', 'position'),),
+    'type': (('type_id', 'type'),),
+    'outcome': (('outcome_id', 'outcome'),),
+}
+NUMERIC_COLUMNS = ('index', 'period', 'minute', 'second', 'x', 'y', 'end_x', 'end_y', 'xg', 'under_pressure')
+
+
+@contextmanager
+def _file_lock(path):
+    """path için süreçler arası yazma kilidi (<path>.lock)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.lock", 'a') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class Vocabulary:
+    """Tek alan için StatsBomb ID → ad sözlüğü"""
+
+    def __init__(self, name, path=None):
+        self.name = name
+        self.path = path
+        self.names = {}
+        self._changed = False
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.names = self._read()
+
+    def _read(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):  # eski, sıra numarasıyla kodlanmış liste
+            return {}
+        return {int(k): v for k, v in data.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def learn(self, ids, names):
+        """Aynı satırlardaki ID ve ad dizilerinden yeni ID'leri ekle (her farklı ID bir kez)"""
+        ids = np.asarray(ids)
+        unique, first = np.unique(ids, return_index=True)
+        new = [(int(code), names[i]) for code, i in zip(unique, first)
+               if code != MISSING and int(code) not in self.names]
+        if new:
+            with self._lock:
+                self.names.update(new)
+                self._changed = True
+
+    def decode(self, code):
+        return self.names.get(int(code))
+
+    def decode_many(self, codes):
+        """ID dizisi → ad dizisi (MISSING/bilinmeyen → None)"""
+        codes = np.asarray(codes)
+        unique, inverse = np.unique(codes, return_inverse=True)
+        table = np.array([self.names.get(int(c)) for c in unique], dtype=object)
+        return table[inverse.reshape(-1)]
+
+    def save(self):
+        """Yeni adları diskteki sözlükle birleştirip yaz (değişiklik yoksa dokunmaz)"""
+        if self.path is None or not self._changed:
+            return False
+        with _file_lock(self.path):
+            merged = self._read() if os.path.exists(self.path) else {}
+            with self._lock:
+                merged.update(self.names)
+                self.names = merged
+                self._changed = False
+            partial = f"{self.path}.{os.getpid()}.{threading.get_ident()}.partial"
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump({str(k): v for k, v in sorted(merged.items())}, f, ensure_ascii=False)
+            os.replace(partial, self.path)
+        return True
+
+
+class Encoding:
+    """Tüm alanların sözlükleri (aynı klasörden yüklenir/kaydedilir)"""
+
+    def __init__(self, directory=ENCODING_DIR):
+        self.directory = directory
+        self.vocabularies = {
+            field: Vocabulary(field, os.path.join(directory, f"{field}.json") if directory else None)
+            for field in FIELDS
+        }
+
+    def __getitem__(self, field):
+        return self.vocabularies[field]
+
+    def learn(self, flat):
+        """Düz olay tablosundaki (ID, ad) çiftlerini sözlüklere ekle"""
+        for field, pairs in FIELDS.items():
+            for id_column, name_column in pairs:
+                self.vocabularies[field].learn(flat[id_column].to_numpy(), flat[name_column].to_numpy(dtype=object))
+
+    def save(self):
+        return [field for field, vocabulary in self.vocabularies.items() if vocabulary.save()]
+
+
+def encode_flat(flat, encoding=None):
+    """Düz olay tablosu → {kolon: numpy dizisi}; ad yerine ID kolonları, adlar sözlüğe eklenir"""
+    encoding = encoding or get_encoding()
+    encoding.learn(flat)
+    encoded = {}
+    for pairs in FIELDS.values():
+        for id_column, _ in pairs:
+            encoded[id_column] = flat[id_column].to_numpy()
+    for column in NUMERIC_COLUMNS:
+        encoded[column] = flat[column].to_numpy()
+    return encoded
+
+
+def season_player_totals(flat_frames, encoding=None):
+    """Sezon boyu oyuncu başına olay toplamları (StatsBomb player_id'ye göre gruplanır)
+
+    flat_frames: maçların düz olay tabloları (ör. core.match_cache.load_flat_events
+    ile); yeni adlar sonunda diske yazılır.
+    """
+    encoding = encoding or get_encoding()
+    parts = []
+    for flat in flat_frames:
+        if flat is None:
+            continue
+        e = encode_flat(flat, encoding)
+        parts.append((e['player_id'], e['team_id'], e['type_id'], e['outcome_id'],
+                      np.nan_to_num(e['xg'].astype(float))))
+    encoding.save()
+    if not parts:
+        return pd.DataFrame(columns=['player_id', 'player', 'team', 'passes', 'completed_passes',
+                                     'shots', 'goals', 'xg'])
+
+    player, team, event_type, outcome, xg = (np.concatenate(column) for column in zip(*parts))
+    has_player = player != MISSING
+    player, team, event_type, outcome, xg = (a[has_player] for a in (player, team, event_type, outcome, xg))
+    player_ids, slot = np.unique(player, return_inverse=True)
+    n = len(player_ids)
+
+    passes = event_type == TYPE_IDS['Pass']
+    shots = event_type == TYPE_IDS['Shot']
+    totals = pd.DataFrame({
+        'passes': np.bincount(slot, weights=passes, minlength=n),
+        'completed_passes': np.bincount(slot, weights=passes & (outcome == MISSING), minlength=n),
+        'shots': np.bincount(slot, weights=shots, minlength=n),
+        'goals': np.bincount(slot, weights=shots & (outcome == OUTCOME_IDS['Goal']), minlength=n),
+        'xg': np.bincount(slot, weights=xg, minlength=n),
+    }).astype({c: 'int64' for c in ('passes', 'completed_passes', 'shots', 'goals')})
+    # Oyuncunun son görüldüğü takım
+    last_team = np.full(n, MISSING, dtype=team.dtype)
+    last_team[slot] = team
+
+    totals.insert(0, 'player_id', player_ids)
+    totals.insert(1, 'player', encoding['player'].decode_many(player_ids))
+    totals.insert(2, 'team', encoding['team'].decode_many(last_team))
+    return totals.sort_values('xg', ascending=False).reset_index(drop=True)
+
+
+_encoding = None
+_encoding_lock = threading.Lock()
+
+
+def get_encoding():
+    """Süreç genelinde tek sözlük seti (data/cache/encoding/ altından)"""
+    global _encoding
+    with _encoding_lock:
+        if _encoding is None:
+            _encoding = Encoding()
+        return _encoding
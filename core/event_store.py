@@ -0,0 +1,173 @@
+"""
+StatsBomb Shared Event Store
+Oturumlar arasında referansla paylaşılan salt okunur olay tabloları
+
+st.cache_data her çağrıda DataFrame'i pickle'dan açıp yeni bir kopya verir;
+olay tablosu iç içe dict'lerle dolu olduğu için bu her rerun'da derin bir
+kopya demektir. Sayfalar bunun yerine bu depodaki tek bir nesneyi paylaşır;
+freeze_events() bu nesneyi ReadOnlyFrame'e çevirir ve sayısal
+bloklarını yazılamaz yapar. Tabloyu değiştiren her işlem (kolon ekleme,
+loc/iloc ataması, inplace metodlar) TypeError verir. Filtre, kopya ve
+Series'ler normal DataFrame olarak döner; pandas Copy-on-Write sayesinde
+onlara yazmak paylaşılan tabloyu etkilemez.
+
+shared_events() / shared_lineups() lokal dosyalardan okunan tabloları süreç
+genelinde dosya sürümüyle birlikte tutar: sayfalar ve arka plan ön yüklemesi
+(core/prefetch.py) aynı nesneyi paylaşır, maç başına tek kopya. Sayfalar
+tabloyu ayrıca st.cache_resource ile tutmaz; bellekte en fazla
+SHARED_MAX_MATCHES maç kalır (en son kullanılanlar). Olay tablosu
+core.events.events_frame ile kurulur: kod kolonları (type_id, team_id, ...)
+yüklemede bir kez eklenir.
+
+Not: object kolonlarındaki dict/list'ler (ve kadro listeleri) Python
+nesneleridir ve dondurulmaz; yerinde değiştirilmemelidir.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from core.events import events_frame
+from core.loaders import events_path, lineups_path, read_json, file_version
+
+READ_ONLY_MESSAGE = "shared events are read-only; use .copy() or a separate Series"
+
+# Süreç genelinde tutulan en fazla maç (en son kullanılanlar)
+SHARED_MAX_MATCHES = 16
+
+_shared = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+class _ReadOnlyIndexer:
+    """loc/iloc/at/iat için yalnızca okuma yapan sarmalayıcı"""
+
+    __slots__ = ('_indexer',)
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __setitem__(self, key, value):
+        raise TypeError(READ_ONLY_MESSAGE)
+
+    def __call__(self, *args, **kwargs):
+        return _ReadOnlyIndexer(self._indexer(*args, **kwargs))
+
+
+class ReadOnlyFrame(pd.DataFrame):
+    """Değiştirilemeyen DataFrame; türetilen tablolar normal DataFrame'dir"""
+
+    _metadata = []
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(READ_ONLY_MESSAGE)
+
+    __setitem__ = __delitem__ = insert = pop = _update_inplace = _read_only
+
+    def __setattr__(self, name, value):
+        if name in ('columns', 'index'):
+            raise TypeError(READ_ONLY_MESSAGE)
+        super().__setattr__(name, value)
+
+    @property
+    def loc(self):
+        return _ReadOnlyIndexer(super().loc)
+
+    @property
+    def iloc(self):
+        return _ReadOnlyIndexer(super().iloc)
+
+    @property
+    def at(self):
+        return _ReadOnlyIndexer(super().at)
+
+    @property
+    def iat(self):
+        return _ReadOnlyIndexer(super().iat)
+
+
+def freeze_events(events_df):
+    """Olay tablosunu paylaşıma hazır, salt okunur hale getir (veri kopyalanmaz)"""
+    if events_df is None or isinstance(events_df, ReadOnlyFrame):
+        return events_df
+
+    frozen = ReadOnlyFrame(events_df)
+    for block in frozen._mgr.blocks:
+        if isinstance(block.values, np.ndarray):
+            block.values.flags.writeable = False
+    return frozen
+
+
+def _shared_get(kind, match_id, path, load):
+    """(tür, maç) için dosya sürümü değişmemişse paylaşılan değer; yoksa yükle"""
+    version = file_version(path)
+    if version is None:
+        return None
+
+    key = (kind, match_id)
+    with _shared_lock:
+        cached = _shared.get(key)
+        if cached is not None and cached[0] == version:
+            _shared.move_to_end(key)
+            return cached[1]
+
+    value = load(path)
+    with _shared_lock:
+        _shared[key] = (version, value)
+        _shared.move_to_end(key)
+        while len(_shared) > SHARED_MAX_MATCHES * 2:
+            _shared.popitem(last=False)
+    return value
+
+
+def shared_events(match_id):
+    """Lokal events dosyasının paylaşılan salt okunur tablosu (dosya yoksa None)"""
+    return _shared_get('events', match_id, events_path(match_id),
+                       lambda path: freeze_events(events_frame(read_json(path))))
+
+
+def shared_lineups(match_id):
+    """Lokal lineups dosyasının paylaşılan ham listesi (dosya yoksa None)"""
+    return _shared_get('lineups', match_id, lineups_path(match_id), read_json)
+
+
+def is_shared(match_id):
+    """Maçın olayları güncel sürümüyle bellekte mi"""
+    with _shared_lock:
+        cached = _shared.get(('events', match_id))
+    return cached is not None and cached[0] == file_version(events_path(match_id))
+
+
+def shared_entries():
+    """Paylaşılan depodaki (tür, maç ID, değer) kayıtları, en eski kullanılan önce"""
+    with _shared_lock:
+        return [(kind, match_id, value) for (kind, match_id), (_, value) in _shared.items()]
+
+
+def clear_shared():
+    """Paylaşılan depoyu boşalt; silinen tablo sayısı"""
+    with _shared_lock:
+        removed = len(_shared)
+        _shared.clear()
+    return removed
+
+
+def shared_match_ids():
+    """Paylaşılan depoda tablosu olan maç ID'leri"""
+    with _shared_lock:
+        return sorted({match_id for _, match_id in _shared})
+
+
+def forget_match(match_id):
+    """Maçı paylaşılan depodan çıkar; silinen tablo sayısı"""
+    with _shared_lock:
+        return sum(_shared.pop((kind, match_id), None) is not None for kind in ('events', 'lineups'))
@@ -0,0 +1,147 @@
+"""
+StatsBomb Event Stream
+Events dosyasını bütün halinde açmadan olay olay okuma ve düz tablo kurma
+
+json.load tüm olay listesini (binlerce iç içe sözlük) bellekte kurar; çoğu
+kullanım ise yalnızca birkaç olay tipine (Pass, Shot) bakar. iter_events()
+dizideki olayları parça parça okunan metinden tek tek çözer: bellekte aynı
+anda yalnızca okuma tamponu ve o anki olay bulunur. Tip/takım filtresi varsa
+olay çözülmeden önce metnindeki "type" ve "team" adlarına bakılır; eşleşmeyen
+olay hiç sözlüğe çevrilmeden atlanır. stream_flat_events() kalan olayları
+doğrudan core.events.EVENT_COLUMNS kolonlarına ekler.
+
+Hızlı atlama StatsBomb'un olay başı düzenine dayanır ({"id": "<uuid>",
+"index": ...}). Bu düzen bulunamazsa (ör. farklı anahtar sırası) her olay
+çözülür ve aynı filtreler sözlük üzerinde uygulanır; sonuç değişmez.
+"""
+
+import io
+import json
+import re
+
+from core.events import columns_frame, empty_columns, event_row, name_of
+from core.loaders import events_path, open_raw
+
+CHUNK_CHARS = 256 * 1024
+
+_WHITESPACE = re.compile(r"[\s,]*")
+# Üst düzey olay başı: uuid "id" ve hemen ardından "index" (iç sözlüklerin id'si sayıdır)
+_EVENT_START = re.compile(r'\{\s*"id"\s*:\s*"[^"]*"\s*,\s*"index"\s*:')
+_NAMED = r'"{}"\s*:\s*\{{\s*"id"\s*:\s*\d+\s*,\s*"name"\s*:\s*"((?:[^"\\]|\\.)*)"'
+_TYPE_NAME = re.compile(_NAMED.format("type"))
+_TEAM_NAME = re.compile(_NAMED.format("team"))
+
+_decoder = json.JSONDecoder()
+
+
+def _matches(event, types, teams, where, predicate):
+    """Çözülmüş olay filtrelerden geçiyor mu"""
+    if types is not None and name_of(event.get('type')) not in types:
+        return False
+    if teams is not None and name_of(event.get('team')) not in teams:
+        return False
+    for key, allowed in (where or {}).items():
+        if not isinstance(allowed, (set, frozenset, list, tuple)):
+            allowed = (allowed,)
+        if name_of(event.get(key)) not in allowed:
+            return False
+    return predicate is None or predicate(event)
+
+
+def _unescape(text):
+    return json.loads(f'"{text}"') if "\\" in text else text
+
+
+def _peek_rejects(buffer, start, end, types, teams):
+    """Olay metnine bakarak (çözmeden) filtreden kalıp kalmadığı; emin değilse False"""
+    if types is not None:
+        m = _TYPE_NAME.search(buffer, start, end)
+        if m is None:
+            return False
+        if _unescape(m.group(1)) not in types:
+            return True
+    if teams is not None:
+        m = _TEAM_NAME.search(buffer, start, end)
+        if m is None:
+            return False
+        if _unescape(m.group(1)) not in teams:
+            return True
+    return False
+
+
+def iter_events(path, types=None, teams=None, where=None, predicate=None, chunk_chars=CHUNK_CHARS):
+    """Events dosyasındaki olayları filtreleyerek tek tek üret
+
+    types/teams: kabul edilen tip/takım adları. where: {anahtar: değer ya da
+    değerler}; sözlük değerler adlarıyla karşılaştırılır
+    (ör. {'play_pattern': 'From Corner'}). predicate: ham olay → bool.
+    """
+    types = None if types is None else set(types)
+    teams = None if teams is None else set(teams)
+    peek = types is not None or teams is not None
+
+    with open_raw(path) as raw:
+        reader = io.TextIOWrapper(raw, encoding='utf-8')
+        buffer, pos, eof = "", 0, False
+
+        def fill():
+            nonlocal buffer, pos, eof
+            chunk = reader.read(chunk_chars)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        fill()
+        pos = _WHITESPACE.match(buffer).end()
+        while pos >= len(buffer) and not eof:
+            fill()
+            pos = _WHITESPACE.match(buffer, pos).end()
+        if buffer[pos:pos + 1] != "[":
+            raise ValueError(f"{path}: expected a JSON array of events")
+        pos += 1
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                if eof:
+                    raise ValueError(f"{path}: unexpected end of events array")
+                fill()
+                continue
+            if buffer[pos] == "]":
+                return
+
+            if peek and _EVENT_START.match(buffer, pos):
+                # Olayın sonu: bir sonraki olayın başı (tampon yetmiyorsa oku)
+                following = _EVENT_START.search(buffer, pos + 1)
+                if following is None and not eof:
+                    fill()
+                    continue
+                if following is not None and _peek_rejects(buffer, pos, following.start(), types, teams):
+                    pos = following.start()
+                    continue
+
+            try:
+                event, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            pos = end
+            if _matches(event, types, teams, where, predicate):
+                yield event
+
+
+def stream_flat_events(path, types=None, teams=None, where=None, predicate=None):
+    """Filtrelenmiş olaylardan doğrudan düz tablo (flatten_events ile aynı şema)"""
+    columns = empty_columns()
+    targets = list(columns.values())
+    for event in iter_events(path, types, teams, where, predicate):
+        for column, value in zip(targets, event_row(event)):
+            column.append(value)
+    return columns_frame(columns)
+
+
+def load_match_flat(match_id, types=None, teams=None, where=None, predicate=None):
+    """Maçın düz olayları, akış halinde ve filtreli (events dosyası yoksa FileNotFoundError)"""
+    return stream_flat_events(events_path(match_id), types, teams, where, predicate)
@@ -0,0 +1,157 @@
+"""
+StatsBomb Flat Events
+Ham olay listesini sabit kolonlu düz bir tabloya çevirme
+
+Kolonlar her maç için aynıdır; böylece maç maç üretilen tablolar
+(export, önbellek) aynı şemayla art arda yazılabilir.
+
+Ad kolonlarının yanında StatsBomb ID'leri de (type_id, team_id, player_id, ...)
+int32 olarak tutulur; yoksa -1. Filtre ve gruplamalar bu kodlarla yapılır:
+aynı adlı iki oyuncu ayrı kalır, kodlar her maçta ve her çalıştırmada aynıdır.
+events_frame() ham olay tablosuna da bu kodları yükleme anında bir kez ekler.
+"""
+
+import pandas as pd
+
+# Olay tipi → sonucun (outcome) bulunduğu alt sözlük
+OUTCOME_KEYS = {
+    'Pass': 'pass',
+    'Shot': 'shot',
+    'Duel': 'duel',
+    'Dribble': 'dribble',
+    'Goal Keeper': 'goalkeeper',
+    'Interception': 'interception',
+    '50/50': '50_50',
+    'Ball Receipt*': 'ball_receipt',
+}
+
+# Bitiş konumu olan olay tipleri
+END_LOCATION_KEYS = {'Pass': 'pass', 'Carry': 'carry', 'Shot': 'shot'}
+
+EVENT_COLUMNS = [
+    'id', 'index', 'period', 'timestamp', 'minute', 'second', 'type',
+    'possession', 'possession_team', 'play_pattern', 'team', 'player', 'position',
+    'x', 'y', 'end_x', 'end_y', 'outcome', 'recipient', 'under_pressure', 'xg', 'length',
+    'type_id', 'possession_team_id', 'team_id', 'player_id', 'position_id', 'outcome_id', 'recipient_id',
+]
+
+FLOAT_COLUMNS = {
+    'x': 'float64', 'y': 'float64', 'end_x': 'float64', 'end_y': 'float64', 'xg': 'float64',
+    'length': 'float64',
+}
+
+# StatsBomb ID kolonları (yoksa MISSING)
+ID_COLUMNS = ('type_id', 'possession_team_id', 'team_id', 'player_id', 'position_id', 'outcome_id', 'recipient_id')
+MISSING = -1
+ID_DTYPES = {column: 'int32' for column in ID_COLUMNS}
+
+# Ham olay tablosuna yükleme anında eklenen düz kolonlar (ham tabloda aynı adlı kolon yok)
+CODED_COLUMNS = ('x', 'y', 'end_x', 'end_y', 'xg', 'length', 'outcome', 'recipient') + ID_COLUMNS
+
+# Metriklerin süzdüğü StatsBomb sabitleri
+TYPE_IDS = {
+    'Ball Recovery': 2, 'Duel': 4, 'Block': 6, 'Clearance': 9, 'Interception': 10,
+    'Shot': 16, 'Pressure': 17, 'Pass': 30,
+}
+OUTCOME_IDS = {'Goal': 97, 'Saved': 100}
+
+
+def name_of(value):
+    """{'id': .., 'name': ..} sözlüğünden ad (sözlük değilse kendisi)"""
+    return value.get('name') if isinstance(value, dict) else value
+
+
+def id_of(value):
+    """{'id': .., 'name': ..} sözlüğünden ID (yoksa MISSING)"""
+    if isinstance(value, dict) and value.get('id') is not None:
+        return value['id']
+    return MISSING
+
+
+def event_row(e):
+    """Ham olayı düz bir satıra çevir"""
+    event_type = e['type']['name']
+    location = e.get('location') or (None, None)
+
+    end_location = (None, None)
+    end_key = END_LOCATION_KEYS.get(event_type)
+    if end_key and isinstance(e.get(end_key), dict):
+        end_location = e[end_key].get('end_location') or (None, None)
+
+    outcome = None
+    outcome_key = OUTCOME_KEYS.get(event_type)
+    if outcome_key and isinstance(e.get(outcome_key), dict):
+        outcome = e[outcome_key].get('outcome')
+
+    pass_info = e.get('pass') if event_type == 'Pass' else None
+    shot_info = e.get('shot') if event_type == 'Shot' else None
+    recipient = pass_info.get('recipient') if isinstance(pass_info, dict) else None
+
+    return (
+        e['id'],
+        e['index'],
+        e['period'],
+        e['timestamp'],
+        e['minute'],
+        e['second'],
+        event_type,
+        e.get('possession'),
+        name_of(e.get('possession_team')),
+        name_of(e.get('play_pattern')),
+        name_of(e.get('team')),
+        name_of(e.get('player')),
+        name_of(e.get('position')),
+        location[0],
+        location[1],
+        end_location[0],
+        end_location[1],
+        name_of(outcome),
+        name_of(recipient),
+        bool(e.get('under_pressure', False)),
+        shot_info.get('statsbomb_xg') if isinstance(shot_info, dict) else None,
+        pass_info.get('length') if isinstance(pass_info, dict) else None,
+        id_of(e['type']),
+        id_of(e.get('possession_team')),
+        id_of(e.get('team')),
+        id_of(e.get('player')),
+        id_of(e.get('position')),
+        id_of(outcome),
+        id_of(recipient),
+    )
+
+
+def empty_columns():
+    """Kolon adı → boş liste (satır satır doldurulur)"""
+    return {column: [] for column in EVENT_COLUMNS}
+
+
+def columns_frame(columns):
+    """Kolon listelerinden sabit şemalı DataFrame"""
+    if not columns['id']:
+        return flatten_events([])  # boş tabloda da aynı kolon tipleri
+    return pd.DataFrame(columns, columns=EVENT_COLUMNS).astype(FLOAT_COLUMNS | ID_DTYPES)
+
+
+def flatten_events(events):
+    """Ham olay listesi → sabit kolonlu DataFrame"""
+    flat = pd.DataFrame.from_records([event_row(e) for e in events], columns=EVENT_COLUMNS)
+    return flat.astype(FLOAT_COLUMNS | ID_DTYPES)
+
+
+def events_frame(events):
+    """Ham olay listesi → ham DataFrame + CODED_COLUMNS (kodlar yüklemede bir kez çıkarılır)"""
+    frame = pd.DataFrame(events)
+    flat = flatten_events(events)
+    return pd.concat([frame, flat[list(CODED_COLUMNS)]], axis=1)
+
+
+def with_codes(events_df):
+    """Kod kolonları olan tablo: events_frame/düz tablo aynen döner, eksikse satırlardan çıkarılır"""
+    if all(column in events_df.columns for column in CODED_COLUMNS):
+        return events_df
+    records = [
+        {k: v for k, v in row.items() if not (isinstance(v, float) and v != v)}
+        for row in events_df.to_dict('records')
+    ]
+    flat = flatten_events(records).set_axis(events_df.index)
+    return pd.concat([events_df, flat[list(CODED_COLUMNS)]], axis=1)
@@ -0,0 +1,241 @@
+"""
+StatsBomb Export
+Büyük sonuçları parça parça (chunk) CSV, Parquet veya sıkıştırılmış NDJSON'a yazma
+
+Kaynaklar DataFrame parçaları üreten generator'lardır (ör. maç maç olaylar),
+yazıcılar her parçayı dosyaya ekleyip bırakır; bellek kullanımı en büyük
+parça ile sınırlıdır. Uzun exportlar ExportJobs ile arka planda çalışır ve
+data/cache/exports altında indirilebilir bir dosya üretir.
+"""
+
+import gzip
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from core.loaders import DATA_DIR, load_events_df
+from core.match_cache import load_flat_events
+from core.metrics import analyze_passes, pass_connections
+
+EXPORT_DIR = os.path.join(DATA_DIR, "cache", "exports")
+
+# Format → (dosya uzantısı, MIME tipi)
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'ndjson': ('.ndjson.gz', 'application/gzip'),
+}
+
+# Bu süreden eski export dosyaları ve bitmiş iş kayıtları yeni iş başlarken silinir
+ARTIFACT_MAX_AGE = 24 * 3600
+
+# Tek DataFrame'den export ederken parça boyutu
+CHUNK_ROWS = 10_000
+
+
+def frame_chunks(df, chunk_rows=CHUNK_ROWS):
+    """DataFrame'i satır parçalarına böl"""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def season_event_chunks(match_ids):
+    """Maç maç düz olay tablosu (lokalde events dosyası olan maçlar)"""
+    for match_id in match_ids:
+        flat = load_flat_events(match_id)
+        if flat is None:
+            continue
+        flat.insert(0, 'match_id', match_id)
+        yield flat
+
+
+def season_pass_connection_chunks(matches, team_name):
+    """Maç maç takımın pas bağlantıları (ham maç listesinden)"""
+    for m in matches:
+        home_team = m['home_team']['home_team_name']
+        away_team = m['away_team']['away_team_name']
+        if team_name not in (home_team, away_team):
+            continue
+
+        events = load_events_df(m['match_id'])
+        if events is None:
+            continue
+
+        is_home_team = team_name == home_team
+        pass_df = analyze_passes(events, team_name, is_home_team)
+        if len(pass_df) == 0:
+            continue
+
+        connections = pass_connections(pass_df)
+        connections.insert(0, 'match_id', m['match_id'])
+        connections.insert(1, 'match_date', m['match_date'])
+        connections.insert(2, 'opponent', away_team if is_home_team else home_team)
+        yield connections
+
+
+def _plain(chunk):
+    """Kategorik kolonları düz metne çevir (parçalar arası şema sabit kalsın)"""
+    categories = chunk.select_dtypes('category').columns
+    if len(categories) == 0:
+        return chunk
+    return chunk.astype({c: object for c in categories})
+
+
+def _write_csv(chunks, path):
+    rows = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        for chunk in chunks:
+            chunk.to_csv(f, header=rows == 0, index=False)
+            rows += len(chunk)
+    return rows
+
+
+def _write_parquet(chunks, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                table = pa.Table.from_pandas(_plain(chunk), preserve_index=False)
+                writer = pq.ParquetWriter(path, table.schema)
+            else:
+                table = pa.Table.from_pandas(_plain(chunk), schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        pq.write_table(pa.table({}), path)
+    return rows
+
+
+def _write_ndjson(chunks, path):
+    rows = 0
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            f.write(_plain(chunk).to_json(orient='records', lines=True, force_ascii=False, date_format='iso'))
+            f.write('\n')
+            rows += len(chunk)
+    return rows
+
+
+_WRITERS = {'csv': _write_csv, 'parquet': _write_parquet, 'ndjson': _write_ndjson}
+
+
+def write_export(chunks, path, fmt):
+    """Parçaları dosyaya yaz (önce geçici dosyaya, bitince yerine taşı); satır sayısı döner"""
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    partial = f"{path}.partial"
+    try:
+        rows = _WRITERS[fmt](chunks, partial)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, path)
+    return rows
+
+
+class ExportJob:
+    """Arka plan export işinin durumu"""
+
+    def __init__(self, job_id, name, fmt, path):
+        self.job_id = job_id
+        self.name = name
+        self.fmt = fmt
+        self.path = path
+        self.state = 'queued'
+        self.rows = 0
+        self.error = None
+        self.started = None
+        self.finished = None
+
+    @property
+    def file_name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def mime(self):
+        return EXPORT_FORMATS[self.fmt][1]
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+
+class ExportJobs:
+    """Export işlerini arka plan thread'lerinde çalıştır"""
+
+    def __init__(self, workers=2, export_dir=EXPORT_DIR):
+        self.export_dir = export_dir
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name, make_chunks, fmt):
+        """make_chunks: parça generator'ı döndüren fonksiyon (iş başlayınca çağrılır)"""
+        extension = EXPORT_FORMATS[fmt][0]
+        job_id = uuid.uuid4().hex[:12]
+        path = os.path.join(self.export_dir, f"{name}_{job_id}{extension}")
+        job = ExportJob(job_id, name, fmt, path)
+
+        self._prune()
+        with self._lock:
+            self._jobs[job_id] = job
+        self._pool.submit(self._run, job, make_chunks)
+        return job
+
+    def _run(self, job, make_chunks):
+        job.state = 'running'
+        job.started = time.time()
+        try:
+            job.rows = write_export(make_chunks(), job.path, job.fmt)
+            job.state = 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.state = 'failed'
+        finally:
+            job.finished = time.time()
+
+    def _prune(self):
+        """Süresi dolan işleri dosyalarıyla birlikte sil
+
+        Bitişinden ARTIFACT_MAX_AGE geçen iş kaydı düşer; hâlâ kayıtlı bir işin
+        dosyası (indirme butonu onu gösterir) eski olsa da silinmez.
+        """
+        cutoff = time.time() - ARTIFACT_MAX_AGE
+        with self._lock:
+            for job_id in [job_id for job_id, job in self._jobs.items()
+                           if job.finished is not None and job.finished < cutoff]:
+                del self._jobs[job_id]
+            referenced = {path for job in self._jobs.values() for path in (job.path, f"{job.path}.partial")}
+
+        if not os.path.isdir(self.export_dir):
+            return
+        for entry in os.scandir(self.export_dir):
+            if entry.is_file() and entry.path not in referenced and entry.stat().st_mtime < cutoff:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:  # başka bir submit aynı anda sildi
+                    pass
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
@@ -0,0 +1,141 @@
+"""
+StatsBomb HTTP Fetch
+Ortak bağlantı havuzu, süre sınırı ve eşzamanlı yükleme
+
+Tüm istekler tek bir requests.Session üzerinden gider (keep-alive, host başına
+bağlantı havuzu). fetch_json() yeniden denemeleri ve bekleme sürelerini aktif
+süre sınırına göre kısaltır: deadline() bloğu içinde hiçbir istek ya da
+bekleme sınırı aşmaz. gather() birbirinden bağımsız yüklemeleri paylaşılan bir
+thread havuzunda aynı anda çalıştırır; sayfa açılışı toplam yerine en yavaş
+yüklemenin süresi kadar sürer. Süre sınırı ve perf span'ları (contextvars)
+thread'lere taşınır. Streamlit burada import edilmez.
+
+Kullanım:
+with deadline(30):
+    results, errors = gather({'events': lambda: load_events(match_id), ...})
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from core.lazy import lazy_module
+
+requests = lazy_module("requests")
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Havuzdaki eşzamanlı bağlantı/iş sayısı
+POOL_SIZE = 8
+
+# Kesin yanıtlar: yeniden denenmez, çağırana döner
+FINAL_STATUSES = (304, 404)
+
+_deadline = contextvars.ContextVar("statsbomb_fetch_deadline", default=None)
+_session = None
+_session_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="fetch")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Süre sınırı doldu"""
+
+
+def get_session():
+    """Süreç genelinde paylaşılan HTTP oturumu"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(HEADERS)
+            _session = session
+        return _session
+
+
+class deadline:
+    """Blok içindeki istekler için mutlak süre sınırı (iç içe olursa erken olan geçerli)"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self._token = None
+
+    def __enter__(self):
+        at = time.monotonic() + self.seconds
+        current = _deadline.get()
+        self._token = _deadline.set(at if current is None else min(at, current))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _deadline.reset(self._token)
+        return False
+
+
+def remaining():
+    """Süre sınırına kalan saniye (sınır yoksa None)"""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def fetch(url, max_retries=3, timeout=10, headers=None):
+    """URL'yi çek; hata olursa artan beklemeyle yeniden dene, son hatayı fırlat
+
+    304 ve 404 kesin yanıttır: yeniden denenmeden yanıt olarak döner.
+    """
+    for attempt in range(max_retries):
+        left = remaining()
+        if left is not None and left <= 0:
+            raise DeadlineExceeded(f"deadline exceeded before fetching {url}")
+        try:
+            response = get_session().get(url, timeout=timeout if left is None else min(timeout, left),
+                                         headers=headers)
+            if response.status_code not in FINAL_STATUSES:
+                response.raise_for_status()
+            return response
+        except Exception:
+            backoff = (attempt + 1) * 2
+            left = remaining()
+            if attempt == max_retries - 1 or (left is not None and left <= backoff):
+                raise
+            time.sleep(backoff)
+
+
+def fetch_json(url, max_retries=3, timeout=10):
+    """URL'den JSON çek (404 dahil her hata fırlatılır)"""
+    response = fetch(url, max_retries=max_retries, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def gather(calls, timeout=None):
+    """{ad: argümansız fonksiyon} eşzamanlı çalıştır → (sonuçlar, hatalar)
+
+    timeout verilmezse aktif süre sınırı kullanılır. Süresinde bitmeyen
+    çağrıların sonucu None olur ve hatalara DeadlineExceeded yazılır; çalışan
+    thread kesilmez, sonucu (ör. önbelleğe) arka planda yazılmaya devam eder.
+    """
+    futures = {
+        _executor.submit(contextvars.copy_context().run, fn): name
+        for name, fn in calls.items()
+    }
+    if timeout is None:
+        timeout = remaining()
+    done, _ = wait(futures, timeout=None if timeout is None else max(timeout, 0))
+
+    results, errors = {}, {}
+    for future, name in futures.items():
+        if future not in done:
+            results[name] = None
+            errors[name] = DeadlineExceeded(f"{name} did not finish in time")
+            continue
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = None
+            errors[name] = e
+    return results, errors
@@ -0,0 +1,342 @@
+"""
+StatsBomb On-Pitch Intervals
+Oyuncuların sahada kaldığı zaman aralıkları, oynanan dakikalar ve 90 dakika başına oranlar
+
+Maç saati devreler arasında örtüşür (ilk yarı uzatması 47:30, ikinci yarı
+45:00'te başlar); bu yüzden aralıklar maç başından geçen gerçek saniyeye
+çevrilir: her devre bir öncekinin bittiği yerden devam eder (MatchClock).
+Devre başı/sonu olaylardaki Half Start/Half End kayıtlarından, olay yoksa
+kadrodaki en geç saatten (en az normal süre) alınır. Penaltı atışları
+(5. devre) sayılmaz.
+
+Aralık kaynakları:
+- Olaylar: Starting XI ile ilk 11 sahaya girer; Substitution çıkanın aralığını
+  kapatıp girenin aralığını açar; kırmızı kart (Red Card, Second Yellow)
+  aralığı kapatır. Events dosyası varsa sahada olma bilgisi buradan gelir.
+- Kadro: positions girdileri (from/to, from_period/to_period). Art arda gelen
+  pozisyon değişiklikleri tek aralıkta birleşir; "to" boşsa maç sonuna kadar.
+
+Aralıklar başlangıca göre sıralı numpy dizilerinde tutulur. "63. dakikada
+kimler sahadaydı" sorgusu searchsorted ile yalnızca başlangıcı
+(t - en uzun aralık, t] içindeki aralıklara bakar.
+
+Sezon tablosu (oyuncu başına maç, ilk 11, dakika ve 90 dakika başına pas,
+şut, gol, xG) data/cache/minutes/<competition_id>_<season_id>.v<sürüm>.parquet
+dosyasında saklanır; sezonun maç/olay/kadro dosyalarından eskiyse yeniden
+hesaplanır (build_minutes.py).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from core.catalog import load_catalog
+from core.event_stream import iter_events
+from core.events import name_of
+from core.loaders import (
+    DATA_DIR, events_path, lineups_path, matches_path, raw_exists, raw_mtime, read_json,
+)
+
+MINUTES_CACHE_DIR = os.path.join(DATA_DIR, "cache", "minutes")
+# Sezon tablosunun hesabı değişince artırılır; eski sürümle yazılmış tablolar okunmaz
+MINUTES_VERSION = 2
+
+# Devre → maç saatinde başlangıç (saniye) ve normal süre (saniye)
+PERIOD_START = {1: 0, 2: 45 * 60, 3: 90 * 60, 4: 105 * 60}
+PERIOD_LENGTH = {1: 45 * 60, 2: 45 * 60, 3: 15 * 60, 4: 15 * 60}
+
+INTERVAL_EVENT_TYPES = ('Starting XI', 'Substitution', 'Half Start', 'Half End', 'Foul Committed', 'Bad Behaviour')
+SENDING_OFF = ('Red Card', 'Second Yellow')
+
+
+def clock_seconds(clock):
+    """Kadro saati ("65:26") → saniye; boşsa None"""
+    if not clock:
+        return None
+    minutes, _, seconds = clock.partition(":")
+    return int(minutes) * 60 + float(seconds or 0)
+
+
+def clock_label(seconds):
+    """Saniye → "65:26" """
+    seconds = int(round(seconds))
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class MatchClock:
+    """Devre + maç saati ↔ maç başından geçen saniye"""
+
+    __slots__ = ('periods', 'offsets', 'duration')
+
+    def __init__(self, bounds):
+        # bounds: devre → (başlangıç saati, bitiş saati) saniye
+        self.periods = sorted(p for p in bounds if p in PERIOD_START)
+        self.offsets = {}
+        elapsed = 0.0
+        for period in self.periods:
+            start, end = bounds[period]
+            self.offsets[period] = (elapsed, start, max(end, start))
+            elapsed += max(end, start) - start
+        self.duration = elapsed
+
+    def absolute(self, period, clock):
+        """(devre, maç saati saniye) → maç başından geçen saniye"""
+        if period not in self.offsets:
+            return self.duration if period and period > max(self.periods, default=0) else 0.0
+        offset, start, end = self.offsets[period]
+        return offset + min(max(clock, start), end) - start
+
+    def at(self, minute, second=0, period=None):
+        """Maç saati (ör. 63. dakika) → geçen saniye; devre verilmezse saatin başladığı son devre"""
+        clock = minute * 60 + second
+        if period is None:
+            started = [p for p in self.periods if self.offsets[p][1] <= clock]
+            period = started[-1] if started else 1
+        return self.absolute(period, clock)
+
+    def label(self, seconds):
+        """Geçen saniye → maç saati etiketi ("97:13")"""
+        for period in reversed(self.periods):
+            offset, start, _ = self.offsets[period]
+            if seconds >= offset:
+                return clock_label(start + seconds - offset)
+        return clock_label(seconds)
+
+
+def lineup_clock(lineups):
+    """Olay yoksa devre sınırları kadrodan: görülen en geç saat, en az normal süre"""
+    bounds = {1: (PERIOD_START[1], PERIOD_START[1] + PERIOD_LENGTH[1]),
+              2: (PERIOD_START[2], PERIOD_START[2] + PERIOD_LENGTH[2])}
+    for team in lineups:
+        for p in team.get('lineup', []):
+            for s in p.get('positions') or []:
+                for clock, period in ((s.get('from'), s.get('from_period')), (s.get('to'), s.get('to_period'))):
+                    seconds = clock_seconds(clock)
+                    if seconds is None or period not in PERIOD_START:
+                        continue
+                    start, end = bounds.get(period, (PERIOD_START[period], PERIOD_START[period] + PERIOD_LENGTH[period]))
+                    bounds[period] = (start, max(end, seconds))
+    return MatchClock(bounds)
+
+
+class MatchIntervals:
+    """Bir maçın başlangıca göre sıralı sahada kalma aralıkları"""
+
+    __slots__ = ('match_id', 'clock', 'player_ids', 'team_ids', 'starts', 'ends', 'players', 'teams',
+                 'source', '_max_length')
+
+    def __init__(self, match_id, clock, rows, players, teams, source):
+        # rows: [(player_id, team_id, başlangıç, bitiş)] geçen saniye
+        rows = sorted((r for r in rows if r[3] > r[2]), key=lambda r: (r[2], r[3], r[0]))
+        self.match_id = match_id
+        self.clock = clock
+        self.player_ids = np.array([r[0] for r in rows], dtype=np.int64)
+        self.team_ids = np.array([r[1] for r in rows], dtype=np.int64)
+        self.starts = np.array([r[2] for r in rows], dtype=np.float64)
+        self.ends = np.array([r[3] for r in rows], dtype=np.float64)
+        self.players = players
+        self.teams = teams
+        self.source = source
+        self._max_length = float((self.ends - self.starts).max()) if rows else 0.0
+
+    def __len__(self):
+        return len(self.starts)
+
+    @classmethod
+    def from_lineups(cls, match_id, lineups, clock=None):
+        """Kadro positions girdilerinden (ardışık pozisyonlar tek aralık)"""
+        clock = clock or lineup_clock(lineups)
+        rows, players, teams = [], {}, {}
+        for team in lineups:
+            teams[team['team_id']] = team['team_name']
+            for p in team.get('lineup', []):
+                players[p['player_id']] = p['player_name']
+                current = None
+                for s in p.get('positions') or []:
+                    start = clock.absolute(s.get('from_period'), clock_seconds(s.get('from')) or 0)
+                    to = clock_seconds(s.get('to'))
+                    end = clock.duration if to is None else clock.absolute(s.get('to_period') or s.get('from_period'), to)
+                    end = max(end, start)
+                    if current is not None and start <= current[1]:
+                        current[1] = max(current[1], end)
+                        continue
+                    if current is not None:
+                        rows.append((p['player_id'], team['team_id'], *current))
+                    current = [start, end]
+                if current is not None:
+                    rows.append((p['player_id'], team['team_id'], *current))
+        return cls(match_id, clock, rows, players, teams, 'lineups')
+
+    @classmethod
+    def from_events(cls, match_id, events, lineups=()):
+        """Starting XI, Substitution, kırmızı kart ve devre olaylarından"""
+        bounds, marks = {}, []
+        players, teams = {}, {team['team_id']: team['team_name'] for team in lineups}
+        for e in events:
+            event_type = name_of(e.get('type'))
+            period = e.get('period')
+            seconds = e.get('minute', 0) * 60 + e.get('second', 0)
+            if event_type in ('Half Start', 'Half End') and period in PERIOD_START:
+                start, end = bounds.get(period, (seconds, seconds))
+                bounds[period] = (min(start, seconds), max(end, seconds))
+                continue
+            team = e.get('team') or {}
+            teams.setdefault(team.get('id'), team.get('name'))
+            if event_type == 'Starting XI':
+                for entry in (e.get('tactics') or {}).get('lineup', []):
+                    players[entry['player']['id']] = entry['player']['name']
+                    marks.append(('on', entry['player']['id'], team.get('id'), 1, 0))
+            elif event_type == 'Substitution':
+                off, on = e.get('player') or {}, (e.get('substitution') or {}).get('replacement') or {}
+                players[off.get('id')] = off.get('name')
+                players[on.get('id')] = on.get('name')
+                marks.append(('off', off.get('id'), team.get('id'), period, seconds))
+                marks.append(('on', on.get('id'), team.get('id'), period, seconds))
+            else:
+                card = ((e.get('foul_committed') or e.get('bad_behaviour') or {}).get('card') or {}).get('name')
+                if card in SENDING_OFF:
+                    marks.append(('off', (e.get('player') or {}).get('id'), team.get('id'), period, seconds))
+
+        for period in (1, 2):
+            bounds.setdefault(period, (PERIOD_START[period], PERIOD_START[period] + PERIOD_LENGTH[period]))
+        clock = MatchClock(bounds)
+
+        rows, open_since = [], {}
+        for kind, player_id, team_id, period, seconds in marks:
+            if player_id is None:
+                continue
+            t = clock.absolute(period, seconds)
+            if kind == 'on':
+                open_since.setdefault(player_id, (team_id, t))
+            elif player_id in open_since:
+                team_id, start = open_since.pop(player_id)
+                rows.append((player_id, team_id, start, t))
+        rows.extend((player_id, team_id, start, clock.duration) for player_id, (team_id, start) in open_since.items())
+        return cls(match_id, clock, rows, players, teams, 'events')
+
+    # --- Sorgular ---
+
+    def on_pitch_at(self, t, team_id=None):
+        """Geçen saniye t'de sahadaki oyuncu ID'leri (aralıklar [başlangıç, bitiş))"""
+        lo = np.searchsorted(self.starts, t - self._max_length, side='right')
+        hi = np.searchsorted(self.starts, t, side='right')
+        hit = np.flatnonzero(self.ends[lo:hi] > t) + lo
+        if team_id is not None:
+            hit = hit[self.team_ids[hit] == team_id]
+        return self.player_ids[hit].tolist()
+
+    def on_pitch(self, minute, second=0, period=None, team_id=None):
+        """Maç saatinde (ör. 63. dakika) sahadaki oyuncu ID'leri"""
+        return self.on_pitch_at(self.clock.at(minute, second, period), team_id)
+
+    def minutes_played(self):
+        """Oyuncu ID → oynanan dakika"""
+        totals = {}
+        for player_id, length in zip(self.player_ids.tolist(), ((self.ends - self.starts) / 60).tolist()):
+            totals[player_id] = totals.get(player_id, 0.0) + length
+        return totals
+
+    def frame(self):
+        """Aralıklar tablo olarak (giriş/çıkış maç saati etiketleriyle)"""
+        return pd.DataFrame({
+            'player_id': self.player_ids,
+            'player': [self.players.get(p) for p in self.player_ids.tolist()],
+            'team_id': self.team_ids,
+            'team': [self.teams.get(t) for t in self.team_ids.tolist()],
+            'on': [self.clock.label(t) for t in self.starts.tolist()],
+            'off': [self.clock.label(t) for t in self.ends.tolist()],
+            'started': self.starts == 0,
+            'minutes': ((self.ends - self.starts) / 60).round(1),
+        })
+
+
+def match_intervals(match_id, lineups=None):
+    """Maçın aralıkları: events dosyası varsa olaylardan, yoksa kadrodan (ikisi de yoksa None)"""
+    if lineups is None:
+        lineups = read_json(lineups_path(match_id)) if raw_exists(lineups_path(match_id)) else []
+    if raw_exists(events_path(match_id)):
+        return MatchIntervals.from_events(match_id, iter_events(events_path(match_id), types=INTERVAL_EVENT_TYPES),
+                                          lineups)
+    if lineups:
+        return MatchIntervals.from_lineups(match_id, lineups)
+    return None
+
+
+# --- Sezon ---
+
+def season_minutes(match_ids):
+    """Oyuncu başına maç, ilk 11 ve dakika (sahaya hiç çıkmayanlar yok)"""
+    rows = []
+    for match_id in match_ids:
+        intervals = match_intervals(match_id)
+        if intervals is None:
+            continue
+        started = set(intervals.player_ids[intervals.starts == 0].tolist())
+        last_team = dict(zip(intervals.player_ids.tolist(), intervals.team_ids.tolist()))
+        for player_id, minutes in intervals.minutes_played().items():
+            rows.append((player_id, intervals.players.get(player_id), intervals.teams.get(last_team[player_id]),
+                         match_id, player_id in started, minutes))
+    frame = pd.DataFrame(rows, columns=['player_id', 'player', 'team', 'match_id', 'started', 'minutes'])
+    return (frame.groupby('player_id', sort=False)
+            .agg(player=('player', 'last'), team=('team', 'last'), matches=('match_id', 'nunique'),
+                 starts=('started', 'sum'), minutes=('minutes', 'sum'))
+            .reset_index()
+            .astype({'matches': 'int64', 'starts': 'int64'})
+            .sort_values('minutes', ascending=False, ignore_index=True))
+
+
+def per90_rates(match_ids):
+    """season_minutes() + olay toplamları (core.encoding.season_player_totals) ve 90 dakika başına oranlar
+
+    İki tablo StatsBomb player_id ile birleştirilir; aynı adlı oyuncular karışmaz.
+    """
+    from core.encoding import season_player_totals
+    from core.match_cache import load_flat_events
+
+    match_ids = list(match_ids)
+    minutes = season_minutes(match_ids)
+    totals = season_player_totals(load_flat_events(m) for m in match_ids if raw_exists(events_path(m)))
+    rates = minutes.merge(totals.drop(columns=['player', 'team']), on='player_id', how='left')
+    counts = ['passes', 'completed_passes', 'shots', 'goals', 'xg']
+    rates[counts] = rates[counts].fillna(0)
+    per90 = 90 / rates['minutes'].where(rates['minutes'] > 0)
+    for column in counts:
+        rates[f"{column}_90"] = (rates[column] * per90).round(2)
+    rates['minutes'] = rates['minutes'].round(1)
+    return rates
+
+
+def season_minutes_path(competition_id, season_id):
+    return os.path.join(MINUTES_CACHE_DIR, f"{competition_id}_{season_id}.v{MINUTES_VERSION}.parquet")
+
+
+def season_match_ids(competition_id, season_id):
+    """Sezonun olay veya kadro dosyası lokal olan maçları"""
+    catalog = load_catalog(competition_id, season_id)
+    if catalog is None:
+        return []
+    return [m for m in catalog['match_id'].tolist()
+            if raw_exists(events_path(m)) or raw_exists(lineups_path(m))]
+
+
+def _season_source_mtime(competition_id, season_id, match_ids):
+    sources = [matches_path(competition_id, season_id)]
+    sources += [events_path(m) for m in match_ids] + [lineups_path(m) for m in match_ids]
+    return max((raw_mtime(s) for s in sources if raw_exists(s)), default=0)
+
+
+def load_season_minutes(competition_id, season_id, rebuild=False):
+    """Sezonun dakika/90 dakika başına oran tablosu; yoksa veya eskiyse hesaplanıp kaydedilir"""
+    match_ids = season_match_ids(competition_id, season_id)
+    path = season_minutes_path(competition_id, season_id)
+    if (not rebuild and os.path.exists(path)
+            and os.path.getmtime(path) >= _season_source_mtime(competition_id, season_id, match_ids)):
+        return pd.read_parquet(path)
+
+    rates = per90_rates(match_ids)
+    os.makedirs(MINUTES_CACHE_DIR, exist_ok=True)
+    partial = f"{path}.{os.getpid()}.partial"
+    rates.to_parquet(partial, index=False)
+    os.replace(partial, path)
+    return rates
@@ -0,0 +1,56 @@
+"""
+StatsBomb Lazy Imports
+Ağır modülleri (matplotlib, requests, pandas) ilk kullanımda import et
+
+Sayfalar ve core modülleri bu vekilleri modül düzeyinde tanımlar; gerçek import
+ilk öznitelik erişiminde olur. Böylece grafik çizmeyen ya da ağdan veri
+çekmeyen bir rerun matplotlib/requests maliyetini hiç ödemez. Import kilidi
+sayesinde eşzamanlı oturumlarda da güvenlidir.
+
+Kullanım:
+plt = lazy_module("matplotlib.pyplot")
+fig, ax = plt.subplots()   # matplotlib burada yüklenir
+"""
+
+import importlib
+import sys
+
+
+class LazyModule:
+    """İlk öznitelik erişiminde import edilen modül vekili"""
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self._name)
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        value = getattr(self._load(), attr)
+        # Sonraki erişimler doğrudan vekilin sözlüğünden
+        self.__dict__[attr] = value
+        return value
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    @property
+    def loaded(self):
+        return self.__dict__['_module'] is not None
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_module(name):
+    """Modül vekili döndür (modül zaten yüklüyse kendisini)"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
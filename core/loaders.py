@@ -0,0 +1,161 @@
+"""
+StatsBomb Local Loaders
+Lokal data/ klasöründen veri okuma (Streamlit olmadan)
+
+Ham JSON dosyaları sıkıştırılmış da saklanabilir (compress_data.py):
+data/events/123.json yerine data/events/123.json.gz ya da .json.zst. Bu
+modüldeki okuyucular mantıksal .json yolunu alır, diskteki hali bulur ve
+okurken akış halinde açar. zstd dosyası eğitilmiş bir sözlükle
+sıkıştırılmışsa sözlük, çerçeve başlığındaki ID ile
+data/dicts/<klasör>-<ID>.dict dosyasından yüklenir.
+"""
+
+import gzip
+import os
+import json
+import threading
+
+from core.lazy import lazy_module
+
+pd = lazy_module("pandas")
+zstandard = lazy_module("zstandard")
+
+# Doğru BASE URL (testlerde yerel bir HTTP sunucusuna yönlendirilebilir)
+BASE_URL = os.environ.get(
+    "STATSBOMB_BASE_URL", "https://raw.githubusercontent.com/statsbomb/open-data/refs/heads/master/data/"
+)
+
+DATA_DIR = "data"
+
+# Ham dosyanın diskteki olası halleri (önce düz JSON)
+RAW_SUFFIXES = ("", ".zst", ".gz")
+DICT_DIR = os.path.join(DATA_DIR, "dicts")
+
+_dictionaries = {}
+_dictionaries_lock = threading.Lock()
+
+
+def url_to_local_path(url):
+    """URL'yi lokal dosya yoluna çevir"""
+    # Örnek: ".../data/events/123.json" → "data/events/123.json"
+    if "/competitions.json" in url:
+        return os.path.join(DATA_DIR, "competitions.json")
+    for folder in ("matches", "events", "lineups"):
+        marker = f"/{folder}/"
+        if marker in url:
+            parts = url.split(marker)[1]  # "11/90.json", "3895292.json"
+            return os.path.join(DATA_DIR, folder, parts)
+    return None
+
+
+def read_json(local_path):
+    """JSON dosyasını oku (sıkıştırılmış halleri de)"""
+    with open_raw(local_path) as f:
+        return json.load(f)
+
+
+def events_path(match_id):
+    """Maçın events dosya yolu"""
+    return os.path.join(DATA_DIR, "events", f"{match_id}.json")
+
+
+def lineups_path(match_id):
+    """Maçın lineups dosya yolu"""
+    return os.path.join(DATA_DIR, "lineups", f"{match_id}.json")
+
+
+def matches_path(competition_id, season_id):
+    """Sezonun matches dosya yolu"""
+    return os.path.join(DATA_DIR, "matches", str(competition_id), f"{season_id}.json")
+
+
+def resolve_raw(path):
+    """Mantıksal .json yolunun diskteki hali (düz, .zst ya da .gz); yoksa None"""
+    for suffix in RAW_SUFFIXES:
+        if os.path.exists(path + suffix):
+            return path + suffix
+    return None
+
+
+def raw_exists(path):
+    return resolve_raw(path) is not None
+
+
+def raw_mtime(path):
+    """Diskteki halin mtime'ı (dosya yoksa FileNotFoundError)"""
+    actual = resolve_raw(path)
+    if actual is None:
+        raise FileNotFoundError(path)
+    return os.path.getmtime(actual)
+
+
+def file_version(path):
+    """Dosya sürümü: (mtime_ns, boyut); dosya yoksa None (sıkıştırılmış haller dahil)"""
+    actual = resolve_raw(path)
+    if actual is None:
+        return None
+    try:
+        stat = os.stat(actual)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def raw_kind(path):
+    """data/ altındaki ilk klasör: "events", "lineups", "matches" (sözlük adı)"""
+    return os.path.relpath(path, DATA_DIR).split(os.sep)[0]
+
+
+def dictionary_path(kind, dict_id):
+    return os.path.join(DICT_DIR, f"{kind}-{dict_id}.dict")
+
+
+def zstd_dictionary(kind, dict_id):
+    """Klasörün verilen ID'li zstd sözlüğü; süreç başına bir kez okunur"""
+    key = (kind, dict_id)
+    with _dictionaries_lock:
+        if key not in _dictionaries:
+            with open(dictionary_path(kind, dict_id), 'rb') as f:
+                _dictionaries[key] = zstandard.ZstdCompressionDict(f.read())
+        return _dictionaries[key]
+
+
+def open_compressed(actual, kind=None):
+    """Diskteki dosyayı uzantısına göre akış halinde açan ikili okuyucu"""
+    if actual.endswith(".gz"):
+        return gzip.open(actual, 'rb')
+    if actual.endswith(".zst"):
+        f = open(actual, 'rb')
+        # Sözlük ID'si çerçeve başlığında; 0 ise sözlük kullanılmamış
+        dict_id = zstandard.get_frame_parameters(f.read(18)).dict_id
+        f.seek(0)
+        dictionary = zstd_dictionary(kind, dict_id) if dict_id else None
+        decompressor = zstandard.ZstdDecompressor(dict_data=dictionary) if dictionary else zstandard.ZstdDecompressor()
+        return decompressor.stream_reader(f, closefd=True)
+    return open(actual, 'rb')
+
+
+def open_raw(path):
+    """Ham dosyayı ikili akış olarak aç; sıkıştırılmışsa okurken açılır"""
+    actual = resolve_raw(path)
+    if actual is None:
+        raise FileNotFoundError(path)
+    return open_compressed(actual, raw_kind(path))
+
+
+def load_events_df(match_id):
+    """Maç olaylarını DataFrame olarak yükle (dosya yoksa None); kod kolonları eklenmiş"""
+    from core.events import events_frame  # pandas'ı modül yüklenirken içe aktarmamak için
+
+    path = events_path(match_id)
+    if not raw_exists(path):
+        return None
+    return events_frame(read_json(path))
+
+
+def load_season_matches(competition_id, season_id):
+    """Sezonun maç listesini ham liste olarak yükle (dosya yoksa boş liste)"""
+    path = matches_path(competition_id, season_id)
+    if not raw_exists(path):
+        return []
+    return read_json(path)
@@ -0,0 +1,232 @@
+"""
+StatsBomb Match Cache
+Maç başına kalıcı önbellek: düz olaylar, metrikler ve varsayılan grafikler
+
+Her maç için data/cache/ altında üç dosya türü tutulur:
+flat/<match_id>.parquet (core.event_stream.stream_flat_events), metrics/<match_id>.json
+(her iki takımın maç istatistikleri ve gelişmiş metrikleri) ve
+figures/<match_id>/<grafik>_<takım>.png (paslaşma ağının debug satırları
+yanında .debug.json olarak). Izgara önbelleği (core/density.py)
+gibi, dosya events dosyasından eskiyse yeniden üretilir. warm_cache.py bu
+dosyaları deploy sırasında önceden doldurur; sayfalar ve export'lar okur.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from core.event_stream import stream_flat_events
+from core.events import EVENT_COLUMNS
+from core.loaders import DATA_DIR, events_path, load_events_df, read_json, raw_exists, raw_mtime
+from core.metrics import (
+    calculate_team_stats,
+    calculate_attacking_metrics, calculate_passing_metrics, calculate_defensive_metrics,
+)
+from core.plots import plot_shot_map, plot_pass_network, figure_png
+
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+FLAT_CACHE_DIR = os.path.join(CACHE_DIR, "flat")
+METRICS_CACHE_DIR = os.path.join(CACHE_DIR, "metrics")
+FIGURE_CACHE_DIR = os.path.join(CACHE_DIR, "figures")
+
+
+def _pass_network(events_df, team_name, on_debug=None):
+    # Match Overview'un varsayılan ayarı: en az 2 pas
+    return plot_pass_network(events_df, team_name, min_passes=2, on_debug=on_debug)
+
+
+# Sayfaların varsayılan olarak gösterdiği statik grafikler: ad → çizim fonksiyonu
+DEFAULT_FIGURES = {
+    'shot_map': plot_shot_map,
+    'pass_network': _pass_network,
+}
+# Çizilirken debug satırı üreten grafikler (on_debug alır; satırlar PNG'nin yanında saklanır)
+DEBUG_FIGURES = ('pass_network',)
+
+
+def has_local_events(match_id):
+    return raw_exists(events_path(match_id))
+
+
+def _is_fresh(path, source):
+    """Önbellek dosyası var ve kaynak dosyadan yeni mi"""
+    return os.path.exists(path) and os.path.getmtime(path) >= raw_mtime(source)
+
+
+def _write_atomic(path, data, mode='wb'):
+    """Yarım dosya görünmesin: önce .partial, sonra yer değiştir"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f"{path}.{os.getpid()}.partial"
+    with open(partial, mode) as f:
+        f.write(data)
+    os.replace(partial, path)
+
+
+def _json_default(value):
+    # numpy sayıları (np.int64, np.float64) JSON'a
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def team_names(events_df):
+    """Olaylardaki takım adları (ilk görünme sırasıyla)"""
+    names = events_df['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
+    return [n for n in names.dropna().unique()]
+
+
+# --- Düz olaylar ---
+
+def flat_events_path(match_id):
+    return os.path.join(FLAT_CACHE_DIR, f"{match_id}.parquet")
+
+
+def load_flat_events(match_id):
+    """Düz olay tablosu; önbellekte yoksa/eskiyse oluştur (events dosyası yoksa None)"""
+    source = events_path(match_id)
+    if not raw_exists(source):
+        return None
+
+    path = flat_events_path(match_id)
+    if _is_fresh(path, source):
+        flat = pd.read_parquet(path)
+        if list(flat.columns) == EVENT_COLUMNS:  # eski şemayla yazılmışsa yeniden kur
+            return flat
+
+    flat = stream_flat_events(source)
+    os.makedirs(FLAT_CACHE_DIR, exist_ok=True)
+    partial = f"{path}.{os.getpid()}.partial"
+    flat.to_parquet(partial, index=False)
+    os.replace(partial, path)
+    return flat
+
+
+# --- Metrikler ---
+
+def match_metrics(events_df):
+    """Her takım için maç istatistikleri ve gelişmiş metrikler"""
+    metrics = {}
+    for team in team_names(events_df):
+        attacking, _ = calculate_attacking_metrics(events_df, team)
+        metrics[team] = {
+            'team_stats': calculate_team_stats(events_df, team),
+            'attacking': attacking,
+            'passing': calculate_passing_metrics(events_df, team),
+            'defensive': calculate_defensive_metrics(events_df, team),
+        }
+    return metrics
+
+
+def metrics_path(match_id):
+    return os.path.join(METRICS_CACHE_DIR, f"{match_id}.json")
+
+
+def load_match_metrics(match_id, events_df=None):
+    """Maçın takım metrikleri; önbellekte yoksa/eskiyse hesapla (events dosyası yoksa None)"""
+    source = events_path(match_id)
+    if not raw_exists(source):
+        return None
+
+    path = metrics_path(match_id)
+    if _is_fresh(path, source):
+        return read_json(path)
+
+    if events_df is None:
+        events_df = load_events_df(match_id)
+    metrics = match_metrics(events_df)
+    _write_atomic(path, json.dumps(metrics, ensure_ascii=False, default=_json_default), mode='w')
+    # JSON'dan okunanla aynı tipler (np.float64 → float)
+    return json.loads(json.dumps(metrics, default=_json_default))
+
+
+# --- Varsayılan grafikler ---
+
+def figure_path(match_id, chart, team_name):
+    team_slug = "".join(c if c.isalnum() else "_" for c in team_name)
+    return os.path.join(FIGURE_CACHE_DIR, str(match_id), f"{chart}_{team_slug}.png")
+
+
+def figure_debug_path(match_id, chart, team_name):
+    return figure_path(match_id, chart, team_name)[:-len(".png")] + ".debug.json"
+
+
+def _is_figure_fresh(match_id, chart, team_name):
+    source = events_path(match_id)
+    return _is_fresh(figure_path(match_id, chart, team_name), source) and (
+        chart not in DEBUG_FIGURES or _is_fresh(figure_debug_path(match_id, chart, team_name), source))
+
+
+def load_figure_png(match_id, chart, team_name, events_df=None):
+    """Varsayılan grafiğin PNG'si; yoksa/eskiyse çiz (veri yoksa None)
+
+    Çizilecek veri yoksa boş dosya yazılır, böylece boş sonuç da önbellekten gelir.
+    """
+    if not raw_exists(events_path(match_id)):
+        return None
+
+    path = figure_path(match_id, chart, team_name)
+    if _is_figure_fresh(match_id, chart, team_name):
+        with open(path, 'rb') as f:
+            return f.read() or None
+
+    if events_df is None:
+        events_df = load_events_df(match_id)
+    if chart in DEBUG_FIGURES:
+        lines = []
+        fig = DEFAULT_FIGURES[chart](events_df, team_name, on_debug=lambda tooltip, text: lines.append([tooltip, text]))
+        _write_atomic(figure_debug_path(match_id, chart, team_name), json.dumps(lines, ensure_ascii=False), mode='w')
+    else:
+        fig = DEFAULT_FIGURES[chart](events_df, team_name)
+    png = figure_png(fig) if fig else b""
+    _write_atomic(path, png)
+    return png or None
+
+
+def load_figure_debug(match_id, chart, team_name, events_df=None):
+    """Grafik çizilirken üretilen debug satırları [(tooltip, metin), ...] (veri yoksa None)"""
+    if chart not in DEBUG_FIGURES or not raw_exists(events_path(match_id)):
+        return None
+    if not _is_figure_fresh(match_id, chart, team_name):
+        load_figure_png(match_id, chart, team_name, events_df)
+    return [tuple(line) for line in read_json(figure_debug_path(match_id, chart, team_name))]
+
+
+# --- Temizlik ---
+
+def invalidate_match(match_id):
+    """Maçın kalıcı önbellek dosyalarını sil (sonraki okumada yeniden üretilir)"""
+    for path in (flat_events_path(match_id), metrics_path(match_id)):
+        if os.path.exists(path):
+            os.remove(path)
+    shutil.rmtree(os.path.join(FIGURE_CACHE_DIR, str(match_id)), ignore_errors=True)
+
+
+# --- Warm-up ---
+
+def warm_match(match_id, events_df=None):
+    """Bir maçın tüm kalıcı önbelleklerini doldur; ısıtılan öğeler
+
+    events_df verilirse (ör. paylaşılan tablo) events dosyası yeniden okunmaz.
+    """
+    if not has_local_events(match_id):
+        return []
+
+    warmed = []
+    load_flat_events(match_id)
+    warmed.append('flat')
+
+    if events_df is None and not _is_fresh(metrics_path(match_id), events_path(match_id)):
+        events_df = load_events_df(match_id)
+    metrics = load_match_metrics(match_id, events_df)
+    warmed.append('metrics')
+
+    for team in metrics:
+        for chart in DEFAULT_FIGURES:
+            if events_df is None and not _is_figure_fresh(match_id, chart, team):
+                events_df = load_events_df(match_id)
+            load_figure_png(match_id, chart, team, events_df)
+            warmed.append(f"{chart}:{team}")
+    return warmed
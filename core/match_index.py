@@ -0,0 +1,108 @@
+"""
+StatsBomb Match Index
+Maç kataloğu üzerinde önceden hesaplanmış indeksler ve sayfalama
+
+team → satırlar, week → satırlar, (competition_id, season_id) → satırlar ve
+tarihe göre sıralı satırlar bir kez hesaplanır. Filtreler DataFrame maskesi
+yerine sıralı pozisyon dizilerinin kesişimi ile çalışır, ekrana sadece
+görünen sayfa aktarılır.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _positions_by(values):
+    """Değer → satır pozisyonları (sıralı int dizisi)"""
+    codes, uniques = pd.factorize(values, sort=True)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {
+        uniques[i]: order[bounds[i]:bounds[i + 1]]
+        for i in range(len(uniques))
+    }
+
+
+class MatchIndex:
+    """Katalog için salt okunur indeksler"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog.reset_index(drop=True)
+        n = len(self.catalog)
+        self.all_positions = np.arange(n)
+
+        # Takım → maçlar (ev sahibi ve deplasman birlikte)
+        home = _positions_by(self.catalog['home_team_name'].astype(str).to_numpy())
+        away = _positions_by(self.catalog['away_team_name'].astype(str).to_numpy())
+        self.by_team = {
+            team: np.union1d(home.get(team, []), away.get(team, [])).astype(int)
+            for team in set(home) | set(away)
+        }
+
+        self.by_week = _positions_by(self.catalog['match_week'].to_numpy())
+
+        # (competition_id, season_id) → tek int anahtar
+        season_keys = (self.catalog['competition_id'].to_numpy(np.int64) << 32) | \
+            self.catalog['season_id'].to_numpy(np.int64)
+        self.by_season = {
+            (int(key >> 32), int(key & 0xFFFFFFFF)): positions
+            for key, positions in _positions_by(season_keys).items()
+        }
+
+        # Tarih aralığı sorguları için sıralı tarih dizisi (tarihi olmayan maçlar hariç)
+        dates = self.catalog['match_date'].to_numpy()
+        dated = np.flatnonzero(~np.isnat(dates))
+        self._date_order = dated[np.argsort(dates[dated], kind='stable')]
+        self._sorted_dates = dates[self._date_order]
+
+        self.teams = sorted(self.by_team)
+        self.weeks = sorted(int(w) for w in self.by_week)
+        self.seasons = list(self.by_season)
+
+    def __len__(self):
+        return len(self.catalog)
+
+    @property
+    def date_range(self):
+        """(en erken, en geç) maç tarihi; tarihli maç yoksa (None, None)"""
+        if len(self._sorted_dates) == 0:
+            return None, None
+        return pd.Timestamp(self._sorted_dates[0]).date(), pd.Timestamp(self._sorted_dates[-1]).date()
+
+    def _date_positions(self, date_from, date_to):
+        start = 0 if date_from is None else np.searchsorted(
+            self._sorted_dates, np.datetime64(pd.Timestamp(date_from)), side='left')
+        end = len(self._sorted_dates) if date_to is None else np.searchsorted(
+            self._sorted_dates, np.datetime64(pd.Timestamp(date_to)), side='right')
+        return np.sort(self._date_order[start:end])
+
+    def query(self, team=None, week=None, season=None, date_from=None, date_to=None):
+        """Filtrelere uyan satır pozisyonları (katalog sırasında)"""
+        candidates = []
+        if team is not None:
+            candidates.append(self.by_team.get(team, np.empty(0, dtype=int)))
+        if week is not None:
+            candidates.append(self.by_week.get(week, np.empty(0, dtype=int)))
+        if season is not None:
+            candidates.append(self.by_season.get(season, np.empty(0, dtype=int)))
+        if date_from is not None or date_to is not None:
+            candidates.append(self._date_positions(date_from, date_to))
+
+        if not candidates:
+            return self.all_positions
+
+        # En küçük kümeden başlayarak kesiştir
+        candidates.sort(key=len)
+        result = candidates[0]
+        for other in candidates[1:]:
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+    def page(self, positions, page, page_size):
+        """Sadece istenen sayfanın satırları (page 1'den başlar)"""
+        start = (page - 1) * page_size
+        return self.catalog.iloc[positions[start:start + page_size]]
+
+    @staticmethod
+    def page_count(positions, page_size):
+        return max(1, -(-len(positions) // page_size))
@@ -0,0 +1,219 @@
+"""
+StatsBomb Metrics
+Maç metrikleri ve pas analizi (Streamlit olmadan)
+
+Filtreler olay tablosunun kod kolonları (type_id, team_id, outcome_id, ...)
+üzerinde numpy maskeleriyle yapılır; kodlar tablo yüklenirken bir kez eklenir
+(core.events.events_frame). Kodsuz bir tablo gelirse with_codes() ekler.
+"""
+
+import numpy as np
+import pandas as pd
+
+from core.events import MISSING, OUTCOME_IDS, TYPE_IDS, name_of, with_codes
+
+PASS_COLUMNS = ['from', 'to', 'successful', 'length', 'direction', 'period', 'from_id', 'to_id']
+
+
+def team_code(events_df, team_name):
+    """Takım adının bu maçtaki StatsBomb ID'si (yoksa MISSING)"""
+    ids = events_df['team_id'].to_numpy()
+    unique, first = np.unique(ids, return_index=True)
+    for code, i in zip(unique, first):
+        if code != MISSING and name_of(events_df['team'].iat[i]) == team_name:
+            return code
+    return MISSING
+
+
+def player_names(ids, players):
+    """Oyuncu kodları → adlar (her farklı kod için bir kez çözülür)"""
+    unique, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+    table = np.array([name_of(players[i]) for i in first], dtype=object)
+    return table[inverse.reshape(-1)]
+
+
+def _coded(events_df, team_name):
+    """(kodlu tablo, takım maskesi, olay tipi kodları)"""
+    events_df = with_codes(events_df)
+    team = events_df['team_id'].to_numpy() == team_code(events_df, team_name)
+    return events_df, team, events_df['type_id'].to_numpy()
+
+
+def _count(mask):
+    return int(np.count_nonzero(mask))
+
+
+def analyze_passes(events_df, selected_team, is_home_team):
+    """Pasları analiz et"""
+    events_df, team, types = _coded(events_df, selected_team)
+    passes = events_df[
+        team & (types == TYPE_IDS['Pass'])
+        & (events_df['player_id'].to_numpy() >= 0) & (events_df['recipient_id'].to_numpy() >= 0)
+    ]
+
+    period = passes['period'].to_numpy()
+    x_diff = passes['end_x'].to_numpy() - passes['x'].to_numpy()
+    # Atak yönü: ev sahibi ilk yarıda, deplasman ikinci yarıda soldan sağa
+    right = (period == 1) == bool(is_home_team)
+    direction = np.select(
+        [x_diff > 5, x_diff < -5],
+        [np.where(right, "→ Forward", "→ Backward"), np.where(right, "← Backward", "← Forward")],
+        "↔ Lateral",
+    ).astype(object)
+    direction[np.isnan(x_diff)] = None
+
+    return pd.DataFrame({
+        'from': player_names(passes['player_id'].to_numpy(), passes['player'].to_numpy()),
+        'to': passes['recipient'].to_numpy(dtype=object),
+        'successful': passes['outcome_id'].to_numpy() == MISSING,
+        'length': passes['length'].to_numpy(),
+        'direction': direction,
+        'period': period,
+        'from_id': passes['player_id'].to_numpy(),
+        'to_id': passes['recipient_id'].to_numpy(),
+    }, columns=PASS_COLUMNS)
+
+
+def pass_connections(pass_df):
+    """Oyuncu → oyuncu pas bağlantıları (toplam, başarılı, ortalama uzunluk)
+
+    İkililer ad yerine oyuncu ID'leriyle gruplanır; aynı adlı iki oyuncu ayrı kalır.
+    """
+    pairs = pd.DataFrame({
+        'key': (pass_df['from_id'].to_numpy(dtype=np.int64) << 32) | pass_df['to_id'].to_numpy(dtype=np.int64),
+        'From': pass_df['from'].to_numpy(dtype=object),
+        'To': pass_df['to'].to_numpy(dtype=object),
+        'successful': pass_df['successful'].to_numpy(),
+        'length': pass_df['length'].to_numpy(dtype=float),
+    })
+    grouped = pairs.groupby('key').agg(
+        From=('From', 'first'),
+        To=('To', 'first'),
+        Successful=('successful', 'sum'),
+        Total=('successful', 'count'),
+        length=('length', 'mean'),
+    ).rename(columns={'length': 'Avg Length (m)'})
+    grouped['Success Rate (%)'] = (grouped['Successful'] / grouped['Total'] * 100).round(1)
+    return grouped.sort_values(['From', 'To']).reset_index(drop=True)
+
+
+def calculate_team_stats(events_df, team_name):
+    """Takım istatistikleri hesapla"""
+    events_df, team, types = _coded(events_df, team_name)
+    outcome = events_df['outcome_id'].to_numpy()
+
+    # Şutlar
+    shots = team & (types == TYPE_IDS['Shot'])
+    goals = shots & (outcome == OUTCOME_IDS['Goal'])
+    xg = float(np.nansum(events_df['xg'].to_numpy()[shots]))
+
+    # Paslar
+    passes = team & (types == TYPE_IDS['Pass'])
+    successful_passes = passes & (outcome == MISSING)
+    pass_accuracy = (_count(successful_passes) / _count(passes) * 100) if passes.any() else 0
+
+    # Top hakimiyeti (olaylar bazında yaklaşık)
+    total_events = len(events_df)
+    possession = (_count(team) / total_events * 100) if total_events > 0 else 0
+
+    return {
+        'shots': _count(shots),
+        'goals': _count(goals),
+        'xg': xg,
+        'passes': _count(passes),
+        'pass_accuracy': pass_accuracy,
+        'possession': possession,
+        'tackles': _count(team & (types == TYPE_IDS['Duel'])),
+        'interceptions': _count(team & (types == TYPE_IDS['Interception'])),
+    }
+
+
+def calculate_attacking_metrics(events_df, team_name):
+    """Ofansif metrikleri hesapla"""
+    events_df, team, types = _coded(events_df, team_name)
+    shot_mask = team & (types == TYPE_IDS['Shot'])
+    shots = events_df[shot_mask]
+
+    outcome = shots['outcome_id'].to_numpy()
+    xg = np.nan_to_num(shots['xg'].to_numpy())
+    total_shots = len(shots)
+    total_xg = float(xg.sum())
+
+    goals = _count(outcome == OUTCOME_IDS['Goal'])
+    on_target = _count(np.isin(outcome, [OUTCOME_IDS['Goal'], OUTCOME_IDS['Saved']]))
+    box_shots = _count(shots['x'].to_numpy() >= 102)
+
+    metrics = {
+        'Total Shots': total_shots,
+        'Shots on Target': on_target,
+        'Goals': goals,
+        'xG': total_xg,
+        'xG per Shot': total_xg / total_shots if total_shots > 0 else 0,
+        'Conversion Rate (%)': (goals / total_shots * 100) if total_shots > 0 else 0,
+        'Shot Accuracy (%)': (on_target / total_shots * 100) if total_shots > 0 else 0,
+        'Big Chances': _count(xg > 0.3),
+        'Box Shots': box_shots,
+        'Outside Box Shots': total_shots - box_shots,
+        'xG Overperformance': goals - total_xg
+    }
+
+    return metrics, shots
+
+
+def calculate_passing_metrics(events_df, team_name):
+    """Paslaşma metrikleri hesapla"""
+    events_df, team, types = _coded(events_df, team_name)
+
+    # Sadece recipient bilgisi olan pasları say (tutarlılık için)
+    passes = events_df[team & (types == TYPE_IDS['Pass']) & (events_df['recipient_id'].to_numpy() >= 0)]
+
+    x, end_x, end_y = (passes[c].to_numpy() for c in ('x', 'end_x', 'end_y'))
+    length = np.nan_to_num(passes['length'].to_numpy())
+    successful = passes['outcome_id'].to_numpy() == MISSING
+    long_passes = length >= 30
+    total = len(passes)
+
+    metrics = {
+        'Total Passes': total,
+        'Completed Passes': _count(successful),
+        'Pass Accuracy (%)': (_count(successful) / total * 100) if total > 0 else 0,
+        'Progressive Passes': _count(end_x - x >= 10),  # 10m+ ileri
+        'Final Third Passes': _count(x >= 80),
+        'Penalty Area Passes': _count((end_x >= 102) & (end_y >= 18) & (end_y <= 62)),
+        'Long Passes (30m+)': _count(long_passes),
+        'Long Pass Accuracy (%)': (
+            _count(long_passes & successful) / _count(long_passes) * 100 if long_passes.any() else 0
+        ),
+        'Avg Pass Length (m)': float(length.mean()) if total > 0 else 0
+    }
+
+    return metrics
+
+
+def calculate_defensive_metrics(events_df, team_name):
+    """Defansif metrikleri hesapla"""
+    events_df, team, types = _coded(events_df, team_name)
+
+    # Defensive actions
+    tackles = _count(team & (types == TYPE_IDS['Duel']))
+    interceptions = _count(team & (types == TYPE_IDS['Interception']))
+    blocks = _count(team & (types == TYPE_IDS['Block']))
+
+    # PPDA calculation (opponent passes per defensive action)
+    opponent_passes = _count(~team & (types == TYPE_IDS['Pass']))
+
+    defensive_actions = tackles + interceptions + blocks
+    ppda = opponent_passes / defensive_actions if defensive_actions > 0 else 0
+
+    metrics = {
+        'Tackles': tackles,
+        'Interceptions': interceptions,
+        'Blocks': blocks,
+        'Clearances': _count(team & (types == TYPE_IDS['Clearance'])),
+        'Pressures': _count(team & (types == TYPE_IDS['Pressure'])),
+        'Total Defensive Actions': defensive_actions,
+        'PPDA': ppda,
+        'Recoveries': _count(team & (types == TYPE_IDS['Ball Recovery']))
+    }
+
+    return metrics
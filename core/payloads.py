@@ -0,0 +1,291 @@
+"""
+StatsBomb Chart Payloads
+Tarayıcı tarafında çizim için kompakt JSON veri paketleri ve Vega-Lite şablonları
+
+Sunucu PNG üretmek yerine sadece kolon dizilerini gönderir, çizim (zoom, hover dahil)
+tarayıcıda yapılır. Veri hazırlığı matplotlib yolu ile aynı fonksiyonları kullanır.
+"""
+
+import numpy as np
+
+from core.metrics import player_names
+from core.plots import shot_data, pass_network_data, pass_diagram_data, node_passes
+
+PITCH_LENGTH = 120
+PITCH_WIDTH = 80
+
+CHART_WIDTH = 600
+CHART_HEIGHT = 406  # 124 x 84 saha oranı
+
+PITCH_COLOR = '#1e3a1e'
+BACKGROUND_COLOR = '#0e1117'
+
+
+def _rounded(values, digits=1):
+    """Koordinatları yuvarla (payload boyutunu küçültür)"""
+    return [round(float(v), digits) for v in values]
+
+
+def shot_map_payload(events_df, team_name):
+    """Şut haritası verisi: kolon dizileri"""
+    shots = shot_data(events_df, team_name)
+
+    if len(shots) == 0:
+        return None
+
+    player = player_names(shots['player_id'].to_numpy(), shots['player'].to_numpy())
+
+    return {
+        'chart': 'shot_map',
+        'team': team_name,
+        'x': _rounded(shots['x']),
+        'y': _rounded(shots['y']),
+        'xg': _rounded(shots['xg'], 3),
+        'outcome': shots['outcome'].tolist(),
+        'player': player.tolist(),
+        'minute': shots['minute'].astype(int).tolist(),
+    }
+
+
+def pass_network_payload(events_df, team_name, min_passes=2, on_debug=None):
+    """Paslaşma ağı verisi: düğüm ve kenar dizileri (düğümler player_id, kenarlar düğüm index'i ile)"""
+    network = pass_network_data(events_df, team_name, min_passes, on_debug)
+
+    if network is None:
+        return None
+
+    pass_counts, avg_positions = network
+    player_ids = avg_positions.index.tolist()
+    node_index = {player_id: i for i, player_id in enumerate(player_ids)}
+
+    edges = pass_counts[pass_counts['from_id'].isin(node_index) & pass_counts['to_id'].isin(node_index)]
+
+    return {
+        'chart': 'pass_network',
+        'team': team_name,
+        'node_name': avg_positions['player'].tolist(),
+        'node_x': _rounded(avg_positions['x']),
+        'node_y': _rounded(avg_positions['y']),
+        # Oyuncu başına toplam bağlantı sayısı (matplotlib'deki nokta boyutu ile aynı)
+        'node_passes': node_passes(edges, player_ids),
+        'edge_from': [node_index[p] for p in edges['from_id']],
+        'edge_to': [node_index[p] for p in edges['to_id']],
+        'edge_count': edges['count'].astype(int).tolist(),
+    }
+
+
+def pass_diagram_payload(events_df, selected_team, passer, receiver, is_home_team):
+    """Pas diyagramı verisi: başlangıç/bitiş koordinatları"""
+    player_passes = pass_diagram_data(events_df, selected_team, passer, receiver, is_home_team)
+
+    if len(player_passes) == 0:
+        return None
+
+    starts = np.array([p['start'] for p in player_passes])
+    ends = np.array([p['end'] for p in player_passes])
+
+    return {
+        'chart': 'pass_diagram',
+        'team': selected_team,
+        'passer': passer,
+        'receiver': receiver,
+        'x': _rounded(starts[:, 0]),
+        'y': _rounded(starts[:, 1]),
+        'end_x': _rounded(ends[:, 0]),
+        'end_y': _rounded(ends[:, 1]),
+        'successful': [int(p['successful']) for p in player_passes],
+        'period': [int(p['period']) for p in player_passes],
+    }
+
+
+def _pitch_segments():
+    """Saha çizgileri (x, y, x2, y2) - draw_pitch ile aynı ölçüler"""
+    L, W = PITCH_LENGTH, PITCH_WIDTH
+    segments = [
+        (0, 0, 0, W), (0, W, L, W), (L, W, L, 0), (L, 0, 0, 0),
+        (L / 2, 0, L / 2, W),
+    ]
+    # Ceza sahaları ve kale alanları (x0, y0, x1, y1)
+    for x0, y0, x1, y1 in ((0, 18, 18, 62), (102, 18, 120, 62), (0, 30, 6, 50), (114, 30, 120, 50)):
+        segments += [(x0, y0, x1, y0), (x1, y0, x1, y1), (x1, y1, x0, y1), (x0, y1, x0, y0)]
+    # Orta daire (çokgen yaklaşımı)
+    angles = np.linspace(0, 2 * np.pi, 33)
+    cx = L / 2 + 9.15 * np.cos(angles)
+    cy = W / 2 + 9.15 * np.sin(angles)
+    segments += list(zip(cx[:-1], cy[:-1], cx[1:], cy[1:]))
+
+    return [
+        {'x': round(float(a), 2), 'y': round(float(b), 2), 'x2': round(float(c), 2), 'y2': round(float(d), 2)}
+        for a, b, c, d in segments
+    ]
+
+
+def _pitch_layers():
+    """Saha zemini ve çizgileri için Vega-Lite katmanları"""
+    return [
+        {
+            'data': {'values': [{'x': 0, 'y': 0, 'x2': PITCH_LENGTH, 'y2': PITCH_WIDTH}]},
+            'mark': {'type': 'rect', 'color': PITCH_COLOR},
+            'encoding': {'x': _position('x', 'x'), 'x2': {'field': 'x2'},
+                         'y': _position('y', 'y'), 'y2': {'field': 'y2'}},
+        },
+        {
+            'data': {'values': _pitch_segments()},
+            'mark': {'type': 'rule', 'color': 'white', 'strokeWidth': 1.5},
+            'encoding': {'x': _position('x', 'x'), 'x2': {'field': 'x2'},
+                         'y': _position('y', 'y'), 'y2': {'field': 'y2'}},
+        },
+        {
+            'data': {'values': [{'x': 12, 'y': 40}, {'x': 108, 'y': 40}]},
+            'mark': {'type': 'point', 'filled': True, 'color': 'white', 'size': 15},
+            'encoding': {'x': _position('x', 'x'), 'y': _position('y', 'y')},
+        },
+    ]
+
+
+def _position(field, axis):
+    """Saha ölçeğinde x/y encoding'i"""
+    limit = PITCH_LENGTH if axis == 'x' else PITCH_WIDTH
+    return {'field': field, 'type': 'quantitative', 'axis': None,
+            'scale': {'domain': [-2, limit + 2], 'nice': False, 'zero': False}}
+
+
+# Sürükle/zoom için ölçek bağlama
+_ZOOM_PARAM = {'name': 'zoom', 'select': 'interval', 'bind': 'scales'}
+
+
+def _shot_map_layers(payload):
+    fields = ['x', 'y', 'xg', 'outcome', 'player', 'minute']
+    return [{
+        'data': {'values': [{k: payload[k] for k in fields}]},
+        'transform': [{'flatten': fields},
+                      {'calculate': "datum.outcome == 'Goal' ? 'Goal' : 'No Goal'", 'as': 'result'}],
+        'params': [_ZOOM_PARAM],
+        'mark': {'type': 'point', 'filled': True, 'stroke': 'white', 'strokeWidth': 1.5},
+        'encoding': {
+            'x': _position('x', 'x'),
+            'y': _position('y', 'y'),
+            'size': {'field': 'xg', 'type': 'quantitative', 'scale': {'domain': [0, 1], 'range': [40, 1000]},
+                     'legend': None},
+            'color': {'field': 'result', 'type': 'nominal',
+                      'scale': {'domain': ['Goal', 'No Goal'], 'range': ['lime', 'red']},
+                      'legend': {'title': None, 'orient': 'top-left', 'labelColor': 'white'}},
+            'shape': {'field': 'result', 'type': 'nominal',
+                      'scale': {'domain': ['Goal', 'No Goal'], 'range': ['diamond', 'circle']}, 'legend': None},
+            'tooltip': [{'field': 'player'}, {'field': 'minute', 'title': 'Minute'},
+                        {'field': 'xg', 'title': 'xG', 'format': '.2f'}, {'field': 'outcome'}],
+        },
+    }], f"{payload['team']} - Shot Map"
+
+
+def _pass_network_layers(payload):
+    node_fields = ['node_name', 'node_x', 'node_y', 'node_passes']
+    edge_fields = ['edge_from', 'edge_to', 'edge_count']
+    datum = [{k: payload[k] for k in node_fields + edge_fields}]
+    return [
+        {
+            'data': {'values': datum},
+            'transform': [
+                {'flatten': edge_fields},
+                {'calculate': 'datum.node_x[datum.edge_from]', 'as': 'x'},
+                {'calculate': 'datum.node_y[datum.edge_from]', 'as': 'y'},
+                {'calculate': 'datum.node_x[datum.edge_to]', 'as': 'x2'},
+                {'calculate': 'datum.node_y[datum.edge_to]', 'as': 'y2'},
+                {'calculate': 'datum.node_name[datum.edge_from]', 'as': 'from'},
+                {'calculate': 'datum.node_name[datum.edge_to]', 'as': 'to'},
+            ],
+            'mark': {'type': 'rule', 'color': 'cyan', 'opacity': 0.5},
+            'encoding': {
+                'x': _position('x', 'x'), 'y': _position('y', 'y'),
+                'x2': {'field': 'x2'}, 'y2': {'field': 'y2'},
+                'strokeWidth': {'field': 'edge_count', 'type': 'quantitative',
+                                'scale': {'range': [0.5, 6]}, 'legend': None},
+                'tooltip': [{'field': 'from'}, {'field': 'to'}, {'field': 'edge_count', 'title': 'Passes'}],
+            },
+        },
+        {
+            'data': {'values': datum},
+            'transform': [{'flatten': node_fields}],
+            'params': [_ZOOM_PARAM],
+            'mark': {'type': 'point', 'filled': True, 'color': 'yellow', 'opacity': 0.8,
+                     'stroke': 'white', 'strokeWidth': 1.5},
+            'encoding': {
+                'x': _position('node_x', 'x'), 'y': _position('node_y', 'y'),
+                'size': {'field': 'node_passes', 'type': 'quantitative', 'scale': {'range': [30, 600]},
+                         'legend': None},
+                'tooltip': [{'field': 'node_name', 'title': 'Player'},
+                            {'field': 'node_passes', 'title': 'Passes'}],
+            },
+        },
+        {
+            'data': {'values': datum},
+            'transform': [{'flatten': node_fields},
+                          {'calculate': "split(datum.node_name, ' ')[length(split(datum.node_name, ' ')) - 1]",
+                           'as': 'label'}],
+            'mark': {'type': 'text', 'color': 'white', 'fontWeight': 'bold', 'dy': 14},
+            'encoding': {'x': _position('node_x', 'x'), 'y': _position('node_y', 'y'),
+                         'text': {'field': 'label'}},
+        },
+    ], f"{payload['team']} - Passing Network"
+
+
+def _pass_diagram_layers(payload):
+    fields = ['x', 'y', 'end_x', 'end_y', 'successful', 'period']
+    datum = [{k: payload[k] for k in fields}]
+    transform = [{'flatten': fields},
+                 {'calculate': "datum.successful ? 'Successful' : 'Unsuccessful'", 'as': 'result'},
+                 {'calculate': "datum.period == 1 ? '1st Half' : '2nd Half'", 'as': 'half'}]
+    color = {'field': 'result', 'type': 'nominal',
+             'scale': {'domain': ['Successful', 'Unsuccessful'], 'range': ['lime', 'red']},
+             'legend': {'title': None, 'orient': 'top-left', 'labelColor': 'white'}}
+    return [
+        {
+            'data': {'values': datum}, 'transform': transform,
+            'mark': {'type': 'rule', 'strokeWidth': 2, 'opacity': 0.6},
+            'encoding': {'x': _position('x', 'x'), 'y': _position('y', 'y'),
+                         'x2': {'field': 'end_x'}, 'y2': {'field': 'end_y'}, 'color': color},
+        },
+        {
+            'data': {'values': datum}, 'transform': transform,
+            'params': [_ZOOM_PARAM],
+            'mark': {'type': 'point', 'filled': True, 'size': 70, 'opacity': 0.8},
+            'encoding': {
+                'x': _position('x', 'x'), 'y': _position('y', 'y'), 'color': color,
+                'shape': {'field': 'half', 'type': 'nominal',
+                          'scale': {'domain': ['1st Half', '2nd Half'], 'range': ['circle', 'square']},
+                          'legend': {'title': None, 'orient': 'top-right', 'labelColor': 'white'}},
+                'tooltip': [{'field': 'half'}, {'field': 'result'}],
+            },
+        },
+        {
+            'data': {'values': datum},
+            'transform': transform + [
+                # Ok ucu pas yönüne dönsün (ekranda y ekseni ters)
+                {'calculate': '-atan2(datum.end_y - datum.y, datum.end_x - datum.x) * 180 / PI', 'as': 'angle'}
+            ],
+            'mark': {'type': 'point', 'shape': 'triangle-right', 'filled': True, 'size': 40},
+            'encoding': {'x': _position('end_x', 'x'), 'y': _position('end_y', 'y'), 'color': color,
+                         'angle': {'field': 'angle', 'type': 'quantitative', 'scale': None}},
+        },
+    ], f"{payload['passer'].split()[-1]} → {payload['receiver'].split()[-1]} ({len(payload['x'])} passes)"
+
+
+_LAYER_BUILDERS = {
+    'shot_map': _shot_map_layers,
+    'pass_network': _pass_network_layers,
+    'pass_diagram': _pass_diagram_layers,
+}
+
+
+def vega_lite_spec(payload):
+    """Payload için Vega-Lite şablonu (st.vega_lite_chart ile tarayıcıda çizilir)"""
+    layers, title = _LAYER_BUILDERS[payload['chart']](payload)
+    return {
+        '$schema': 'https://vega.github.io/schema/vega-lite/v5.json',
+        'width': CHART_WIDTH,
+        'height': CHART_HEIGHT,
+        'background': BACKGROUND_COLOR,
+        'title': {'text': title, 'color': 'white', 'fontSize': 16},
+        'config': {'view': {'stroke': None}},
+        'layer': _pitch_layers() + layers,
+    }
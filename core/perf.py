@@ -0,0 +1,184 @@
+"""
+StatsBomb Performance Spans
+Sayfa rerun'ları için hafif zamanlama katmanı
+
+Her rerun bir kök span'dır (sayfa); içinde load / compute / render / transfer
+aşamaları iç içe span'lar olarak ölçülür. Aktif span contextvars ile tutulur,
+bu yüzden eşzamanlı oturumlar birbirine karışmaz. STATSBOMB_PERF=0 iken veya
+aktif bir sayfa izi yokken span() paylaşılan boş bir context manager döndürür
+(neredeyse sıfır maliyet).
+
+Dosyaya loglama isteğe bağlıdır: STATSBOMB_PERF_LOG=<dosya> (ya da 1 →
+data/cache/perf/spans.jsonl) verilirse biten her rerun'ın span'ları JSON
+satırları olarak eklenir. Dosya PERF_LOG_MAX_BYTES'ı aşınca <dosya>.1'e taşınır
+(tek yedek), böylece disk kullanımı sınırlı kalır. benchmarks/perf_report.py bu
+dosyadan gecikme histogramları üretir.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+
+from core.loaders import DATA_DIR
+
+STAGES = ('load', 'compute', 'render', 'transfer')
+
+ENABLED = os.environ.get("STATSBOMB_PERF", "1") != "0"
+DEFAULT_PERF_LOG = os.path.join(DATA_DIR, "cache", "perf", "spans.jsonl")
+PERF_LOG = os.environ.get("STATSBOMB_PERF_LOG", "")
+if PERF_LOG == "1":
+    PERF_LOG = DEFAULT_PERF_LOG
+# Log dosyası bu boyutu aşınca döndürülür
+PERF_LOG_MAX_BYTES = 20 * 1024 * 1024
+
+_current = contextvars.ContextVar("statsbomb_perf_span", default=None)
+_log_lock = threading.Lock()
+
+
+class Span:
+    """Zamanlanmış kod bloğu; çocuk span'ları ağaç olarak tutar"""
+
+    __slots__ = ('name', 'stage', 'start', 'duration', 'children', 'parent', '_token')
+
+    def __init__(self, name, stage):
+        self.name = name
+        self.stage = stage
+        self.start = None
+        self.duration = None
+        self.children = []
+        self.parent = None
+        self._token = None
+
+    def __enter__(self):
+        self.parent = _current.get()
+        self._token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        _current.reset(self._token)
+        if self.parent is not None:
+            self.parent.children.append(self)
+        return False
+
+    @property
+    def ms(self):
+        return (self.duration or 0.0) * 1000
+
+    def walk(self, depth=0):
+        """(derinlik, span) çiftleri, önce ebeveyn"""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def stage_totals(self):
+        """Aşama → toplam süre (ms); iç içe aynı aşama iki kez sayılmaz"""
+        totals = {}
+        for _, span in self.walk():
+            if span.stage in STAGES and (span.parent is None or span.parent.stage != span.stage):
+                totals[span.stage] = totals.get(span.stage, 0.0) + span.ms
+        return totals
+
+
+class _NoopSpan:
+    """Kapalı modda kullanılan paylaşılan boş span"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name, stage):
+    """Aktif sayfa izi içinde bir aşamayı zamanla"""
+    if not ENABLED or _current.get() is None:
+        return _NOOP
+    return Span(name, stage)
+
+
+class PageTrace(Span):
+    """Bir sayfa rerun'ının kök span'ı; çıkışta log satırlarını yazar"""
+
+    __slots__ = ('page', 'trace_id')
+
+    def __init__(self, page):
+        super().__init__(page, 'page')
+        self.page = page
+        self.trace_id = uuid.uuid4().hex[:16]
+
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        if PERF_LOG:
+            write_trace(self)
+        return False
+
+
+def trace_page(page):
+    """Sayfa rerun'ını izle: with trace_page("Home") as trace: main()"""
+    if not ENABLED:
+        return _NOOP
+    return PageTrace(page)
+
+
+def trace_records(trace):
+    """İzdeki span'lar düz kayıtlar olarak (log formatı)"""
+    ts = time.time()
+    for depth, s in trace.walk():
+        yield {
+            'ts': round(ts, 3),
+            'trace_id': trace.trace_id,
+            'page': trace.page,
+            'span': s.name,
+            'stage': s.stage,
+            'parent': s.parent.name if s.parent is not None and depth > 0 else None,
+            'depth': depth,
+            'ms': round(s.ms, 3),
+        }
+
+
+def write_trace(trace, path=None):
+    """İzi JSON satırları olarak log dosyasına ekle (dosya büyüdüyse önce <dosya>.1'e döndür)"""
+    path = path or PERF_LOG
+    lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in trace_records(trace))
+    try:
+        with _log_lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if os.path.exists(path) and os.path.getsize(path) >= PERF_LOG_MAX_BYTES:
+                os.replace(path, f"{path}.1")
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+    except OSError:
+        # Loglama sayfayı asla bozmamalı
+        pass
+
+
+def show_perf_panel(trace):
+    """Sayfanın altında katlanabilir performans paneli (Streamlit)"""
+    if not isinstance(trace, PageTrace):
+        return
+
+    import streamlit as st
+
+    with st.expander(f"⏱️ Performance: {trace.ms:.0f} ms", expanded=False):
+        totals = trace.stage_totals()
+        cols = st.columns(len(STAGES))
+        for col, stage in zip(cols, STAGES):
+            col.metric(stage.capitalize(), f"{totals.get(stage, 0.0):.0f} ms")
+
+        # Markdown tablo: panel için pandas yüklenmez (hafif sayfalar hafif kalır)
+        rows = ["| Span | Stage | ms | % of rerun |", "|---|---|---:|---:|"]
+        for depth, s in trace.walk():
+            share = s.ms / trace.ms * 100 if trace.ms else 0.0
+            indent = "&nbsp;&nbsp;" * depth + ("└ " if depth else "")
+            rows.append(f"| {indent}{s.name} | {s.stage} | {s.ms:.1f} | {share:.1f} |")
+        st.markdown("\n".join(rows))
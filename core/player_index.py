@@ -0,0 +1,268 @@
+"""
+StatsBomb Player Index
+Kadrolardan oyuncu ve takım → maç ters indeksi
+
+Her kadro dosyası (data/lineups/<id>.json) bir kez okunur ve oyuncunun o maçtaki
+görünümü (Appearance) çıkarılır: takım, forma numarası, ilk 11'de başlayıp
+başlamadığı, oynadığı dakikalar, pozisyonları ve kartları. Bunlardan
+player_id → maçlar ve team_id → maçlar indeksleri kurulur; oyuncu adları
+aksansız küçük harfli kelimelere bölünüp sıralı listede tutulur, ön ek
+araması bisect ile yapılır.
+
+İndeks data/cache/index/players.json dosyasında saklanır. update() yalnızca
+dosya sürümü (core.loaders.file_version) değişen, yeni gelen veya silinen
+kadroları işler; DataWatcher değişen maçları notify_changed() ile bildirir.
+
+Dakikalar yalnızca kadrodan hesaplanır (core.intervals.MatchIntervals.from_lineups):
+"to" boş olan son görev maç sonuna (kadrodaki en geç saat, en az normal süre)
+kadar sayılır.
+"""
+
+import bisect
+import glob
+import json
+import os
+import threading
+import unicodedata
+
+import pandas as pd
+
+from core.intervals import MatchIntervals
+from core.loaders import DATA_DIR, RAW_SUFFIXES, file_version, lineups_path, read_json
+
+INDEX_PATH = os.path.join(DATA_DIR, "cache", "index", "players.json")
+
+
+def normalize(text):
+    """Arama için aksansız küçük harf ("Schäfer" → "schafer")"""
+    decomposed = unicodedata.normalize('NFKD', text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+class Appearance:
+    """Bir oyuncunun tek maçtaki kadro kaydı"""
+
+    __slots__ = ('match_id', 'player_id', 'team_id', 'jersey_number', 'started', 'minutes',
+                 'positions', 'cards')
+
+    def __init__(self, match_id, player_id, team_id, jersey_number, started, minutes, positions, cards):
+        self.match_id = match_id
+        self.player_id = player_id
+        self.team_id = team_id
+        self.jersey_number = jersey_number
+        self.started = started
+        self.minutes = minutes
+        self.positions = positions
+        self.cards = cards
+
+    def as_list(self):
+        return [self.match_id, self.player_id, self.team_id, self.jersey_number, self.started,
+                self.minutes, self.positions, self.cards]
+
+
+def lineup_appearances(match_id, lineups):
+    """Kadro JSON'u → (Appearance listesi, {player_id: (ad, takma ad)}, {team_id: takım adı})"""
+    teams, players, appearances = {}, {}, []
+    minutes = MatchIntervals.from_lineups(match_id, lineups).minutes_played()
+    for team in lineups:
+        teams[team['team_id']] = team['team_name']
+        for p in team.get('lineup', []):
+            spells = p.get('positions') or []
+            positions = list(dict.fromkeys(s.get('position') for s in spells if s.get('position')))
+            cards = [[c.get('time'), c.get('card_type')] for c in p.get('cards') or []]
+            players[p['player_id']] = (p['player_name'], p.get('player_nickname'))
+            appearances.append(Appearance(
+                match_id, p['player_id'], team['team_id'], p.get('jersey_number'),
+                any(s.get('start_reason') == 'Starting XI' for s in spells),
+                round(minutes.get(p['player_id'], 0.0), 1), positions, cards,
+            ))
+    return appearances, players, teams
+
+
+def local_lineup_ids():
+    """data/lineups altındaki (sıkıştırılmış dahil) maç ID'leri"""
+    ids = set()
+    for suffix in RAW_SUFFIXES:
+        for path in glob.glob(os.path.join(DATA_DIR, "lineups", f"*.json{suffix}")):
+            stem = os.path.basename(path).split(".")[0]
+            if stem.isdigit():
+                ids.add(int(stem))
+    return sorted(ids)
+
+
+class PlayerIndex:
+    """player_id / team_id → maç görünümleri ve ad ön eki araması"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.versions = {}       # match_id → kadro dosyası sürümü (repr)
+        self.by_match = {}       # match_id → [Appearance]
+        self.players = {}        # player_id → (ad, takma ad)
+        self.teams = {}          # team_id → takım adı
+        self._lock = threading.RLock()
+        self._reindex()
+        if path and os.path.exists(path):
+            self._load()
+
+    # --- Kalıcılık ---
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.versions = {int(k): v for k, v in data['versions'].items()}
+        self.players = {int(k): tuple(v) for k, v in data['players'].items()}
+        self.teams = {int(k): v for k, v in data['teams'].items()}
+        self.by_match = {
+            int(k): [Appearance(*row) for row in rows] for k, rows in data['appearances'].items()
+        }
+        self._reindex()
+
+    def save(self):
+        """İndeksi diske yaz (.partial + os.replace)"""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                'versions': self.versions,
+                'players': self.players,
+                'teams': self.teams,
+                'appearances': {m: [a.as_list() for a in rows] for m, rows in self.by_match.items()},
+            }
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            partial = f"{self.path}.{os.getpid()}.{threading.get_ident()}.partial"
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(partial, self.path)
+
+    # --- Güncelleme ---
+
+    def _reindex(self):
+        """Görünümlerden ters indeksleri ve sıralı ad kelimelerini yeniden kur"""
+        by_player, by_team = {}, {}
+        for match_id in sorted(self.by_match):
+            for a in self.by_match[match_id]:
+                by_player.setdefault(a.player_id, []).append(a)
+                by_team.setdefault(a.team_id, set()).add(match_id)
+        self.by_player = by_player
+        self.by_team = {team_id: sorted(ids) for team_id, ids in by_team.items()}
+
+        tokens = set()
+        self._words = {}
+        for player_id in by_player:
+            name, nickname = self.players.get(player_id, ("", None))
+            words = set(normalize(name).split()) | set(normalize(nickname).split())
+            self._words[player_id] = words
+            tokens.update((word, player_id) for word in words)
+        self._tokens = sorted(tokens)
+
+    def update(self, match_ids=None):
+        """Değişen/yeni/silinen kadroları işle; güncellenen maç sayısı
+
+        match_ids verilmezse data/lineups altındaki tüm dosyalar taranır ve
+        dosyası kalmayan maçlar indeksten çıkarılır.
+        """
+        with self._lock:
+            full_scan = match_ids is None
+            if full_scan:
+                match_ids = local_lineup_ids()
+                removed = set(self.by_match) - set(match_ids)
+            else:
+                removed = set()
+
+            changed = 0
+            for match_id in match_ids:
+                version = file_version(lineups_path(match_id))
+                if version is None:
+                    removed.add(match_id)
+                    continue
+                if self.versions.get(match_id) == repr(version):
+                    continue
+                appearances, players, teams = lineup_appearances(match_id, read_json(lineups_path(match_id)))
+                self.by_match[match_id] = appearances
+                self.players.update(players)
+                self.teams.update(teams)
+                self.versions[match_id] = repr(version)
+                changed += 1
+
+            for match_id in removed & set(self.by_match):
+                del self.by_match[match_id]
+                self.versions.pop(match_id, None)
+                changed += 1
+
+            if changed:
+                self._reindex()
+                self.save()
+            return changed
+
+    # --- Sorgular ---
+
+    def search(self, text, limit=20):
+        """Ad ön eki araması → [(player_id, ad, maç sayısı)] (en çok maçı olan önce)
+
+        Her kelime oyuncu adındaki bir kelimenin ön eki olmalı ("flo wir" → Florian Wirtz).
+        """
+        words = normalize(text).split()
+        if not words:
+            return []
+        first, rest = words[0], words[1:]
+        start = bisect.bisect_left(self._tokens, (first,))
+        found = set()
+        for word, player_id in self._tokens[start:]:
+            if not word.startswith(first):
+                break
+            found.add(player_id)
+        matched = [
+            player_id for player_id in found
+            if all(any(w.startswith(prefix) for w in self._words[player_id]) for prefix in rest)
+        ]
+        matched.sort(key=lambda p: (-len(self.by_player[p]), self.players[p][0]))
+        return [(p, self.players[p][0], len(self.by_player[p])) for p in matched[:limit]]
+
+    def appearances(self, player_id, started=None):
+        """Oyuncunun maç görünümleri (maç ID sırasıyla); started=True → yalnızca ilk 11"""
+        rows = self.by_player.get(player_id, [])
+        if started is not None:
+            rows = [a for a in rows if a.started == started]
+        return rows
+
+    def matches(self, player_id, started=None):
+        """Oyuncunun oynadığı (started=True → ilk 11'de başladığı) maç ID'leri"""
+        return [a.match_id for a in self.appearances(player_id, started)]
+
+    def team_matches(self, team_id):
+        return self.by_team.get(team_id, [])
+
+    def player_frame(self, player_id, started=None):
+        """Oyuncunun görünümleri tablo olarak"""
+        rows = self.appearances(player_id, started)
+        return pd.DataFrame({
+            'match_id': [a.match_id for a in rows],
+            'team': [self.teams.get(a.team_id) for a in rows],
+            'jersey_number': [a.jersey_number for a in rows],
+            'started': [a.started for a in rows],
+            'minutes': [a.minutes for a in rows],
+            'positions': [", ".join(a.positions) for a in rows],
+            'cards': [", ".join(f"{card} ({time})" for time, card in a.cards) for a in rows],
+        })
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_player_index(update=True):
+    """Süreç genelinde tek indeks; update=True → önce değişen kadroları işle"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = PlayerIndex()
+        index = _index
+    if update:
+        index.update()
+    return index
+
+
+def notify_changed(match_ids):
+    """DataWatcher'dan: yüklü indeks varsa değişen maçların kadrolarını yeniden işle"""
+    if _index is not None and match_ids:
+        _index.update(match_ids)
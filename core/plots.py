@@ -0,0 +1,340 @@
+"""
+StatsBomb Plotting
+Saha, şut haritası, paslaşma ağı ve pas diyagramı çizimleri (Streamlit olmadan)
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from core.events import MISSING, TYPE_IDS, with_codes
+from core.metrics import player_names, team_code
+from core.lazy import lazy_module
+
+# matplotlib yalnızca statik grafik çizildiğinde yüklenir (veri fonksiyonları ve
+# tarayıcı payload'ları ona ihtiyaç duymaz)
+plt = lazy_module("matplotlib.pyplot")
+patches = lazy_module("matplotlib.patches")
+lines = lazy_module("matplotlib.lines")
+
+
+def draw_pitch(ax, pitch_color='#1e3a1e', line_color='white'):
+    """Futbol sahası çiz"""
+    pitch_length = 120
+    pitch_width = 80
+    
+    # Saha zemini
+    ax.add_patch(patches.Rectangle((0, 0), pitch_length, pitch_width, 
+                           facecolor=pitch_color, edgecolor=line_color, linewidth=2))
+    
+    # Kenar çizgileri
+    ax.plot([0, 0], [0, pitch_width], color=line_color, linewidth=2)
+    ax.plot([0, pitch_length], [pitch_width, pitch_width], color=line_color, linewidth=2)
+    ax.plot([pitch_length, pitch_length], [pitch_width, 0], color=line_color, linewidth=2)
+    ax.plot([pitch_length, 0], [0, 0], color=line_color, linewidth=2)
+    
+    # Orta çizgi
+    ax.plot([pitch_length/2, pitch_length/2], [0, pitch_width], color=line_color, linewidth=2)
+    
+    # Orta daire
+    center_circle = plt.Circle((pitch_length/2, pitch_width/2), 9.15, 
+                               color=line_color, fill=False, linewidth=2)
+    ax.add_patch(center_circle)
+    
+    # Sol ceza sahası
+    ax.add_patch(patches.Rectangle((0, 18), 18, 44, fill=False, edgecolor=line_color, linewidth=2))
+    ax.add_patch(patches.Rectangle((0, 30), 6, 20, fill=False, edgecolor=line_color, linewidth=2))
+    
+    # Sağ ceza sahası
+    ax.add_patch(patches.Rectangle((102, 18), 18, 44, fill=False, edgecolor=line_color, linewidth=2))
+    ax.add_patch(patches.Rectangle((114, 30), 6, 20, fill=False, edgecolor=line_color, linewidth=2))
+    
+    # Penaltı noktaları
+    ax.plot(12, 40, 'o', color=line_color, markersize=4)
+    ax.plot(108, 40, 'o', color=line_color, markersize=4)
+    
+    ax.set_xlim(-2, pitch_length + 2)
+    ax.set_ylim(-2, pitch_width + 2)
+    ax.axis('off')
+    ax.set_aspect('equal')
+
+def shot_data(events_df, team_name):
+    """Takımın şutları (x, y, xg, outcome kolonlarıyla)"""
+    events_df = with_codes(events_df)
+    shots = events_df[
+        (events_df['type_id'].to_numpy() == TYPE_IDS['Shot'])
+        & (events_df['team_id'].to_numpy() == team_code(events_df, team_name))
+    ].copy()
+
+    if len(shots) == 0:
+        return shots
+
+    # Şut detayları (x, y yüklemede düz kolon olarak eklendi)
+    shots['outcome'] = shots['outcome'].fillna('Unknown')
+    shots['xg'] = shots['xg'].fillna(0)
+
+    return shots
+
+def plot_shot_map(events_df, team_name):
+    """Şut haritası"""
+    shots = shot_data(events_df, team_name)
+    
+    if len(shots) == 0:
+        return None
+    
+    # Grafik
+    fig, ax = plt.subplots(figsize=(12, 8))
+    draw_pitch(ax)
+    
+    # Goller
+    goals = shots[shots['outcome'] == 'Goal']
+    # Gol olmayanlar
+    non_goals = shots[shots['outcome'] != 'Goal']
+    
+    # Şutları çiz (xG'ye göre boyut)
+    if len(non_goals) > 0:
+        scatter1 = ax.scatter(non_goals['x'], non_goals['y'], 
+                             s=non_goals['xg']*1000, c='red', alpha=0.6, 
+                             edgecolors='white', linewidths=2, label='No Goal')
+    
+    if len(goals) > 0:
+        scatter2 = ax.scatter(goals['x'], goals['y'], 
+                             s=goals['xg']*1000 + 200, c='lime', alpha=0.9, 
+                             edgecolors='white', linewidths=3, marker='*', label='Goal')
+    
+    ax.set_title(f'{team_name} - Shot Map', fontsize=16, color='white', pad=20)
+    ax.legend(loc='upper left', fontsize=12)
+    
+    fig.patch.set_facecolor('#0e1117')
+    return fig
+
+def pass_network_data(events_df, team_name, min_passes=2, on_debug=None):
+    """Paslaşma ağı verisi: (pas sayıları, oyuncuların ortalama pozisyonları)
+
+    Düğümler StatsBomb player_id ile tutulur; aynı adlı iki oyuncu ayrı kalır.
+    pas sayıları: from_id, to_id, from, to, count kolonları
+    pozisyonlar: player_id index'li, player, x, y kolonları (ilk pas sırasıyla)
+
+    on_debug: debug satırlarını göstermek için (tooltip, text) alan fonksiyon
+    """
+    events_df = with_codes(events_df)
+    passes = events_df[
+        (events_df['type_id'].to_numpy() == TYPE_IDS['Pass'])
+        & (events_df['team_id'].to_numpy() == team_code(events_df, team_name))
+    ]
+
+    # Debug bilgisi
+    if on_debug:
+        on_debug(f"How many times {team_name} attempted a pass",
+                 f"📊 Debug - Total passes for {team_name}: <strong>{len(passes)}</strong>")
+
+    # Başarılı paslar
+    successful_passes = passes[passes['outcome_id'].to_numpy() == MISSING]
+
+    if on_debug:
+        on_debug("Passes that reached a teammate",
+                 f"✅ Successful passes: <strong>{len(successful_passes)}</strong>")
+
+    if len(successful_passes) == 0:
+        return None
+
+    # Paslaşma çiftleri
+    passer_ids = successful_passes['player_id'].to_numpy()
+    recipient_ids = successful_passes['recipient_id'].to_numpy()
+    passer_names = player_names(passer_ids, successful_passes['player'].to_numpy())
+    paired = (passer_ids >= 0) & (recipient_ids >= 0)
+
+    if on_debug:
+        on_debug("All player-to-player passes found (e.g. Player A → Player B)",
+                 f"🔗 Pass pairs found: <strong>{int(np.count_nonzero(paired))}</strong>")
+
+    if not paired.any():
+        if on_debug:
+            on_debug(None, "⚠️ No valid pass pairs found")
+        return None
+
+    pairs = pd.DataFrame({
+        'from_id': passer_ids[paired],
+        'to_id': recipient_ids[paired],
+        'from': passer_names[paired],
+        'to': successful_passes['recipient'].to_numpy(dtype=object)[paired],
+    })
+    pass_counts = (pairs.groupby(['from_id', 'to_id'])
+                   .agg(**{'from': ('from', 'first'), 'to': ('to', 'first'), 'count': ('from', 'size')})
+                   .reset_index()
+                   .sort_values(['from', 'to'], kind='stable', ignore_index=True))
+
+    if on_debug:
+        on_debug("Grouped by player pairs (e.g. if A passed to B 5 times, this counts as 1 unique connection)",
+                 f"📊 Unique connections: <strong>{len(pass_counts)}</strong>")
+        on_debug(f"Only showing connections with at least {min_passes} passes between the same two players",
+                 f"🎯 After filtering (min {min_passes} passes): <strong>{len(pass_counts[pass_counts['count'] >= min_passes])}</strong>")
+
+    pass_counts = pass_counts[pass_counts['count'] >= min_passes].reset_index(drop=True)
+
+    if len(pass_counts) == 0:
+        return None
+
+    # Oyuncu pozisyonları: başarılı pasların başlangıç noktalarının ortalaması
+    located = (passer_ids >= 0) & successful_passes['x'].notna().to_numpy()
+    positions = pd.DataFrame({
+        'player_id': passer_ids[located],
+        'player': passer_names[located],
+        'x': successful_passes['x'].to_numpy()[located],
+        'y': successful_passes['y'].to_numpy()[located],
+    })
+    avg_positions = positions.groupby('player_id', sort=False).agg(
+        player=('player', 'first'), x=('x', 'mean'), y=('y', 'mean'))
+
+    if on_debug:
+        on_debug("Players shown on the network diagram",
+                 f"👥 Players with positions: <strong>{len(avg_positions)}</strong>")
+
+    return pass_counts, avg_positions
+
+def node_passes(pass_counts, player_ids):
+    """Oyuncu başına dahil olduğu bağlantılardaki pas sayısı (nokta boyutu)"""
+    from_ids, to_ids = pass_counts['from_id'].to_numpy(), pass_counts['to_id'].to_numpy()
+    counts = pass_counts['count'].to_numpy()
+    return [int(counts[(from_ids == p) | (to_ids == p)].sum()) for p in player_ids]
+
+def plot_pass_network(events_df, team_name, min_passes=2, on_debug=None):
+    """Paslaşma ağı"""
+    network = pass_network_data(events_df, team_name, min_passes, on_debug)
+
+    if network is None:
+        return None
+
+    pass_counts, avg_positions = network
+    positions = dict(zip(avg_positions.index, zip(avg_positions['x'], avg_positions['y'])))
+
+    # Grafik
+    fig, ax = plt.subplots(figsize=(14, 10))
+    draw_pitch(ax)
+
+    # Pasları çiz
+    for from_id, to_id, count in zip(pass_counts['from_id'], pass_counts['to_id'], pass_counts['count']):
+        if from_id in positions and to_id in positions:
+            x1, y1 = positions[from_id]
+            x2, y2 = positions[to_id]
+
+            ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
+                       arrowprops=dict(arrowstyle='->', color='cyan',
+                                     lw=count/5, alpha=0.5))
+
+    # Oyuncuları çiz
+    totals = node_passes(pass_counts, avg_positions.index)
+    for (x, y, player), total_passes in zip(avg_positions[['x', 'y', 'player']].itertuples(index=False), totals):
+        ax.scatter(x, y, c='yellow', s=total_passes*10,
+                  alpha=0.8, edgecolors='white', linewidths=2, zorder=3)
+        ax.text(x, y-3, player.split()[-1], ha='center',
+               fontsize=9, color='white', fontweight='bold', zorder=4)
+
+    ax.set_title(f'{team_name} - Passing Network', fontsize=16, color='white', pad=20)
+    fig.patch.set_facecolor('#0e1117')
+    return fig
+
+def pass_diagram_data(events_df, selected_team, passer, receiver, is_home_team):
+    """Belirli bir ikilinin pasları (koordinatlar atak yönüne göre normalize)"""
+    events_df = with_codes(events_df)
+    passes = events_df[
+        (events_df['type_id'].to_numpy() == TYPE_IDS['Pass'])
+        & (events_df['team_id'].to_numpy() == team_code(events_df, selected_team))
+    ]
+
+    # İkili oyuncu kodlarıyla seçilir; ad yalnızca koda çevirmek için karşılaştırılır
+    passers = player_names(passes['player_id'].to_numpy(), passes['player'].to_numpy()) == passer
+    receivers = passes['recipient'].to_numpy(dtype=object) == receiver
+    passes = passes[passers & receivers & passes['x'].notna().to_numpy() & passes['end_x'].notna().to_numpy()]
+
+    # Ev sahibi ilk yarıda, deplasman ikinci yarıda soldan sağa atak yapar; diğerleri çevrilir
+    period = passes['period'].to_numpy()
+    flip = (period == 1) != bool(is_home_team)
+    start_x, end_x = (np.where(flip, 120 - passes[c].to_numpy(), passes[c].to_numpy()) for c in ('x', 'end_x'))
+    start_y, end_y = (np.where(flip, 80 - passes[c].to_numpy(), passes[c].to_numpy()) for c in ('y', 'end_y'))
+    successful = passes['outcome_id'].to_numpy() == MISSING
+
+    return [
+        {
+            'start': (float(start_x[i]), float(start_y[i])),
+            'end': (float(end_x[i]), float(end_y[i])),
+            'successful': bool(successful[i]),
+            'period': int(period[i])
+        }
+        for i in range(len(passes))
+    ]
+
+def plot_pass_diagram(events_df, selected_team, passer, receiver, is_home_team):
+    """Belirli bir ikili için pas diyagramı çiz"""
+    player_passes = pass_diagram_data(events_df, selected_team, passer, receiver, is_home_team)
+    
+    if len(player_passes) == 0:
+        return None
+    
+    fig, ax = plt.subplots(figsize=(14, 10))
+    draw_pitch(ax)
+    
+    # Atak yönü göstergesi
+    # Koordinatları normalize ettik (her zaman soldan sağa göster)
+    # Ama deplasman takımı için text'i ters yaz
+    arrow_y = 75
+    
+    ax.annotate('', xy=(110, arrow_y), xytext=(10, arrow_y),
+               arrowprops=dict(arrowstyle='->', lw=4, color='yellow', alpha=0.7))
+    
+    if is_home_team:
+        ax.text(60, arrow_y + 3, f'{selected_team} ATTACKING DIRECTION →', 
+               ha='center', fontsize=14, color='yellow', fontweight='bold',
+               bbox=dict(boxstyle='round', facecolor='black', alpha=0.7))
+    else:
+        # Deplasman takımı - bilgi ver ama ok yönü aynı (koordinatlar normalize edildi)
+        ax.text(60, arrow_y + 3, f'{selected_team} ATTACKING DIRECTION → (normalized)', 
+               ha='center', fontsize=12, color='yellow', fontweight='bold',
+               bbox=dict(boxstyle='round', facecolor='black', alpha=0.7))
+    
+    for i, pass_info in enumerate(player_passes):
+        start = pass_info['start']
+        end = pass_info['end']
+        successful = pass_info['successful']
+        period = pass_info['period']
+        
+        color = 'lime' if successful else 'red'
+        alpha = 0.6
+        
+        arrow = patches.FancyArrowPatch(
+            (start[0], start[1]), (end[0], end[1]),
+            arrowstyle='->', mutation_scale=20,
+            color=color, alpha=alpha, linewidth=2
+        )
+        ax.add_patch(arrow)
+        
+        if period == 1:
+            ax.plot(start[0], start[1], 'o', color=color, markersize=8, alpha=0.8)
+        else:
+            ax.plot(start[0], start[1], 's', color=color, markersize=8, alpha=0.8)
+    
+    period_1_count = sum(1 for p in player_passes if p['period'] == 1)
+    period_2_count = sum(1 for p in player_passes if p['period'] == 2)
+    
+    ax.set_title(f'{passer.split()[-1]} → {receiver.split()[-1]} ({len(player_passes)} passes: {period_1_count} in 1st half, {period_2_count} in 2nd half)', 
+                fontsize=16, color='white', pad=20, fontweight='bold')
+    
+    legend_elements = [
+        lines.Line2D([0], [0], color='lime', linewidth=2, label='Successful'),
+        lines.Line2D([0], [0], color='red', linewidth=2, label='Unsuccessful'),
+        lines.Line2D([0], [0], color='yellow', linewidth=4, label='Attack Direction'),
+        lines.Line2D([0], [0], marker='o', color='w', markerfacecolor='gray', markersize=8, label='1st Half', linestyle='None'),
+        lines.Line2D([0], [0], marker='s', color='w', markerfacecolor='gray', markersize=8, label='2nd Half', linestyle='None')
+    ]
+    ax.legend(handles=legend_elements, loc='upper left', fontsize=12)
+    
+    fig.patch.set_facecolor('#0e1117')
+    return fig
+
+def figure_png(fig, dpi=200):
+    """Figure'ı st.pyplot ile aynı ayarlarla PNG byte'larına çevir ve kapat"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
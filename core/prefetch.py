@@ -0,0 +1,142 @@
+"""
+StatsBomb Match Prefetch
+Home'da maç seçilince detay sayfalarının verisini arka planda hazırla
+
+Seçilen maç en yüksek öncelikle, filtrelenmiş listede ona komşu maçlar daha
+düşük öncelikle kuyruğa girer. Her iş events/lineups dosyalarını paylaşılan
+depoya (core/event_store.py) yükler, ardından düz olay tablosunu, takım
+metriklerini ve varsayılan grafikleri kalıcı önbelleğe yazar
+(core/match_cache.py). Detay sayfaları aynı tabloyu ve dosyaları okuduğu için
+genellikle sıcak açılır.
+
+Yeni bir seçim, önceki seçimden kalan ve henüz başlamamış komşu işlerini
+kuyruktan düşürür; çalışan iş yarıda kesilmez.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+from core.event_store import shared_events, shared_lineups, is_shared
+from core.match_cache import has_local_events, warm_match
+
+# Öncelikler: küçük sayı önce çalışır
+SELECTED_PRIORITY = 0
+NEIGHBOUR_PRIORITY = 10
+
+# Seçilen maçın her iki yanında ön yüklenecek komşu sayısı
+NEIGHBOURS = 2
+
+
+class PrefetchQueue:
+    """Öncelikli, tekrarsız arka plan ön yükleme kuyruğu"""
+
+    def __init__(self, workers=2):
+        self._heap = []
+        self._queued = {}
+        self._states = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        for i in range(workers):
+            threading.Thread(target=self._worker, name=f"prefetch-{i}", daemon=True).start()
+
+    def submit(self, match_id, priority=SELECTED_PRIORITY):
+        """Maçı kuyruğa ekle; zaten kuyruktaysa önceliğini yükselt"""
+        if not has_local_events(match_id):
+            return False
+        ready = is_shared(match_id)
+        with self._cond:
+            if ready and self._states.get(match_id) == 'done':
+                return False
+            if self._states.get(match_id) == 'running':
+                return False
+            queued = self._queued.get(match_id)
+            if queued is not None and queued[0] <= priority:
+                return False
+            item = [priority, next(self._seq), match_id]
+            if queued is not None:
+                queued[2] = None  # eski kayıt heap'te kalır, atlanır
+            self._queued[match_id] = item
+            self._states[match_id] = 'queued'
+            heapq.heappush(self._heap, item)
+            self._cond.notify()
+        return True
+
+    def select(self, match_id, neighbour_ids=()):
+        """Home'daki seçim: seçilen maç önce, komşular uzaklığa göre sonra"""
+        with self._cond:
+            # Önceki seçimin başlamamış komşu işleri artık gereksiz
+            for item in self._queued.values():
+                if item[0] >= NEIGHBOUR_PRIORITY and item[2] is not None:
+                    self._states.pop(item[2], None)
+                    item[2] = None
+                    self.dropped += 1
+            self._queued = {m: item for m, item in self._queued.items() if item[2] is not None}
+
+        self.submit(match_id, SELECTED_PRIORITY)
+        for distance, neighbour in neighbour_ids:
+            self.submit(neighbour, NEIGHBOUR_PRIORITY + distance)
+
+    def status(self, match_id):
+        """'queued', 'running', 'ready', 'failed' ya da None"""
+        with self._cond:
+            state = self._states.get(match_id)
+        if state in ('queued', 'running', 'failed'):
+            return state
+        return 'ready' if is_shared(match_id) else None
+
+    def pending(self):
+        with self._cond:
+            return len(self._queued)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                _, _, match_id = heapq.heappop(self._heap)
+                if match_id is None:
+                    continue
+                self._queued.pop(match_id, None)
+                self._states[match_id] = 'running'
+
+            try:
+                prefetch_match(match_id)
+                state = 'done'
+            except Exception as e:
+                print(f"⚠️  Prefetch {match_id}: {type(e).__name__}: {e}")
+                state = 'failed'
+
+            with self._cond:
+                self._states[match_id] = state
+                if state == 'done':
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+
+def prefetch_match(match_id):
+    """Bir maçın olaylarını/kadrolarını belleğe, türetilmiş verilerini diske hazırla"""
+    start = time.perf_counter()
+    events = shared_events(match_id)
+    shared_lineups(match_id)
+    warm_match(match_id, events)
+    return time.perf_counter() - start
+
+
+def neighbours(match_ids, match_id, count=NEIGHBOURS):
+    """Listede match_id'nin iki yanındaki maçlar: [(uzaklık, maç ID), ...]"""
+    try:
+        position = match_ids.index(match_id)
+    except ValueError:
+        return []
+    result = []
+    for distance in range(1, count + 1):
+        for i in (position + distance, position - distance):
+            if 0 <= i < len(match_ids):
+                result.append((distance, match_ids[i]))
+    return result
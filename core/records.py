@@ -0,0 +1,105 @@
+"""
+StatsBomb Event Records
+Olayları iç içe sözlükler yerine tipli, kompakt kayıtlar/kolonlar olarak tutma
+
+Ham olay (type, team, player, pass, shot, tactics ... alt sözlükleriyle) bir
+maçta ~11 MB yer tutar; taşıdığı bilgi ise core.events.EVENT_COLUMNS
+kadardır. EventRecord bu kolonları __slots__ ile tutar (örnek başına sözlük
+yok); takım/oyuncu/tip gibi tekrar eden adlar sys.intern ile tek kopyadır.
+decode_events() kayıtları akış halinde okunan dosyadan doğrudan kurar
+(core/event_stream.py), tüm sözlük ağacı hiç oluşmaz. compact_frame() aynı
+veriyi category ve dar sayı tipli kolonlara çevirir.
+
+deep_size() iç içe nesnelerin toplam boyutunu ölçer;
+benchmarks/memory_footprint.py maç başına önce/sonra karşılaştırmasını yazar.
+"""
+
+import sys
+
+import pandas as pd
+
+from core.event_stream import iter_events
+from core.events import EVENT_COLUMNS, ID_COLUMNS, event_row
+
+# Tekrar eden adlar: category kolonu ve intern edilmiş string
+NAME_COLUMNS = (
+    'type', 'possession_team', 'play_pattern', 'team', 'player', 'position', 'outcome', 'recipient',
+)
+NUMERIC_DTYPES = {
+    'index': 'int32', 'period': 'int8', 'minute': 'int16', 'second': 'int8', 'possession': 'int32',
+    'x': 'float32', 'y': 'float32', 'end_x': 'float32', 'end_y': 'float32', 'xg': 'float32',
+    'length': 'float32', 'under_pressure': 'bool',
+    **{column: 'int32' for column in ID_COLUMNS},
+}
+
+_NAME_POSITIONS = tuple(EVENT_COLUMNS.index(column) for column in NAME_COLUMNS)
+
+
+class EventRecord:
+    """Tek olay: düz kolonlar, sözlüksüz"""
+
+    __slots__ = tuple(EVENT_COLUMNS)
+
+    def __init__(self, *values):
+        for column, value in zip(EVENT_COLUMNS, values):
+            object.__setattr__(self, column, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EventRecord is read-only")
+
+    def __repr__(self):
+        return f"EventRecord({self.index}, {self.type!r}, {self.team!r}, {self.player!r})"
+
+    def as_tuple(self):
+        return tuple(getattr(self, column) for column in EVENT_COLUMNS)
+
+
+def decode_record(event):
+    """Ham olay sözlüğü → EventRecord (adlar intern edilir)"""
+    values = list(event_row(event))
+    for i in _NAME_POSITIONS:
+        if values[i] is not None:
+            values[i] = sys.intern(values[i])
+    return EventRecord(*values)
+
+
+def decode_events(path, types=None, teams=None, where=None, predicate=None):
+    """Events dosyasından doğrudan kayıt listesi (filtreler iter_events ile aynı)"""
+    return [decode_record(e) for e in iter_events(path, types, teams, where, predicate)]
+
+
+def compact_frame(records):
+    """Kayıtlar → category adlar ve dar sayı tipli DataFrame (kolonlar EVENT_COLUMNS)"""
+    frame = pd.DataFrame.from_records([r.as_tuple() for r in records], columns=EVENT_COLUMNS)
+    for column in NAME_COLUMNS:
+        frame[column] = frame[column].astype('category')
+    return frame.astype(NUMERIC_DTYPES)
+
+
+def deep_size(obj, seen=None):
+    """Nesnenin iç içe tüm parçalarıyla bellekteki boyutu (byte, paylaşılanlar bir kez)"""
+    if seen is None:
+        seen = set()
+
+    # pandas kolonları her erişimde yeni nesne döner: kimlikleri izlenmez
+    if isinstance(obj, pd.DataFrame):
+        return sum(deep_size(series, seen) for _, series in obj.items()) + deep_size(obj.index, seen)
+    if isinstance(obj, (pd.Series, pd.Index)):
+        if isinstance(obj.dtype, pd.CategoricalDtype):
+            return int(obj.array.codes.nbytes) + deep_size(obj.array.categories, seen)
+        if obj.dtype != object:
+            return int(obj.array.nbytes) if hasattr(obj.array, 'nbytes') else int(obj.memory_usage(deep=True))
+        values = obj.to_numpy()
+        return values.nbytes + sum(deep_size(v, seen) for v in values)
+
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(v, seen) for v in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(deep_size(getattr(obj, s), seen) for s in obj.__slots__ if hasattr(obj, s))
+    return size
@@ -0,0 +1,237 @@
+"""
+StatsBomb Tiered Fetch
+Bellek → disk (data/) → ağ sırasıyla okuyan, yerel öncelikli veri katmanı
+
+Her dosya StatsBomb open-data deposundaki göreli yoluyla istenir
+("events/3895292.json"). Sıra:
+1. Bellek: son okunan JSON'lar (küçük LRU).
+2. Disk: data/ altındaki kopya; download_data.py ile indirilenler de burada.
+   Ağdan gelen her yanıt da buraya yazılır, böylece diğer sayfalar ve
+   data/ izleyicisi (core/watch.py) aynı dosyayı görür. Dosya sıkıştırılmış
+   saklanıyorsa (compress_data.py) yanıt aynı biçimde yazılır ve diğer
+   haller silinir; eski bir kopya yenisinin yanında kalmaz.
+3. Ağ: BASE_URL (STATSBOMB_BASE_URL ile yerel bir test sunucusuna
+   yönlendirilebilir).
+
+Tazelik süresi (FRESH_TTL) dolmuş kopya beklemeden döner ve arka planda
+ETag ile koşullu istekle yenilenir (stale-while-revalidate); 304 yanıtı
+dosyaya dokunmaz. Ağ hatasında diskteki kopya kullanılmaya devam eder.
+404 alan yollar NEGATIVE_TTL boyunca ağa hiç gitmeden "yok" döner. Tazelik ve
+negatif kayıtlar data/cache/fetch/meta.json dosyasında tutulur.
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from core.compression import FORMATS, latest_dictionary, write_compressed
+from core.fetch import fetch
+from core.loaders import BASE_URL, DATA_DIR, RAW_SUFFIXES, read_json, raw_exists, raw_mtime, resolve_raw
+
+META_PATH = os.path.join(DATA_DIR, "cache", "fetch", "meta.json")
+
+# Klasör → tazelik süresi (saniye); maç verisi yayından sonra nadiren değişir
+FRESH_TTL = {
+    'competitions.json': 6 * 3600,
+    'matches': 6 * 3600,
+    'events': 30 * 24 * 3600,
+    'lineups': 30 * 24 * 3600,
+}
+NEGATIVE_TTL = 3600
+# Başarısız yenilemeden sonra aynı dosya için bekleme
+REVALIDATE_BACKOFF = 300
+MEMORY_MAX = 64
+
+
+class TieredStore:
+    """Bellek, disk ve ağ katmanlı JSON deposu"""
+
+    def __init__(self, base_url=BASE_URL, data_dir=DATA_DIR, meta_path=META_PATH,
+                 fresh_ttl=FRESH_TTL, negative_ttl=NEGATIVE_TTL):
+        self.base_url = base_url
+        self.data_dir = data_dir
+        self.meta_path = meta_path
+        self.fresh_ttl = fresh_ttl
+        self.negative_ttl = negative_ttl
+        self.stats = {
+            'memory': 0, 'disk': 0, 'network': 0, 'stale': 0, 'negative': 0,
+            'revalidated': 0, 'not_modified': 0, 'fallback': 0,
+        }
+        self._memory = OrderedDict()
+        self._meta = read_json(meta_path) if os.path.exists(meta_path) else {}
+        self._failed = {}
+        self._revalidating = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revalidate")
+
+    def local_path(self, path):
+        return os.path.join(self.data_dir, *path.split("/"))
+
+    def _ttl(self, path):
+        return self.fresh_ttl.get(path.split("/")[0], 3600)
+
+    def _checked(self, path, local):
+        """Dosyanın en son doğrulandığı an (meta yoksa dosyanın mtime'ı)"""
+        return self._meta.get(path, {}).get('checked') or raw_mtime(local)
+
+    def _save_meta(self):
+        os.makedirs(os.path.dirname(self.meta_path), exist_ok=True)
+        partial = f"{self.meta_path}.{os.getpid()}.{threading.get_ident()}.partial"
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(self._meta, f)
+        os.replace(partial, self.meta_path)
+
+    def _update_meta(self, path, **values):
+        with self._lock:
+            self._meta[path] = values
+            self._save_meta()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    # --- Ağ ---
+
+    def _download(self, path, etag=None):
+        """Ağdan çek; dosya değiştiyse True, 304 ise False, 404 ise None"""
+        headers = {'If-None-Match': etag} if etag else None
+        response = fetch(self.base_url + path, max_retries=3, timeout=15, headers=headers)
+        if response.status_code == 404:
+            self._update_meta(path, missing=time.time())
+            return None
+        if response.status_code == 304:
+            self._update_meta(path, checked=time.time(), etag=etag)
+            self._count('not_modified')
+            return False
+
+        self._write_local(path, response.content)
+        with self._lock:
+            self._memory.pop(path, None)
+        self._update_meta(path, checked=time.time(), etag=response.headers.get('ETag'))
+        return True
+
+    def _write_local(self, path, content):
+        """Yanıtı diskteki kopyanın biçiminde (düz, .zst ya da .gz) yaz; diğer halleri sil"""
+        local = self.local_path(path)
+        existing = resolve_raw(local)
+        suffix = existing[len(local):] if existing else ""
+        fmt = next(name for name, ext in FORMATS.items() if ext == suffix)
+        dictionary = latest_dictionary(path.split("/")[0]) if fmt == 'zstd' else None
+
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        target = local + suffix
+        partial = f"{local}.{os.getpid()}.{threading.get_ident()}.partial{suffix}"
+        write_compressed(io.BytesIO(content), partial, fmt, dictionary=dictionary)
+        os.replace(partial, target)
+        for other in RAW_SUFFIXES:
+            if local + other != target and os.path.exists(local + other):
+                os.remove(local + other)
+
+    def revalidate(self, path):
+        """Kopyayı ağdan doğrula/yenile; ağ hatasında kopya korunur"""
+        try:
+            if self._download(path, self._meta.get(path, {}).get('etag')):
+                self._count('revalidated')
+        except Exception:
+            self._failed[path] = time.time()
+            self._count('fallback')
+        finally:
+            with self._lock:
+                self._revalidating.discard(path)
+
+    def _revalidate_later(self, path):
+        if time.time() - self._failed.get(path, 0) < REVALIDATE_BACKOFF:
+            return
+        with self._lock:
+            if path in self._revalidating:
+                return
+            self._revalidating.add(path)
+        self._count('stale')
+        self._pool.submit(self.revalidate, path)
+
+    # --- Okuma ---
+
+    def is_missing(self, path):
+        """Yol yakın zamanda 404 aldı mı (negatif önbellek)"""
+        missing = self._meta.get(path, {}).get('missing')
+        return missing is not None and time.time() - missing < self.negative_ttl
+
+    def ensure_local(self, path):
+        """Dosyanın diskteki yolu; gerekirse indirir (yoksa None, ağ hatası fırlatılır)"""
+        local = self.local_path(path)
+        if raw_exists(local):
+            if time.time() - self._checked(path, local) > self._ttl(path):
+                self._revalidate_later(path)
+            return local
+
+        if self.is_missing(path):
+            self._count('negative')
+            return None
+
+        self._count('network')
+        if self._download(path) is None:
+            return None
+        return local
+
+    def get_json(self, path):
+        """JSON içeriği; bellekten, diskten ya da ağdan (yoksa None)"""
+        with self._lock:
+            data = self._memory.get(path)
+            if data is not None:
+                self._memory.move_to_end(path)
+        if data is not None:
+            self._count('memory')
+            local = self.local_path(path)
+            if raw_exists(local) and time.time() - self._checked(path, local) > self._ttl(path):
+                self._revalidate_later(path)
+            return data
+
+        local_exists = raw_exists(self.local_path(path))
+        local = self.ensure_local(path)
+        if local is None:
+            return None
+        if local_exists:
+            self._count('disk')
+
+        data = read_json(local)
+        with self._lock:
+            self._memory[path] = data
+            while len(self._memory) > MEMORY_MAX:
+                self._memory.popitem(last=False)
+        return data
+
+    def memory_entries(self):
+        """Bellek LRU'sundaki (yol, JSON) kayıtları, en eski kullanılan önce"""
+        with self._lock:
+            return list(self._memory.items())
+
+    def evict_memory(self, path=None):
+        """Bellek LRU'sundan bir yolu (None → tümünü) çıkar; silinen kayıt sayısı"""
+        with self._lock:
+            if path is None:
+                removed = len(self._memory)
+                self._memory.clear()
+                return removed
+            return int(self._memory.pop(path, None) is not None)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Süreç genelinde tek katmanlı depo"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TieredStore()
+        return _store
+
+
+def loaded_store():
+    """Oluşturulmuşsa süreç genelindeki depo, yoksa None (izleme için; depoyu oluşturmaz)"""
+    return _store
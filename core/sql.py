@@ -0,0 +1,287 @@
+"""
+StatsBomb SQL Layer
+Düz olaylar, kadrolar ve maçlar üzerinde gömülü SQLite veritabanı
+
+data/cache/sql/statsbomb.sqlite dosyasında dört tablo tutulur: matches
+(core/catalog.py kolonları), events (core/events.py düz kolonları + match_id),
+lineups (oyuncu başına tek satır) ve lineup_positions (kadro "positions"
+kayıtları). build_database() yalnızca dosyası değişen maçları yeniden yükler
+(ingested tablosundaki dosya sürümüne göre). Sık kullanılan türetilmiş
+kolonlar görünümlerdedir:
+
+- events_v: olay + maç bilgisi; venue ('home'/'away'), opponent, sezon
+- passes: completed, length, progressive (kaleye uzaklık en az %25 azalır)
+- shots: is_goal, xg
+
+query() parametreli sorguyu salt okunur bağlantıda çalıştırır; sonuçlar
+(sorgu, parametreler, veritabanı sürümü) anahtarıyla küçük bir LRU'da tutulur,
+veritabanı yeniden yüklenince eski sonuçlar kendiliğinden geçersizleşir.
+
+Örnek:
+query("SELECT player, COUNT(*) AS n FROM passes WHERE progressive AND period = 2 "
+      "AND venue = 'away' AND player LIKE :player GROUP BY player", {'player': '%Xhaka%'})
+"""
+
+import math
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from core.catalog import build_match_catalog, local_seasons
+from core.loaders import (
+    DATA_DIR, events_path, lineups_path, matches_path, read_json, file_version,
+)
+from core.match_cache import load_flat_events
+
+DB_PATH = os.path.join(DATA_DIR, "cache", "sql", "statsbomb.sqlite")
+
+# Sorgu sonucu önbelleği (giriş sayısı)
+QUERY_CACHE_SIZE = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested (
+    kind TEXT NOT NULL, key TEXT NOT NULL, version TEXT, PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    match_id INTEGER PRIMARY KEY, competition_id INTEGER, season_id INTEGER,
+    competition_name TEXT, season_name TEXT, match_date TEXT, formatted_date TEXT,
+    formatted_time TEXT, match_week INTEGER, competition_stage TEXT,
+    home_team_id INTEGER, home_team_name TEXT, away_team_id INTEGER, away_team_name TEXT,
+    home_score INTEGER, away_score INTEGER, stadium_name TEXT, referee_name TEXT, match_status TEXT
+);
+CREATE TABLE IF NOT EXISTS events (
+    match_id INTEGER NOT NULL, id TEXT, "index" INTEGER, period INTEGER, timestamp TEXT,
+    minute INTEGER, second INTEGER, type TEXT, possession INTEGER, possession_team TEXT,
+    play_pattern TEXT, team TEXT, player TEXT, position TEXT, x REAL, y REAL,
+    end_x REAL, end_y REAL, outcome TEXT, recipient TEXT, under_pressure INTEGER, xg REAL
+);
+CREATE INDEX IF NOT EXISTS events_match ON events (match_id);
+CREATE INDEX IF NOT EXISTS events_type ON events (type, team);
+CREATE INDEX IF NOT EXISTS events_player ON events (player);
+CREATE TABLE IF NOT EXISTS lineups (
+    match_id INTEGER NOT NULL, team_id INTEGER, team_name TEXT, player_id INTEGER,
+    player_name TEXT, player_nickname TEXT, jersey_number INTEGER, country TEXT,
+    started INTEGER, yellow_cards INTEGER, red_cards INTEGER,
+    PRIMARY KEY (match_id, player_id)
+);
+CREATE INDEX IF NOT EXISTS lineups_player ON lineups (player_id);
+CREATE TABLE IF NOT EXISTS lineup_positions (
+    match_id INTEGER NOT NULL, player_id INTEGER, position_id INTEGER, position TEXT,
+    from_time TEXT, to_time TEXT, from_period INTEGER, to_period INTEGER,
+    start_reason TEXT, end_reason TEXT
+);
+CREATE INDEX IF NOT EXISTS lineup_positions_match ON lineup_positions (match_id, player_id);
+
+CREATE VIEW IF NOT EXISTS events_v AS
+SELECT e.*, m.competition_id, m.season_id, m.match_date,
+       CASE WHEN e.team = m.home_team_name THEN 'home' ELSE 'away' END AS venue,
+       CASE WHEN e.team = m.home_team_name THEN m.away_team_name ELSE m.home_team_name END AS opponent
+FROM events e JOIN matches m USING (match_id);
+
+CREATE VIEW IF NOT EXISTS passes AS
+SELECT *, outcome IS NULL AS completed,
+       sqrt((end_x - x) * (end_x - x) + (end_y - y) * (end_y - y)) AS length,
+       ((120 - end_x) * (120 - end_x) + (40 - end_y) * (40 - end_y))
+           <= 0.5625 * ((120 - x) * (120 - x) + (40 - y) * (40 - y)) AS progressive
+FROM events_v WHERE type = 'Pass';
+
+CREATE VIEW IF NOT EXISTS shots AS
+SELECT *, outcome = 'Goal' AS is_goal FROM events_v WHERE type = 'Shot';
+"""
+
+EVENT_COLUMNS = (
+    'match_id', 'id', 'index', 'period', 'timestamp', 'minute', 'second', 'type', 'possession',
+    'possession_team', 'play_pattern', 'team', 'player', 'position', 'x', 'y', 'end_x', 'end_y',
+    'outcome', 'recipient', 'under_pressure', 'xg',
+)
+
+_query_cache = OrderedDict()
+_query_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def _register_functions(conn):
+    # sqrt her SQLite derlemesinde yok
+    conn.create_function("sqrt", 1, lambda v: None if v is None else math.sqrt(v), deterministic=True)
+
+
+def connect(db_path=DB_PATH, read_only=True):
+    """Veritabanı bağlantısı (varsayılan salt okunur)"""
+    if read_only:
+        conn = sqlite3.connect(f"file:{os.path.abspath(db_path)}?mode=ro", uri=True, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.executescript(SCHEMA)
+    _register_functions(conn)
+    return conn
+
+
+def database_version(db_path=DB_PATH):
+    """Veritabanı dosyasının sürümü (yoksa None); sonuç önbelleği anahtarının parçası"""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# --- Yükleme ---
+
+def _is_current(conn, kind, key, version):
+    row = conn.execute("SELECT version FROM ingested WHERE kind = ? AND key = ?", (kind, str(key))).fetchone()
+    return row is not None and row[0] == repr(version)
+
+
+def _mark(conn, kind, key, version):
+    conn.execute("INSERT OR REPLACE INTO ingested VALUES (?, ?, ?)", (kind, str(key), repr(version)))
+
+
+def _ingest_season(conn, competition_id, season_id):
+    catalog = build_match_catalog(read_json(matches_path(competition_id, season_id)))
+    catalog['match_date'] = catalog['match_date'].dt.strftime('%Y-%m-%d')
+    rows = catalog.astype(object).where(catalog.notna(), None).itertuples(index=False, name=None)
+    placeholders = ", ".join("?" * len(catalog.columns))
+    conn.executemany(f"INSERT OR REPLACE INTO matches VALUES ({placeholders})", rows)
+    return len(catalog)
+
+
+def _ingest_events(conn, match_id):
+    flat = load_flat_events(match_id)[list(EVENT_COLUMNS[1:])]
+    conn.execute("DELETE FROM events WHERE match_id = ?", (match_id,))
+    flat = flat.astype(object).where(flat.notna(), None)
+    placeholders = ", ".join("?" * len(EVENT_COLUMNS))
+    columns = ", ".join(f'"{c}"' for c in EVENT_COLUMNS)
+    conn.executemany(
+        f"INSERT INTO events ({columns}) VALUES ({placeholders})",
+        ((match_id, *row) for row in flat.itertuples(index=False, name=None)),
+    )
+    return len(flat)
+
+
+def _ingest_lineups(conn, match_id):
+    conn.execute("DELETE FROM lineups WHERE match_id = ?", (match_id,))
+    conn.execute("DELETE FROM lineup_positions WHERE match_id = ?", (match_id,))
+    players = 0
+    for team in read_json(lineups_path(match_id)):
+        for p in team.get('lineup', []):
+            cards = [c.get('card_type') for c in p.get('cards') or []]
+            spells = p.get('positions') or []
+            conn.execute(
+                "INSERT OR REPLACE INTO lineups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (match_id, team['team_id'], team['team_name'], p['player_id'], p['player_name'],
+                 p.get('player_nickname'), p.get('jersey_number'), (p.get('country') or {}).get('name'),
+                 any(s.get('start_reason') == 'Starting XI' for s in spells),
+                 sum(c == 'Yellow Card' for c in cards),
+                 sum(c in ('Red Card', 'Second Yellow') for c in cards)),
+            )
+            conn.executemany(
+                "INSERT INTO lineup_positions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(match_id, p['player_id'], s.get('position_id'), s.get('position'), s.get('from'),
+                  s.get('to'), s.get('from_period'), s.get('to_period'), s.get('start_reason'),
+                  s.get('end_reason')) for s in spells],
+            )
+            players += 1
+    return players
+
+
+def build_database(match_ids=None, db_path=DB_PATH, rebuild=False):
+    """Yerel dosyalardan veritabanını güncelle; yüklenen satır sayıları
+
+    match_ids verilmezse yerel sezon dosyalarındaki tüm maçlar denenir. Dosya
+    sürümü değişmeyen sezon/maçlar atlanır.
+    """
+    with _build_lock:
+        if rebuild and os.path.exists(db_path):
+            os.remove(db_path)
+        conn = connect(db_path, read_only=False)
+        counts = {'seasons': 0, 'matches': 0, 'events': 0, 'lineups': 0, 'skipped': 0}
+        try:
+            with conn:
+                for competition_id, season_id in local_seasons():
+                    version = file_version(matches_path(competition_id, season_id))
+                    key = f"{competition_id}/{season_id}"
+                    if not _is_current(conn, 'matches', key, version):
+                        counts['matches'] += _ingest_season(conn, competition_id, season_id)
+                        counts['seasons'] += 1
+                        _mark(conn, 'matches', key, version)
+
+            if match_ids is None:
+                match_ids = [row[0] for row in conn.execute("SELECT match_id FROM matches ORDER BY match_id")]
+
+            for match_id in match_ids:
+                # Her maç kendi işleminde: yarıda kalan yükleme eksik maç bırakmaz
+                with conn:
+                    version = file_version(events_path(match_id))
+                    if version is not None:
+                        if _is_current(conn, 'events', match_id, version):
+                            counts['skipped'] += 1
+                        else:
+                            counts['events'] += _ingest_events(conn, match_id)
+                            _mark(conn, 'events', match_id, version)
+                    version = file_version(lineups_path(match_id))
+                    if version is not None and not _is_current(conn, 'lineups', match_id, version):
+                        counts['lineups'] += _ingest_lineups(conn, match_id)
+                        _mark(conn, 'lineups', match_id, version)
+            conn.execute("PRAGMA optimize")
+        finally:
+            conn.close()
+    return counts
+
+
+# --- Sorgu ---
+
+def _cache_key(sql, params, version):
+    if isinstance(params, dict):
+        params_key = tuple(sorted(params.items()))
+    else:
+        params_key = tuple(params or ())
+    return sql.strip(), params_key, version
+
+
+def query(sql, params=None, db_path=DB_PATH, use_cache=True):
+    """Parametreli salt okunur sorgu → DataFrame (sonuçlar önbellekli)
+
+    params: ? yer tutucuları için liste ya da :ad yer tutucuları için sözlük.
+    Dönen tablo önbellekle paylaşılır; değiştirmeden önce kopyalayın.
+    """
+    version = database_version(db_path)
+    if version is None:
+        raise FileNotFoundError(f"{db_path} not found (run python build_database.py)")
+
+    key = _cache_key(sql, params, version)
+    if use_cache:
+        with _query_lock:
+            result = _query_cache.get((db_path, key))
+            if result is not None:
+                _query_cache.move_to_end((db_path, key))
+                return result
+
+    conn = connect(db_path)
+    try:
+        result = pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+    if use_cache:
+        with _query_lock:
+            _query_cache[(db_path, key)] = result
+            while len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+    return result
+
+
+def tables(db_path=DB_PATH):
+    """Tablo/görünüm adı → kolon adları (sorgu sayfasındaki şema listesi için)"""
+    conn = connect(db_path)
+    try:
+        names = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') AND name != 'ingested' AND name NOT LIKE 'sqlite_%' ORDER BY type, name"
+        ).fetchall()
+        return {name: [row[1] for row in conn.execute(f'PRAGMA table_info("{name}")')] for (name,) in names}
+    finally:
+        conn.close()
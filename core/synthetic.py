@@ -0,0 +1,613 @@
+"""
+StatsBomb Synthetic Data
+Ölçek testleri için StatsBomb şemasına uygun sentetik maç, olay ve kadro dosyaları
+
+Her maç top sahipliği zincirleri olarak simüle edilir: taşıma → pas → top alma,
+araya pres, ikili mücadele, faul ve şutlar girer; top kaybında sahiplik rakibe
+geçer. Konumlar StatsBomb kuralına uygundur (olayı yapan takım x=120'ye hücum eder),
+şutlarda freeze frame ve kaleci olayı, kadrolarda pozisyon aralıkları ve kartlar
+bulunur. Aynı seed her zaman aynı dosyaları üretir.
+"""
+
+import json
+import math
+import os
+import random
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+from core.loaders import DATA_DIR, events_path, lineups_path, matches_path
+
+# Gerçek verilerle çakışmaması için sentetik ID aralıkları
+SYNTHETIC_COMPETITION_ID = 9900
+SYNTHETIC_TEAM_ID_BASE = 90000
+SYNTHETIC_PLAYER_ID_BASE = 9000000
+SYNTHETIC_MATCH_ID_BASE = 900000000
+
+PERIOD_SECONDS = 45 * 60
+
+# 4-3-3: (position_id, pozisyon, temel x, temel y) - takım x=120'ye hücum eder, sağ kanat y=80 tarafı
+FORMATION = 433
+FORMATION_SLOTS = [
+    (1, 'Goalkeeper', 6, 40),
+    (2, 'Right Back', 35, 68),
+    (3, 'Right Center Back', 24, 52),
+    (5, 'Left Center Back', 24, 28),
+    (6, 'Left Back', 35, 12),
+    (10, 'Center Defensive Midfield', 45, 40),
+    (13, 'Right Center Midfield', 58, 54),
+    (15, 'Left Center Midfield', 58, 26),
+    (17, 'Right Wing', 82, 68),
+    (23, 'Center Forward', 92, 40),
+    (21, 'Left Wing', 82, 12),
+]
+SQUAD_SIZE = 16
+
+TEAM_NAMES = [
+    'Northbridge', 'Eastwick', 'Portmere', 'Highcastle', 'Riverton', 'Stonegate',
+    'Ashford Vale', 'Kingsport', 'Marlow Heath', 'Redcliffe', 'Westholm', 'Oakhaven',
+    'Silverlake', 'Brackenfield', 'Fairhaven', 'Duncaster', 'Greywater', 'Holloway',
+    'Larkspur', 'Millbrook',
+]
+_FIRST = ['Ad', 'Ben', 'Car', 'Dan', 'El', 'Fin', 'Gus', 'Hal', 'Iv', 'Jon', 'Kai', 'Leo', 'Mat', 'Nik', 'Ol', 'Pim']
+_LAST = ['berg', 'son', 'ez', 'ini', 'ov', 'ard', 'sen', 'ić', 'ley', 'mann', 'ar', 'eau', 'inho', 'ski']
+_LAST_ROOT = ['Hal', 'Mor', 'Kast', 'Rod', 'Vel', 'Brun', 'Tor', 'Lund', 'Sar', 'Fer', 'Gal', 'Nov', 'Pet', 'Wil']
+
+PLAY_PATTERNS = {
+    'Regular Play': 1, 'From Corner': 2, 'From Free Kick': 3, 'From Throw In': 4,
+    'Other': 5, 'From Counter': 6, 'From Goal Kick': 7, 'From Keeper': 8, 'From Kick Off': 9,
+}
+EVENT_TYPES = {
+    'Ball Recovery': 2, 'Duel': 4, 'Block': 6, 'Clearance': 9, 'Interception': 10,
+    'Pressure': 17, 'Half Start': 18, 'Substitution': 19, 'Foul Won': 21, 'Foul Committed': 22,
+    'Goal Keeper': 23, 'Shot': 16, 'Pass': 30, 'Half End': 34, 'Starting XI': 35, 'Ball Receipt*': 42,
+    'Carry': 43,
+}
+SHOT_OUTCOMES = {'Blocked': 96, 'Goal': 97, 'Off T': 98, 'Saved': 100, 'Wayward': 101}
+BODY_PARTS = {'Head': 37, 'Left Foot': 38, 'Right Foot': 40}
+
+
+def _ref(name, table):
+    return {'id': table[name], 'name': name}
+
+
+def _timestamp(seconds):
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{secs:06.3f}"
+
+
+def _clock(seconds):
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+def _flip(location):
+    """Konumu rakip takımın yönüne çevir"""
+    return [round(120 - location[0], 1), round(80 - location[1], 1)]
+
+
+def make_teams(n_teams, seed):
+    """Sezon boyunca sabit takımlar ve kadrolar"""
+    rng = random.Random(f"teams-{seed}")
+    teams = []
+    for t in range(n_teams):
+        base_name = TEAM_NAMES[t % len(TEAM_NAMES)]
+        name = base_name if t < len(TEAM_NAMES) else f"{base_name} {t // len(TEAM_NAMES) + 1}"
+        team_id = SYNTHETIC_TEAM_ID_BASE + t
+        jerseys = rng.sample(range(1, 40), SQUAD_SIZE)
+        players = [
+            {
+                'id': SYNTHETIC_PLAYER_ID_BASE + team_id % 1000 * 100 + k,
+                'name': f"{rng.choice(_FIRST)}{rng.choice(['', 'o', 'an', 'ir'])} {rng.choice(_LAST_ROOT)}{rng.choice(_LAST)}",
+                'jersey_number': jerseys[k],
+            }
+            for k in range(SQUAD_SIZE)
+        ]
+        teams.append({'id': team_id, 'name': name, 'players': players})
+    return teams
+
+
+def fixtures(n_teams):
+    """Çift devreli lig fikstürü: [(hafta, ev sahibi, deplasman)]"""
+    order = list(range(n_teams)) + ([None] if n_teams % 2 else [])
+    rounds = []
+    for _ in range(len(order) - 1):
+        rounds.append([(order[i], order[-1 - i]) for i in range(len(order) // 2)])
+        order = [order[0]] + [order[-1]] + order[1:-1]
+
+    result = []
+    for week, pairs in enumerate(rounds + [[(b, a) for a, b in r] for r in rounds], start=1):
+        result.extend((week, home, away) for home, away in pairs if home is not None and away is not None)
+    return result
+
+
+class _Side:
+    """Maç içinde bir takımın sahadaki oyuncuları"""
+
+    def __init__(self, team, rng):
+        self.team = team
+        self.ref = {'id': team['id'], 'name': team['name']}
+        self.on_pitch = {slot: team['players'][slot] for slot in range(len(FORMATION_SLOTS))}
+        self.bench = list(team['players'][len(FORMATION_SLOTS):])
+        self.subs_left = min(3, len(self.bench))
+        self.sub_times = sorted(rng.uniform(55 * 60, 88 * 60) for _ in range(self.subs_left))
+
+    def player_ref(self, slot):
+        player = self.on_pitch[slot]
+        return {'id': player['id'], 'name': player['name']}
+
+    def position_ref(self, slot):
+        return {'id': FORMATION_SLOTS[slot][0], 'name': FORMATION_SLOTS[slot][1]}
+
+    def location(self, slot, ball_x, rng):
+        """Oyuncunun anlık konumu: temel pozisyon + topa göre blok kayması + gürültü"""
+        _, _, base_x, base_y = FORMATION_SLOTS[slot]
+        shift = 0 if slot == 0 else (ball_x - 60) * 0.4
+        return [
+            round(_clamp(base_x + shift + rng.gauss(0, 4), 0.5, 119.5), 1),
+            round(_clamp(base_y + rng.gauss(0, 5), 0.5, 79.5), 1),
+        ]
+
+
+class MatchSimulator:
+    """Tek maçlık olay ve kadro üretimi"""
+
+    def __init__(self, match_id, home, away, seed):
+        self.rng = random.Random(f"match-{seed}-{match_id}")
+        self.match_id = match_id
+        self.sides = [_Side(home, self.rng), _Side(away, self.rng)]
+        self.events = []
+        self.possession = 0
+        self.period = 1
+        self.clock = 0.0
+        self.score = [0, 0]
+        self.cards = {}
+        self.stints = {}
+        self.last_pass_id = None
+
+    # --- Olay yazımı ---
+
+    def _uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _event(self, type_name, side, possession_side, play_pattern, slot=None, location=None,
+               duration=0.0, **extra):
+        minute_offset = 45 * 60 if self.period == 2 else 0
+        total = minute_offset + self.clock
+        event = {
+            'id': self._uuid(),
+            'index': len(self.events) + 1,
+            'period': self.period,
+            'timestamp': _timestamp(self.clock),
+            'minute': int(total // 60),
+            'second': int(total % 60),
+            'type': _ref(type_name, EVENT_TYPES),
+            'possession': self.possession,
+            'possession_team': self.sides[possession_side].ref,
+            'play_pattern': _ref(play_pattern, PLAY_PATTERNS),
+            'team': self.sides[side].ref,
+        }
+        if slot is not None:
+            event['player'] = self.sides[side].player_ref(slot)
+            event['position'] = self.sides[side].position_ref(slot)
+        if location is not None:
+            event['location'] = location
+        event['duration'] = round(duration, 6)
+        event.update(extra)
+        self.events.append(event)
+        return event
+
+    @staticmethod
+    def _relate(a, b):
+        a.setdefault('related_events', []).append(b['id'])
+        b.setdefault('related_events', []).append(a['id'])
+
+    # --- Simülasyon ---
+
+    def run(self):
+        for s, side in enumerate(self.sides):
+            for slot, player in side.on_pitch.items():
+                self.stints[player['id']] = [[slot, 0.0, 1, None, None, 'Starting XI', None]]
+            self._event('Starting XI', s, 0, 'Regular Play', tactics={
+                'formation': FORMATION,
+                'lineup': [
+                    {'player': side.player_ref(slot), 'position': side.position_ref(slot),
+                     'jersey_number': side.on_pitch[slot]['jersey_number']}
+                    for slot in side.on_pitch
+                ],
+            })
+
+        for period in (1, 2):
+            self.period = period
+            self.clock = 0.0
+            length = PERIOD_SECONDS + self.rng.uniform(60, 300)
+            for s in (0, 1):
+                self._event('Half Start', s, 0, 'Regular Play')
+
+            team = 0 if period == 1 else 1
+            pattern = 'From Kick Off'
+            location = [60.0, 40.0]
+            while self.clock < length:
+                if period == 2:
+                    self._substitutions()
+                team, pattern, location = self._possession(team, pattern, location)
+
+            for s in (0, 1):
+                self._event('Half End', s, team, 'Other')
+
+        self._close_stints()
+        return self.events
+
+    def _substitutions(self):
+        minute_clock = 45 * 60 + self.clock
+        for s, side in enumerate(self.sides):
+            while side.sub_times and side.sub_times[0] <= minute_clock and side.bench:
+                side.sub_times.pop(0)
+                slot = self.rng.randint(1, len(FORMATION_SLOTS) - 1)
+                replacement = side.bench.pop(0)
+                self._event('Substitution', s, s, 'Regular Play', slot=slot, substitution={
+                    'outcome': {'id': 103, 'name': 'Tactical'},
+                    'replacement': {'id': replacement['id'], 'name': replacement['name']},
+                })
+                off = self.stints[side.on_pitch[slot]['id']][-1]
+                off[3], off[4], off[6] = self.clock + 45 * 60, 2, 'Substitution - Off (Tactical)'
+                self.stints[replacement['id']] = [[slot, self.clock + 45 * 60, 2, None, None, 'Substitution - On (Tactical)', None]]
+                side.on_pitch[slot] = replacement
+
+    def _close_stints(self):
+        for stints in self.stints.values():
+            last = stints[-1]
+            if last[6] is None:
+                last[6] = 'Final Whistle'
+
+    def _nearest_slot(self, side, location, exclude=None):
+        best, best_d = 1, float('inf')
+        for slot in range(1, len(FORMATION_SLOTS)):
+            if slot == exclude:
+                continue
+            _, _, bx, by = FORMATION_SLOTS[slot]
+            d = (bx - location[0]) ** 2 + (by - location[1]) ** 2
+            if d < best_d:
+                best, best_d = slot, d
+        return best
+
+    def _pick_recipient(self, side, carrier, location):
+        """İleri doğru ve yakın oyunculara daha yüksek olasılık"""
+        rng = self.rng
+        target_x = location[0] + rng.uniform(-10, 14)
+        weights = []
+        slots = [s for s in range(len(FORMATION_SLOTS)) if s != carrier]
+        for slot in slots:
+            pos = side.location(slot, location[0], rng)
+            distance = math.hypot(pos[0] - target_x, pos[1] - location[1])
+            weights.append(math.exp(-distance / 10) * (0.15 if slot == 0 else 1.0))
+        return rng.choices(slots, weights=weights)[0]
+
+    def _possession(self, team, pattern, location):
+        """Tek top sahipliği; sonraki (takım, oyun şekli, konum) döner"""
+        rng = self.rng
+        self.possession += 1
+        opponent = 1 - team
+        side, other = self.sides[team], self.sides[opponent]
+        carrier = self._nearest_slot(side, location)
+        self.clock += rng.uniform(3, 20) if pattern != 'Regular Play' else rng.uniform(0.3, 2)
+        self.last_pass_id = None
+
+        while True:
+            under_pressure = rng.random() < 0.25
+            if under_pressure:
+                presser = self._nearest_slot(other, _flip(location))
+                self._event('Pressure', opponent, team, pattern, slot=presser,
+                            location=_flip(location), duration=rng.uniform(0.2, 1.5),
+                            **({'counterpress': True} if rng.random() < 0.1 else {}))
+
+            # Taşıma
+            if rng.random() < 0.7:
+                end = [
+                    round(_clamp(location[0] + rng.uniform(-2, 12), 0.5, 119.5), 1),
+                    round(_clamp(location[1] + rng.gauss(0, 4), 0.5, 79.5), 1),
+                ]
+                duration = math.hypot(end[0] - location[0], end[1] - location[1]) / 5 + 0.2
+                self._event('Carry', team, team, pattern, slot=carrier, location=location,
+                            duration=duration, carry={'end_location': end},
+                            **({'under_pressure': True} if under_pressure else {}))
+                self.clock += duration
+                location = end
+
+            # Şut
+            shot_chance = 0.18 if location[0] > 100 and 18 < location[1] < 62 else (0.025 if location[0] > 85 else 0)
+            if rng.random() < shot_chance:
+                return self._shot(team, carrier, location, pattern)
+
+            # Faul
+            if rng.random() < 0.015:
+                return self._foul(team, carrier, location, pattern)
+
+            # İkili mücadele (top kaybı)
+            if rng.random() < 0.03:
+                defender = self._nearest_slot(other, _flip(location))
+                self._event('Duel', opponent, team, pattern, slot=defender, location=_flip(location),
+                            duel={'type': {'id': 11, 'name': 'Tackle'}, 'outcome': {'id': 4, 'name': 'Won'}})
+                return opponent, 'Regular Play', _flip(location)
+
+            # Pas
+            recipient = self._pick_recipient(side, carrier, location)
+            target = side.location(recipient, location[0], rng)
+            length = math.hypot(target[0] - location[0], target[1] - location[1])
+            success = rng.random() < _clamp(1.0 - length / 200 - (0.06 if under_pressure else 0)
+                                            - (0.15 if target[0] > 100 else 0), 0.3, 0.97)
+            duration = length / 15 + 0.3
+            height = 'High Pass' if length > 30 and rng.random() < 0.6 else ('Low Pass' if rng.random() < 0.1 else 'Ground Pass')
+            pass_info = {
+                'length': round(length, 7),
+                'angle': round(math.atan2(target[1] - location[1], target[0] - location[0]), 7),
+                'height': {'id': {'Ground Pass': 1, 'Low Pass': 2, 'High Pass': 3}[height], 'name': height},
+                'end_location': target,
+                'body_part': _ref(rng.choice(['Right Foot', 'Right Foot', 'Left Foot']), BODY_PARTS),
+            }
+            # Başarısız pasların çoğunda da hedeflenen oyuncu kayıtlıdır
+            if success or rng.random() < 0.8:
+                pass_info = {'recipient': side.player_ref(recipient), **pass_info}
+            if not success:
+                outcome = 'Out' if target[1] < 1 or target[1] > 79 or rng.random() < 0.1 else 'Incomplete'
+                pass_info['outcome'] = {'id': 75 if outcome == 'Out' else 9, 'name': outcome}
+
+            pass_event = self._event('Pass', team, team, pattern, slot=carrier, location=location,
+                                     duration=duration, **{'pass': pass_info},
+                                     **({'under_pressure': True} if under_pressure else {}))
+            self.last_pass_id = pass_event['id']
+            self.clock += duration
+
+            if not success:
+                if pass_info['outcome']['name'] == 'Out':
+                    return opponent, 'From Throw In', _flip([target[0], 0.1 if target[1] < 40 else 79.9])
+                # Rakip topu kazanır
+                winner = self._nearest_slot(other, _flip(target))
+                kind = 'Interception' if rng.random() < 0.3 else 'Ball Recovery'
+                extra = {'interception': {'outcome': {'id': 16, 'name': 'Success In Play'}}} if kind == 'Interception' else {}
+                recovery = self._event(kind, opponent, opponent, 'Regular Play', slot=winner, location=_flip(target), **extra)
+                self._relate(pass_event, recovery)
+                return opponent, 'Regular Play', _flip(target)
+
+            receipt = self._event('Ball Receipt*', team, team, pattern, slot=recipient, location=target)
+            self._relate(pass_event, receipt)
+            carrier, location = recipient, target
+
+    def _xg(self, location):
+        """Mesafe ve açıya dayalı basit xG"""
+        distance = math.hypot(120 - location[0], 40 - location[1])
+        angle = abs(math.atan2(7.32 * (120 - location[0]),
+                               (120 - location[0]) ** 2 + (40 - location[1]) ** 2 - (7.32 / 2) ** 2))
+        return _clamp(1 / (1 + math.exp(-(-1.6 - 0.11 * distance + 1.6 * angle))), 0.01, 0.95)
+
+    def _shot(self, team, carrier, location, pattern):
+        rng = self.rng
+        opponent = 1 - team
+        side, other = self.sides[team], self.sides[opponent]
+        xg = self._xg(location)
+
+        roll = rng.random()
+        if roll < xg:
+            outcome = 'Goal'
+        else:
+            outcome = rng.choices(['Saved', 'Blocked', 'Off T', 'Wayward'], weights=[0.3, 0.35, 0.25, 0.1])[0]
+
+        if outcome in ('Goal', 'Saved'):
+            end = [120.0, round(rng.uniform(36.5, 43.5), 1), round(rng.uniform(0.1, 2.3), 1)]
+        elif outcome == 'Blocked':
+            end = [round(location[0] + rng.uniform(1, 6), 1), round(location[1] + rng.gauss(0, 2), 1)]
+        else:
+            end = [120.0, round(rng.choice([rng.uniform(25, 35.5), rng.uniform(44.5, 55)]), 1), round(rng.uniform(0, 4), 1)]
+
+        # Freeze frame: şutçunun yönünde diğer oyuncular
+        freeze_frame = []
+        for s, side_ in ((team, side), (opponent, other)):
+            for slot in side_.on_pitch:
+                if s == team and slot == carrier:
+                    continue
+                pos = side_.location(slot, location[0] if s == team else 120 - location[0], rng)
+                pos = pos if s == team else _flip(pos)
+                if pos[0] >= location[0] - 25:
+                    freeze_frame.append({
+                        'location': pos,
+                        'player': side_.player_ref(slot),
+                        'position': side_.position_ref(slot),
+                        'teammate': s == team,
+                    })
+
+        shot_info = {
+            'statsbomb_xg': round(xg, 9),
+            'end_location': end,
+            'type': {'id': 87, 'name': 'Open Play'},
+            'outcome': _ref(outcome, SHOT_OUTCOMES),
+            'technique': {'id': 93, 'name': 'Normal'},
+            'body_part': _ref(rng.choice(['Right Foot', 'Left Foot', 'Head']), BODY_PARTS),
+            'freeze_frame': freeze_frame,
+        }
+        if self.last_pass_id:
+            shot_info['key_pass_id'] = self.last_pass_id
+
+        duration = rng.uniform(0.5, 1.8)
+        shot = self._event('Shot', team, team, pattern, slot=carrier, location=location,
+                           duration=duration, shot=shot_info)
+        self.clock += duration
+
+        if outcome == 'Blocked':
+            blocker = self._nearest_slot(other, _flip(location))
+            block = self._event('Block', opponent, team, pattern, slot=blocker, location=_flip(end[:2]))
+            self._relate(shot, block)
+            return opponent, 'Regular Play', _flip(end[:2])
+
+        keeper_type = {'Goal': ('Goal Conceded', 28), 'Saved': ('Shot Saved', 33)}.get(outcome, ('Shot Faced', 32))
+        keeper = self._event('Goal Keeper', opponent, team, pattern, slot=0, location=[round(rng.uniform(1, 4), 1), 40.0],
+                             goalkeeper={'type': {'id': keeper_type[1], 'name': keeper_type[0]}})
+        self._relate(shot, keeper)
+
+        if outcome == 'Goal':
+            self.score[team] += 1
+            self.clock += rng.uniform(40, 80)
+            return opponent, 'From Kick Off', [60.0, 40.0]
+        if outcome == 'Saved':
+            return opponent, 'From Keeper', [6.0, 40.0]
+        return opponent, 'From Goal Kick', [6.0, round(rng.choice([30.0, 50.0]), 1)]
+
+    def _foul(self, team, carrier, location, pattern):
+        rng = self.rng
+        opponent = 1 - team
+        other = self.sides[opponent]
+        fouler = self._nearest_slot(other, _flip(location))
+
+        extra = {}
+        if rng.random() < 0.12:
+            player = other.on_pitch[fouler]
+            card = 'Second Yellow' if player['id'] in self.cards else 'Yellow Card'
+            extra = {'foul_committed': {'card': {'id': 6 if card == 'Second Yellow' else 7, 'name': card}}}
+            self.cards.setdefault(player['id'], []).append({
+                'time': _clock(self.clock + (45 * 60 if self.period == 2 else 0)),
+                'card_type': card,
+                'reason': 'Foul Committed',
+                'period': self.period,
+            })
+
+        committed = self._event('Foul Committed', opponent, team, pattern, slot=fouler, location=_flip(location), **extra)
+        won = self._event('Foul Won', team, team, pattern, slot=carrier, location=location)
+        self._relate(committed, won)
+        return team, 'From Free Kick', location
+
+    # --- Kadrolar ---
+
+    def lineups(self):
+        """StatsBomb lineups formatı (pozisyon aralıkları ve kartlarla)"""
+        result = []
+        for side in self.sides:
+            lineup = []
+            for player in side.team['players']:
+                positions = []
+                for slot, start, start_period, end, end_period, start_reason, end_reason in self.stints.get(player['id'], []):
+                    positions.append({
+                        'position_id': FORMATION_SLOTS[slot][0],
+                        'position': FORMATION_SLOTS[slot][1],
+                        'from': _clock(start),
+                        'to': _clock(end) if end is not None else None,
+                        'from_period': start_period,
+                        'to_period': end_period,
+                        'start_reason': start_reason,
+                        'end_reason': end_reason,
+                    })
+                lineup.append({
+                    'player_id': player['id'],
+                    'player_name': player['name'],
+                    'player_nickname': None,
+                    'jersey_number': player['jersey_number'],
+                    'country': {'id': 0, 'name': 'Synthetic'},
+                    'cards': self.cards.get(player['id'], []),
+                    'positions': positions,
+                })
+            result.append({'team_id': side.team['id'], 'team_name': side.team['name'], 'lineup': lineup})
+        return result
+
+
+def match_record(match_id, competition_id, season_id, season_name, week, match_date, home, away, score):
+    """StatsBomb matches formatında tek maç"""
+    return {
+        'match_id': match_id,
+        'match_date': match_date.isoformat(),
+        'kick_off': '15:30:00.000',
+        'competition': {'competition_id': competition_id, 'country_name': 'Synthetic', 'competition_name': 'Synthetic League'},
+        'season': {'season_id': season_id, 'season_name': season_name},
+        'home_team': {
+            'home_team_id': home['id'], 'home_team_name': home['name'], 'home_team_gender': 'male',
+            'home_team_group': None, 'country': {'id': 0, 'name': 'Synthetic'}, 'managers': [],
+        },
+        'away_team': {
+            'away_team_id': away['id'], 'away_team_name': away['name'], 'away_team_gender': 'male',
+            'away_team_group': None, 'country': {'id': 0, 'name': 'Synthetic'}, 'managers': [],
+        },
+        'home_score': score[0],
+        'away_score': score[1],
+        'match_status': 'available',
+        'match_status_360': 'unscheduled',
+        'last_updated': f"{match_date.isoformat()}T00:00:00.000000",
+        'last_updated_360': None,
+        'metadata': {'data_version': '1.1.0', 'shot_fidelity_version': '2', 'xy_fidelity_version': '2'},
+        'match_week': week,
+        'competition_stage': {'id': 1, 'name': 'Regular Season'},
+        'stadium': {'id': home['id'], 'name': f"{home['name']} Stadium", 'country': {'id': 0, 'name': 'Synthetic'}},
+        'referee': {'id': 0, 'name': 'Synthetic Referee', 'country': {'id': 0, 'name': 'Synthetic'}},
+    }
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def _generate_match(job):
+    """Tek maçı üret ve yaz (ProcessPool için modül seviyesinde)"""
+    match_id, home, away, seed, data_dir = job
+    simulator = MatchSimulator(match_id, home, away, seed)
+    events = simulator.run()
+    _write_json(os.path.join(data_dir, os.path.relpath(events_path(match_id), DATA_DIR)), events)
+    _write_json(os.path.join(data_dir, os.path.relpath(lineups_path(match_id), DATA_DIR)), simulator.lineups())
+    return match_id, tuple(simulator.score), len(events)
+
+
+def generate_season(n_matches, seed=0, n_teams=18, competition_id=SYNTHETIC_COMPETITION_ID,
+                    season_id=None, data_dir=DATA_DIR, workers=None):
+    """Sentetik sezon üret: matches, events ve lineups dosyaları
+
+    Dönen değer: (maç listesi, toplam olay sayısı)
+    """
+    season_id = seed if season_id is None else season_id
+    teams = make_teams(n_teams, seed)
+    schedule = fixtures(n_teams)
+    if n_matches > len(schedule):
+        # Fikstürden fazla maç istenirse yeni devreler ekle
+        rounds = -(-n_matches // len(schedule))
+        last_week = schedule[-1][0]
+        schedule = [(week + r * last_week, home, away) for r in range(rounds) for week, home, away in schedule]
+    schedule = schedule[:n_matches]
+
+    start = date(2030, 8, 17)
+    season_name = f"Synthetic {seed}"
+    base_id = SYNTHETIC_MATCH_ID_BASE + season_id * 100000
+
+    jobs = [(base_id + i, teams[home], teams[away], seed, data_dir) for i, (_, home, away) in enumerate(schedule)]
+    if workers == 1:
+        results = [_generate_match(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_generate_match, jobs, chunksize=4))
+
+    matches = [
+        match_record(match_id, competition_id, season_id, season_name, week,
+                     start + timedelta(days=7 * (week - 1)), teams[home], teams[away], score)
+        for (week, home, away), (match_id, score, _) in zip(schedule, results)
+    ]
+    _write_json(os.path.join(data_dir, os.path.relpath(matches_path(competition_id, season_id), DATA_DIR)), matches)
+    return matches, sum(r[2] for r in results)
+
+
+def competition_entry(competition_id, season_id, season_name):
+    """competitions.json kaydı"""
+    return {
+        'competition_id': competition_id,
+        'season_id': season_id,
+        'country_name': 'Synthetic',
+        'competition_name': 'Synthetic League',
+        'competition_gender': 'male',
+        'competition_youth': False,
+        'competition_international': False,
+        'season_name': season_name,
+        'match_updated': None,
+        'match_updated_360': None,
+        'match_available_360': None,
+        'match_available': None,
+    }
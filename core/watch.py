@@ -0,0 +1,139 @@
+"""
+StatsBomb Data Watcher
+data/ klasöründeki dosya değişikliklerine göre hedefli önbellek temizliği
+
+Maç başına önbellekli fonksiyonlar match_version() değerini de parametre
+olarak alır: events/lineups dosyasının (mtime_ns, boyut) ikilisi anahtarın
+parçasıdır, dosya değişince eski girdi bir daha okunmaz. DataWatcher arka
+planda data/events, data/lineups ve data/matches klasörlerini tarar ve
+yalnızca dosyası değişen maçların (core.cache.evict_match) ve sezonların
+(core.cache.evict_season) girdilerini siler; böylece eski sürümler TTL'i
+beklemeden bellekten çıkar, diğer maçların sıcak önbellekleri korunur.
+Değişen kadrolar oyuncu indeksine (core.player_index) de işlenir.
+refresh_match() sayfalardaki "bu maçı yenile" eylemidir.
+
+Tarama aralığı STATSBOMB_WATCH_INTERVAL ortam değişkeniyle ayarlanır
+(saniye, varsayılan 5; 0 izlemeyi kapatır).
+"""
+
+import os
+import threading
+
+from core.cache import evict_match, evict_season
+from core.loaders import DATA_DIR, events_path, lineups_path, file_version
+from core.match_cache import invalidate_match
+from core.player_index import notify_changed
+
+WATCH_INTERVAL = float(os.environ.get("STATSBOMB_WATCH_INTERVAL", "5"))
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def match_version(match_id):
+    """Maçın kaynak dosyalarının sürümü (önbellek anahtarına eklenir)"""
+    return file_version(events_path(match_id)), file_version(lineups_path(match_id))
+
+
+def _scan(folder):
+    """Klasördeki .json (ve .json.gz/.json.zst) dosyaları → sürüm (alt klasörler dahil)"""
+    versions = {}
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return versions
+    for entry in entries:
+        if entry.is_dir():
+            versions.update(_scan(entry.path))
+        elif entry.name.endswith((".json", ".json.gz", ".json.zst")):
+            stat = entry.stat()
+            versions[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return versions
+
+
+class DataWatcher:
+    """data/ altındaki maç dosyalarını tarayıp değişenlerin önbelleğini silen izleyici"""
+
+    def __init__(self, data_dir=DATA_DIR, interval=WATCH_INTERVAL):
+        self.data_dir = data_dir
+        self.interval = interval
+        self.snapshot = self.scan()
+        self.invalidated = {'matches': 0, 'seasons': 0, 'entries': 0}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def scan(self):
+        versions = {}
+        for folder in ("events", "lineups", "matches"):
+            versions.update(_scan(os.path.join(self.data_dir, folder)))
+        return versions
+
+    def changes(self):
+        """Son taramadan beri değişen (eklenen/silinen dahil) maç ID'leri ve sezonlar"""
+        current = self.scan()
+        changed = {
+            path for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+
+        match_ids, seasons = set(), set()
+        for path in changed:
+            folder, name = os.path.split(os.path.relpath(path, self.data_dir))
+            stem = name.split(".")[0]
+            try:
+                if folder in ("events", "lineups"):
+                    match_ids.add(int(stem))
+                elif os.path.dirname(folder) == "matches":
+                    seasons.add((int(os.path.basename(folder)), int(stem)))
+            except ValueError:
+                continue  # beklenmeyen dosya adı
+        return sorted(match_ids), sorted(seasons)
+
+    def poll(self):
+        """Bir tarama yap ve değişenlerin önbellek girdilerini sil"""
+        match_ids, seasons = self.changes()
+        for match_id in match_ids:
+            self.invalidated['entries'] += evict_match(match_id)
+        for competition_id, season_id in seasons:
+            self.invalidated['entries'] += evict_season(competition_id, season_id)
+        notify_changed(match_ids)
+        self.invalidated['matches'] += len(match_ids)
+        self.invalidated['seasons'] += len(seasons)
+        return match_ids, seasons
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # İzleyici ölmesin; bir sonraki taramada tekrar denenir
+                print(f"⚠️  Data watcher: {type(e).__name__}: {e}")
+
+    def start(self):
+        if self._thread is None and self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name="data-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+
+def refresh_match(match_id):
+    """Tek bir maçı yenile: kalıcı dosyaları ve tüm katmanlardaki girdileri sil"""
+    invalidate_match(match_id)
+    return evict_match(match_id)
+
+
+def start_watcher():
+    """Süreç başına tek izleyiciyi başlat (sayfalar her rerun'da çağırabilir)"""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = DataWatcher().start()
+        return _watcher
@@ -0,0 +1,385 @@
+"""
+StatsBomb Chart Export
+Sezon boyu grafikleri toplu olarak dosyaya kaydet (Streamlit olmadan)
+
+Kullanım:
+python export_charts.py
+python export_charts.py --matches 3895292 --charts shot_map pass_network --format svg
+python export_charts.py --teams "Bayer Leverkusen" --workers 4 --force
+python export_charts.py --charts season_shots season_pressures --density-style hex
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from core.loaders import events_path, load_events_df, load_season_matches, raw_exists, raw_mtime
+from core.plots import plot_shot_map, plot_pass_network, plot_pass_diagram
+from core.metrics import analyze_passes
+from core.density import season_layer, plot_density_map
+
+COMPETITION_ID = 9      # 1. Bundesliga
+SEASON_ID = 281         # 2023/2024
+
+CHART_TYPES = ["shot_map", "pass_network", "pass_diagram"]
+
+# Sezon boyu (takım başına tek grafik) yoğunluk haritaları → density katmanı
+SEASON_CHART_TYPES = {
+    "season_shots": ("shots", "Shots"),
+    "season_xg": ("shots_xg", "xG"),
+    "season_passes": ("passes", "Passes"),
+    "season_pressures": ("pressures", "Pressures"),
+}
+FORMATS = ["png", "svg", "pdf"]
+
+# Pass Networks sayfasındaki gibi: sadece 5+ paslı ikililer için diyagram
+MIN_DIAGRAM_PASSES = 5
+
+
+def slugify(text):
+    """Dosya adı için güvenli metin"""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^A-Za-z0-9]+', '_', text).strip('_')
+
+
+def pass_diagram_pairs(events_df, team_name, is_home_team):
+    """Diyagram çizilecek pas ikililerini bul"""
+    pass_df = analyze_passes(events_df, team_name, is_home_team)
+    if len(pass_df) == 0:
+        return []
+    counts = pass_df.groupby(['from', 'to']).size()
+    counts = counts[counts >= MIN_DIAGRAM_PASSES]
+    return list(counts.index)
+
+
+def chart_targets(events_df, team_name, is_home_team, charts, match_dir, fmt):
+    """(grafik tipi, dosya yolu, çizim fonksiyonu) listesi"""
+    team_slug = slugify(team_name)
+    targets = []
+
+    if "shot_map" in charts:
+        targets.append((
+            "shot_map",
+            os.path.join(match_dir, f"{team_slug}_shot_map.{fmt}"),
+            lambda: plot_shot_map(events_df, team_name)
+        ))
+
+    if "pass_network" in charts:
+        targets.append((
+            "pass_network",
+            os.path.join(match_dir, f"{team_slug}_pass_network.{fmt}"),
+            lambda: plot_pass_network(events_df, team_name, min_passes=2)
+        ))
+
+    if "pass_diagram" in charts:
+        for passer, receiver in pass_diagram_pairs(events_df, team_name, is_home_team):
+            file_name = f"{team_slug}_pass_diagram_{slugify(passer)}__{slugify(receiver)}.{fmt}"
+            targets.append((
+                "pass_diagram",
+                os.path.join(match_dir, file_name),
+                lambda p=passer, r=receiver: plot_pass_diagram(events_df, team_name, p, r, is_home_team)
+            ))
+
+    return targets
+
+
+def known_targets(job, match_dir):
+    """Olayları okumadan bilinen çıktı yolları: (grafik, yol); diyagram ikilileri önceki manifest'ten
+
+    Diyagram ikilileri olaylardan hesaplanır; önceki çalıştırmada bu maç/takım
+    için kayıt yoksa None döner (olaylar okunmalı). İkilisi olmayan maç/takım
+    (pass_diagram, None) olarak döner; boş kayıt sonraki manifest'e de yazılır.
+    """
+    team_slug = slugify(job['team'])
+    targets = [
+        (chart, os.path.join(match_dir, f"{team_slug}_{chart}.{job['format']}"))
+        for chart in ("shot_map", "pass_network") if chart in job['charts']
+    ]
+    if "pass_diagram" in job['charts']:
+        previous = job.get('previous_diagrams')
+        if previous is None:
+            return None
+        targets += [("pass_diagram", path) for path in previous] or [("pass_diagram", None)]
+    return targets
+
+
+def export_team(job):
+    """Bir maçta tek takımın tüm grafiklerini çiz (worker içinde çalışır)"""
+    match_id = job['match_id']
+    team_name = job['team']
+
+    source_mtime = raw_mtime(events_path(match_id))
+    match_dir = os.path.join(job['out_dir'], str(match_id))
+
+    def is_fresh(path):
+        return os.path.exists(path) and os.path.getmtime(path) >= source_mtime
+
+    # Tüm çıktılar kaynak dosyadan yeniyse olayları hiç okuma
+    known = None if job['force'] else known_targets(job, match_dir)
+    if known is not None and all(path is None or is_fresh(path) for _, path in known):
+        return [
+            {'match_id': match_id, 'team': team_name, 'chart': chart, 'path': path,
+             'status': 'skipped' if path else 'empty', **({'bytes': os.path.getsize(path)} if path else {})}
+            for chart, path in known
+        ]
+
+    events = load_events_df(match_id)
+    os.makedirs(match_dir, exist_ok=True)
+
+    entries = []
+    targets = chart_targets(events, team_name, job['is_home_team'], job['charts'], match_dir, job['format'])
+    if "pass_diagram" in job['charts'] and not any(chart == "pass_diagram" for chart, _, _ in targets):
+        # İkili yok: manifest'te kayıt kalsın ki sonraki çalıştırma olayları tekrar okumasın
+        entries.append({'match_id': match_id, 'team': team_name, 'chart': 'pass_diagram', 'path': None,
+                        'status': 'empty'})
+
+    for chart, path, draw in targets:
+        entry = {'match_id': match_id, 'team': team_name, 'chart': chart, 'path': path}
+
+        # Kaynak dosyadan yeni ise tekrar çizme
+        if not job['force'] and is_fresh(path):
+            entry['status'] = 'skipped'
+        else:
+            fig = draw()
+            if fig is None:
+                entry['status'] = 'empty'
+                # Eski çıktı güncel görünmesin
+                if os.path.exists(path):
+                    os.remove(path)
+            else:
+                fig.savefig(path, format=job['format'], dpi=job['dpi'],
+                            facecolor=fig.get_facecolor(), bbox_inches='tight')
+                plt.close(fig)
+                entry['status'] = 'rendered'
+
+        if entry['status'] != 'empty':
+            entry['bytes'] = os.path.getsize(path)
+        entries.append(entry)
+
+    return entries
+
+
+def load_manifest(out_dir):
+    """Önceki çalıştırmanın manifest'i (yoksa/bozuksa {})"""
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def merge_entries(previous, entries, missing_ids):
+    """Önceki manifest kayıtlarına bu çalıştırmanınkileri işle
+
+    Bu çalıştırmada üretilen (maç, takım, grafik) kayıtları eskilerinin yerini
+    alır; --matches/--teams ile kısmi çalıştırma diğer maçların kayıtlarını silmez.
+    """
+    def key(entry):
+        return entry.get('match_id'), entry.get('team'), entry.get('chart')
+
+    replaced = {key(entry) for entry in entries}
+    present_ids = {entry['match_id'] for entry in entries if 'match_id' in entry} - missing_ids
+    kept = [
+        entry for entry in previous
+        if key(entry) not in replaced
+        and entry.get('match_id') not in missing_ids
+        and not (entry['status'] == 'missing' and entry.get('match_id') in present_ids)
+    ]
+    return kept + entries
+
+
+def previous_diagrams(manifest, fmt):
+    """Önceki manifest'teki diyagram çıktıları: (match_id, takım) → yollar"""
+    if manifest.get('format') != fmt:
+        return {}
+    diagrams = {}
+    for entry in manifest.get('entries', []):
+        if entry.get('chart') != 'pass_diagram':
+            continue
+        paths = diagrams.setdefault((entry['match_id'], entry['team']), [])
+        if entry.get('path'):
+            paths.append(entry['path'])
+    return diagrams
+
+
+def export_season_team(job):
+    """Takımın sezon yoğunluk haritalarını çiz (worker içinde çalışır)"""
+    team_name = job['team']
+    match_ids = job['match_ids']
+    season_dir = os.path.join(job['out_dir'], f"season_{job['competition_id']}_{job['season_id']}")
+    os.makedirs(season_dir, exist_ok=True)
+
+    source_mtime = max(raw_mtime(events_path(match_id)) for match_id in match_ids)
+
+    entries = []
+    for chart in job['charts']:
+        layer, label = SEASON_CHART_TYPES[chart]
+        path = os.path.join(season_dir, f"{slugify(team_name)}_{chart}.{job['format']}")
+        entry = {'team': team_name, 'chart': chart, 'path': path, 'matches': len(match_ids)}
+
+        if not job['force'] and os.path.exists(path) and os.path.getmtime(path) >= source_mtime:
+            entry['status'] = 'skipped'
+        else:
+            grid, n_points, points = season_layer(match_ids, team_name, layer)
+            fig = plot_density_map(grid, f'{team_name} - Season {label}', n_points, points,
+                                   weighted=(layer == 'shots_xg'), style=job['density_style'])
+            fig.savefig(path, format=job['format'], dpi=job['dpi'],
+                        facecolor=fig.get_facecolor(), bbox_inches='tight')
+            plt.close(fig)
+            entry['status'] = 'rendered'
+
+        entry['bytes'] = os.path.getsize(path)
+        entries.append(entry)
+
+    return entries
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export StatsBomb charts without Streamlit")
+    parser.add_argument("--competition", type=int, default=COMPETITION_ID)
+    parser.add_argument("--season", type=int, default=SEASON_ID)
+    parser.add_argument("--matches", type=int, nargs="*", help="Match IDs (default: whole season)")
+    parser.add_argument("--teams", nargs="*", help="Team names (default: both teams)")
+    parser.add_argument("--charts", nargs="*", choices=CHART_TYPES + list(SEASON_CHART_TYPES), default=CHART_TYPES)
+    parser.add_argument("--density-style", choices=["grid", "hex"], default="grid")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="exports")
+    parser.add_argument("--force", action="store_true", help="Re-render even if up to date")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    season_matches = load_season_matches(args.competition, args.season)
+    if not season_matches:
+        print(f"❌ No matches found for competition {args.competition}, season {args.season}")
+        return
+
+    matches = season_matches
+    if args.matches:
+        matches = [m for m in matches if m['match_id'] in args.matches]
+    if args.teams:
+        matches = [
+            m for m in matches
+            if m['home_team']['home_team_name'] in args.teams
+            or m['away_team']['away_team_name'] in args.teams
+        ]
+
+    print(f"🚀 Exporting {', '.join(args.charts)} for {len(matches)} matches "
+          f"({args.format}, {args.workers} workers)\n")
+
+    start = time.perf_counter()
+    entries = []
+
+    match_charts = [c for c in args.charts if c in CHART_TYPES]
+    season_charts = [c for c in args.charts if c in SEASON_CHART_TYPES]
+
+    # Her (maç, takım) ikilisi ayrı bir iş
+    jobs = []
+    team_matches = {}
+    previous = load_manifest(args.out)
+    diagrams = previous_diagrams(previous, args.format)
+    for match in matches:
+        match_id = match['match_id']
+        if not raw_exists(events_path(match_id)):
+            entries.append({'match_id': match_id, 'status': 'missing', 'path': events_path(match_id)})
+            continue
+
+        home_team = match['home_team']['home_team_name']
+        away_team = match['away_team']['away_team_name']
+        for team_name in (home_team, away_team):
+            if args.teams and team_name not in args.teams:
+                continue
+            team_matches.setdefault(team_name, []).append(match_id)
+            if not match_charts:
+                continue
+            jobs.append({
+                'match_id': match_id,
+                'team': team_name,
+                'is_home_team': team_name == home_team,
+                'charts': match_charts,
+                'format': args.format,
+                'dpi': args.dpi,
+                'out_dir': args.out,
+                'force': args.force,
+                'previous_diagrams': diagrams.get((match_id, team_name)),
+            })
+
+    # Her takım için sezon haritaları ayrı bir iş
+    season_jobs = []
+    if season_charts:
+        season_jobs = [{
+            'team': team_name,
+            'match_ids': match_ids,
+            'competition_id': args.competition,
+            'season_id': args.season,
+            'charts': season_charts,
+            'density_style': args.density_style,
+            'format': args.format,
+            'dpi': args.dpi,
+            'out_dir': args.out,
+            'force': args.force,
+        } for team_name, match_ids in sorted(team_matches.items())]
+
+    if args.workers > 1 and len(jobs) + len(season_jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for job_entries in pool.map(export_team, jobs):
+                entries.extend(job_entries)
+            for job_entries in pool.map(export_season_team, season_jobs):
+                entries.extend(job_entries)
+    else:
+        for job in jobs:
+            entries.extend(export_team(job))
+        for job in season_jobs:
+            entries.extend(export_season_team(job))
+    elapsed = time.perf_counter() - start
+
+    counts = {}
+    for entry in entries:
+        counts[entry['status']] = counts.get(entry['status'], 0) + 1
+    rendered = counts.get('rendered', 0)
+    charts_per_second = rendered / elapsed if elapsed > 0 else 0
+
+    # Aynı sezon/format manifest'i varsa birleştir (kısmi çalıştırma diğer kayıtları korur)
+    charts = args.charts
+    same_export = (previous.get('competition_id'), previous.get('season_id'), previous.get('format'))
+    if same_export == (args.competition, args.season, args.format):
+        missing_ids = {entry['match_id'] for entry in entries if entry['status'] == 'missing'}
+        entries = merge_entries(previous.get('entries', []), entries, missing_ids)
+        charts = [c for c in CHART_TYPES + list(SEASON_CHART_TYPES)
+                  if c in args.charts or c in previous.get('charts', [])]
+
+    os.makedirs(args.out, exist_ok=True)
+    manifest_path = os.path.join(args.out, "manifest.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'competition_id': args.competition,
+            'season_id': args.season,
+            'format': args.format,
+            'charts': charts,
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'elapsed_seconds': round(elapsed, 3),
+            'charts_per_second': round(charts_per_second, 2),
+            'counts': counts,
+            'entries': entries,
+        }, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Rendered: {rendered} | ⏭️  Up to date: {counts.get('skipped', 0)} | "
+          f"⚠️  Empty: {counts.get('empty', 0)} | ❌ Missing events: {counts.get('missing', 0)}")
+    print(f"⏱️  {elapsed:.1f}s → {charts_per_second:.2f} charts/s")
+    print(f"📄 Manifest: {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+StatsBomb Synthetic Data Generator
+Ölçek testleri için sentetik matches / events / lineups dosyaları üret
+
+Kullanım:
+python generate_synthetic.py --matches 34
+python generate_synthetic.py --matches 306 --teams 18 --seed 7 --register
+python generate_synthetic.py --matches 2000 --out /tmp/synthetic_data --workers 8
+"""
+
+import argparse
+import json
+import os
+import time
+
+from core.loaders import DATA_DIR
+from core.synthetic import SYNTHETIC_COMPETITION_ID, competition_entry, generate_season
+
+
+def register(data_dir, competition_id, season_id, season_name):
+    """Sentetik sezonu competitions.json'a ekle (varsa güncelle)"""
+    path = os.path.join(data_dir, "competitions.json")
+    competitions = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            competitions = json.load(f)
+
+    competitions = [
+        c for c in competitions
+        if (c['competition_id'], c['season_id']) != (competition_id, season_id)
+    ]
+    competitions.append(competition_entry(competition_id, season_id, season_name))
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(competitions, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic StatsBomb-format data")
+    parser.add_argument("--matches", type=int, default=34, help="Number of matches")
+    parser.add_argument("--teams", type=int, default=18)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--competition", type=int, default=SYNTHETIC_COMPETITION_ID)
+    parser.add_argument("--season", type=int, help="Season ID (default: seed)")
+    parser.add_argument("--out", default=DATA_DIR, help="Data directory (default: data)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--register", action="store_true", help="Add the season to competitions.json")
+    args = parser.parse_args()
+
+    if args.teams < 2:
+        parser.error("--teams must be at least 2")
+
+    season_id = args.seed if args.season is None else args.season
+    print(f"🚀 Generating {args.matches} matches ({args.teams} teams, seed {args.seed}) into {args.out}/\n")
+
+    start = time.perf_counter()
+    matches, n_events = generate_season(
+        args.matches, seed=args.seed, n_teams=args.teams, competition_id=args.competition,
+        season_id=season_id, data_dir=args.out, workers=args.workers
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {len(matches)} matches, {n_events} events in {elapsed:.1f}s")
+    print(f"📁 {args.out}/matches/{args.competition}/{season_id}.json")
+    if matches:
+        print(f"⚽ Match IDs: {matches[0]['match_id']} … {matches[-1]['match_id']}")
+
+    if args.register:
+        path = register(args.out, args.competition, season_id, matches[0]['season']['season_name'] if matches else "")
+        print(f"📝 Registered in {path}")
+
+
+if __name__ == "__main__":
+    main()
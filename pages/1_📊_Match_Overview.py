@@ -2,21 +2,31 @@
 StatsBomb Match Detail Page
 Detaylı maç analizi sayfası
 
-Kullanım:
-streamlit run match_detail.py
+Dosya yolu: pages/1_📊_Match_Overview.py
+
+Kullanım (uygulama Home.py'den açılır, sayfa kenar çubuğunda):
+streamlit run Home.py
 """
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import requests
-import time
-from matplotlib.patches import Rectangle, Arc
-import seaborn as sns
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from core.fetch import DeadlineExceeded, deadline, gather
+from core.remote import get_store
+from core.loaders import raw_exists
+from core.plots import plot_shot_map, plot_pass_network, figure_png
+from core.payloads import shot_map_payload, pass_network_payload, vega_lite_spec
+from core.metrics import calculate_team_stats
+from core.perf import span, trace_page, show_perf_panel
+from core.cache import observed
+from core.event_store import shared_events, shared_lineups
+from core.intervals import match_intervals
+from core.watch import match_version, refresh_match, start_watcher
+from core.match_cache import has_local_events, load_match_metrics, load_figure_png, load_figure_debug
 
-# Doğru BASE URL
-BASE_URL = "https://raw.githubusercontent.com/statsbomb/open-data/refs/heads/master/data/"
+# Maç verisi yüklemelerinin toplam süre sınırı (saniye)
+LOAD_DEADLINE = 30
 
 # Sayfa konfigürasyonu
 st.set_page_config(
@@ -54,40 +64,48 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def fetch_with_retry(url, max_retries=3, timeout=10):
-    """Retry mekanizması ile veri çekme"""
-    for attempt in range(max_retries):
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, timeout=timeout, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep((attempt + 1) * 2)
-            else:
-                st.error(f"❌ Failed to load data: {str(e)}")
-                return None
-    return None
+def load_concurrently(calls):
+    """Bağımsız yüklemeleri aynı anda çalıştır; toplam süre LOAD_DEADLINE ile sınırlı"""
+    ctx = get_script_run_ctx()
+    
+    def in_script_thread(name, fn):
+        # Önbellek ve st.* çağrıları için thread'e oturum bağlamını ekle
+        def run():
+            add_script_run_ctx(ctx=ctx)
+            with span(name, "load"):
+                return fn()
+        return run
+    
+    with deadline(LOAD_DEADLINE):
+        results, errors = gather({name: in_script_thread(name, fn) for name, fn in calls.items()})
+    
+    for name, error in errors.items():
+        if isinstance(error, DeadlineExceeded):
+            st.warning(f"⏱️ {name} did not load within {LOAD_DEADLINE}s")
+        else:
+            st.error(f"❌ Failed to load data: {str(error)}")
+    return results
+
+# Yükleyiciler yerel öncelikli katmandan okur (core/remote.py): bellek → data/ → ağ.
+# Ağ hatası ve diskte kopya yoksa exception fırlatılır; hata önbelleğe alınmaz.
 
-@st.cache_data(ttl=3600)
+@observed(st.cache_data(ttl=3600), "Match Overview", "loader", ttl=3600, match_arg="match_id")
 def load_match_info(match_id):
     """Maç bilgilerini yükle"""
-    # Tüm maçları tara ve bu match_id'yi bul
-    competitions_url = f"{BASE_URL}competitions.json"
-    competitions_data = fetch_with_retry(competitions_url)
+    store = get_store()
+    competitions_data = store.get_json("competitions.json")
     
     if not competitions_data:
         return None
     
     competitions = pd.DataFrame(competitions_data)
+    seasons = list(zip(competitions['competition_id'], competitions['season_id']))
+    # Önce lokal kopyası olan sezonlar: maç çoğu zaman ağa gitmeden bulunur
+    seasons.sort(key=lambda cs: not raw_exists(store.local_path(f"matches/{cs[0]}/{cs[1]}.json")))
     
     # Her competition/season kombinasyonunu kontrol et
-    for _, comp in competitions.iterrows():
-        matches_url = f"{BASE_URL}matches/{comp['competition_id']}/{comp['season_id']}.json"
-        matches_data = fetch_with_retry(matches_url)
+    for competition_id, season_id in seasons:
+        matches_data = store.get_json(f"matches/{competition_id}/{season_id}.json")
         
         if matches_data:
             matches = pd.DataFrame(matches_data)
@@ -98,318 +116,99 @@ def load_match_info(match_id):
     
     return None
 
-@st.cache_data(ttl=3600)
 def load_events(match_id):
-    """Maç olaylarını yükle"""
-    url = f"{BASE_URL}events/{match_id}.json"
-    data = fetch_with_retry(url, max_retries=5, timeout=15)
-    
-    if data:
-        return pd.DataFrame(data)
-    return None
+    """Maç olaylarını yükle (core/event_store.py: süreç genelinde paylaşılan salt okunur tablo)
 
-@st.cache_data(ttl=3600)
-def load_lineups(match_id):
+    Ayrı bir st.cache_resource katmanı yok: tabloları yalnızca paylaşılan depo
+    tutar, böylece SHARED_MAX_MATCHES sınırı geçerli kalır; dosya sürümünü depo kontrol eder.
+    """
+    # Dosya diske indirilir; tablo ön yüklemeyle (core/prefetch.py) paylaşılan depodan
+    if get_store().ensure_local(f"events/{match_id}.json") is None:
+        return None
+    return shared_events(match_id)
+
+@observed(st.cache_data(ttl=3600), "Match Overview", "loader", ttl=3600, match_arg="match_id")
+def load_lineups(match_id, version=None):
     """Kadroları yükle"""
-    url = f"{BASE_URL}lineups/{match_id}.json"
-    data = fetch_with_retry(url)
-    return data if data else []
+    if get_store().ensure_local(f"lineups/{match_id}.json") is None:
+        return []
+    return shared_lineups(match_id) or []
 
-def draw_pitch(ax, pitch_color='#1e3a1e', line_color='white'):
-    """Futbol sahası çiz"""
-    pitch_length = 120
-    pitch_width = 80
-    
-    # Saha zemini
-    ax.add_patch(Rectangle((0, 0), pitch_length, pitch_width, 
-                           facecolor=pitch_color, edgecolor=line_color, linewidth=2))
-    
-    # Kenar çizgileri
-    ax.plot([0, 0], [0, pitch_width], color=line_color, linewidth=2)
-    ax.plot([0, pitch_length], [pitch_width, pitch_width], color=line_color, linewidth=2)
-    ax.plot([pitch_length, pitch_length], [pitch_width, 0], color=line_color, linewidth=2)
-    ax.plot([pitch_length, 0], [0, 0], color=line_color, linewidth=2)
-    
-    # Orta çizgi
-    ax.plot([pitch_length/2, pitch_length/2], [0, pitch_width], color=line_color, linewidth=2)
-    
-    # Orta daire
-    center_circle = plt.Circle((pitch_length/2, pitch_width/2), 9.15, 
-                               color=line_color, fill=False, linewidth=2)
-    ax.add_patch(center_circle)
-    
-    # Sol ceza sahası
-    ax.add_patch(Rectangle((0, 18), 18, 44, fill=False, edgecolor=line_color, linewidth=2))
-    ax.add_patch(Rectangle((0, 30), 6, 20, fill=False, edgecolor=line_color, linewidth=2))
-    
-    # Sağ ceza sahası
-    ax.add_patch(Rectangle((102, 18), 18, 44, fill=False, edgecolor=line_color, linewidth=2))
-    ax.add_patch(Rectangle((114, 30), 6, 20, fill=False, edgecolor=line_color, linewidth=2))
-    
-    # Penaltı noktaları
-    ax.plot(12, 40, 'o', color=line_color, markersize=4)
-    ax.plot(108, 40, 'o', color=line_color, markersize=4)
-    
-    ax.set_xlim(-2, pitch_length + 2)
-    ax.set_ylim(-2, pitch_width + 2)
-    ax.axis('off')
-    ax.set_aspect('equal')
+@observed(st.cache_resource(ttl=3600), "Match Overview", "index", ttl=3600, match_arg="match_id")
+def load_intervals(match_id, version=None):
+    """Oyuncuların sahada kalma aralıkları (salt okunur, oturumlar arasında paylaşılır)"""
+    return match_intervals(match_id, load_lineups(match_id, version))
 
-def plot_shot_map(events_df, team_name):
-    """Şut haritası"""
-    # Team bilgisini string'e çevir
-    events_df_copy = events_df.copy()
-    events_df_copy['team_name'] = events_df_copy['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    
-    shots = events_df_copy[
-        (events_df_copy['type'].apply(lambda x: x['name'] == 'Shot')) &
-        (events_df_copy['team_name'] == team_name)
-    ].copy()
-    
-    if len(shots) == 0:
-        return None
-    
-    # Şut detayları
-    shots['outcome'] = shots['shot'].apply(
-        lambda x: x.get('outcome', {}).get('name', 'Unknown') if isinstance(x, dict) else 'Unknown'
-    )
-    shots['xg'] = shots['shot'].apply(
-        lambda x: x.get('statsbomb_xg', 0) if isinstance(x, dict) else 0
-    )
-    shots['x'] = shots['location'].apply(lambda x: x[0] if x else None)
-    shots['y'] = shots['location'].apply(lambda x: x[1] if x else None)
-    
-    # Grafik
-    fig, ax = plt.subplots(figsize=(12, 8))
-    draw_pitch(ax)
-    
-    # Goller
-    goals = shots[shots['outcome'] == 'Goal']
-    # Gol olmayanlar
-    non_goals = shots[shots['outcome'] != 'Goal']
-    
-    # Şutları çiz (xG'ye göre boyut)
-    if len(non_goals) > 0:
-        scatter1 = ax.scatter(non_goals['x'], non_goals['y'], 
-                             s=non_goals['xg']*1000, c='red', alpha=0.6, 
-                             edgecolors='white', linewidths=2, label='No Goal')
-    
-    if len(goals) > 0:
-        scatter2 = ax.scatter(goals['x'], goals['y'], 
-                             s=goals['xg']*1000 + 200, c='lime', alpha=0.9, 
-                             edgecolors='white', linewidths=3, marker='*', label='Goal')
-    
-    ax.set_title(f'{team_name} - Shot Map', fontsize=16, color='white', pad=20)
-    ax.legend(loc='upper left', fontsize=12)
-    
-    fig.patch.set_facecolor('#0e1117')
-    return fig
+@observed(st.cache_data(ttl=3600), "Match Overview", "metric", ttl=3600, match_arg="match_id")
+def team_stats(match_id, team_name, version=None):
+    """Takım istatistikleri (maç başına önbellekli, warm-up sonrası diskten)"""
+    metrics = load_match_metrics(match_id)
+    if metrics is not None and team_name in metrics:
+        return metrics[team_name]['team_stats']
+    return calculate_team_stats(load_events(match_id), team_name)
 
-def plot_pass_network(events_df, team_name, min_passes=2, debug=False):
-    """Paslaşma ağı"""
-    # Team bilgisini string'e çevir
-    events_df_copy = events_df.copy()
-    events_df_copy['team_name'] = events_df_copy['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    
-    passes = events_df_copy[
-        (events_df_copy['type'].apply(lambda x: x['name'] == 'Pass')) &
-        (events_df_copy['team_name'] == team_name)
-    ].copy()
-    
-    # Debug bilgisi
-    if debug:
-        st.markdown(f"""
-            <p title="How many times {team_name} attempted a pass">
-                📊 Debug - Total passes for {team_name}: <strong>{len(passes)}</strong>
-            </p>
-        """, unsafe_allow_html=True)
-    
-    # Başarılı paslar
-    passes['successful'] = passes['pass'].apply(
-        lambda x: x.get('outcome') is None if isinstance(x, dict) else False
-    )
-    successful_passes = passes[passes['successful']]
-    
-    if debug:
-        st.markdown(f"""
-            <p title="Passes that reached a teammate">
-                ✅ Successful passes: <strong>{len(successful_passes)}</strong>
-            </p>
-        """, unsafe_allow_html=True)
-    
-    if len(successful_passes) == 0:
-        return None
-    
-    # Paslaşma çiftleri
-    pass_pairs = []
-    for _, row in successful_passes.iterrows():
-        # Player bilgisi dictionary olabilir
-        passer_info = row.get('player')
-        if isinstance(passer_info, dict):
-            passer = passer_info.get('name')
-        elif isinstance(passer_info, str):
-            passer = passer_info
-        else:
-            passer = None
-        
-        # Pass dictionary'den recipient'i çıkar
-        pass_dict = row.get('pass')
-        recipient = None
-        
-        if isinstance(pass_dict, dict):
-            recipient_info = pass_dict.get('recipient')
-            if isinstance(recipient_info, dict):
-                recipient = recipient_info.get('name')
-            elif isinstance(recipient_info, str):
-                recipient = recipient_info
-        
-        # İkisi de string ise ekle
-        if passer and recipient and isinstance(passer, str) and isinstance(recipient, str):
-            pass_pairs.append((passer, recipient))
-    
-    if debug:
-        st.markdown(f"""
-            <p title="All player-to-player passes found (e.g. Player A → Player B)">
-                🔗 Pass pairs found: <strong>{len(pass_pairs)}</strong>
-            </p>
-        """, unsafe_allow_html=True)
-    
-    if len(pass_pairs) == 0:
-        if debug:
-            st.write("⚠️ No valid pass pairs found")
-        return None
-    
-    pass_counts = pd.DataFrame(pass_pairs, columns=['from', 'to'])
-    pass_counts = pass_counts.groupby(['from', 'to']).size().reset_index(name='count')
-    
-    if debug:
-        st.markdown(f"""
-            <p title="Grouped by player pairs (e.g. if A passed to B 5 times, this counts as 1 unique connection)">
-                📊 Unique connections: <strong>{len(pass_counts)}</strong>
-            </p>
-        """, unsafe_allow_html=True)
-        st.markdown(f"""
-            <p title="Only showing connections with at least {min_passes} passes between the same two players">
-                🎯 After filtering (min {min_passes} passes): <strong>{len(pass_counts[pass_counts['count'] >= min_passes])}</strong>
-            </p>
-        """, unsafe_allow_html=True)
-    
-    pass_counts = pass_counts[pass_counts['count'] >= min_passes]
-    
-    if len(pass_counts) == 0:
-        return None
-    
-    # Oyuncu pozisyonları
-    player_positions = {}
-    for _, row in successful_passes.iterrows():
-        # Player bilgisi dictionary olabilir
-        player_info = row.get('player')
-        if isinstance(player_info, dict):
-            player = player_info.get('name')
-        elif isinstance(player_info, str):
-            player = player_info
-        else:
-            continue
-        
-        location = row.get('location')
-        if location and player:
-            if player not in player_positions:
-                player_positions[player] = []
-            player_positions[player].append(location)
-    
-    # Ortalama pozisyon hesapla
-    avg_positions = {}
-    for player, locations in player_positions.items():
-        if len(locations) > 0:
-            avg_x = np.mean([loc[0] for loc in locations])
-            avg_y = np.mean([loc[1] for loc in locations])
-            avg_positions[player] = (avg_x, avg_y)
-    
-    if debug:
-        st.markdown(f"""
-            <p title="Players shown on the network diagram">
-                👥 Players with positions: <strong>{len(avg_positions)}</strong>
-            </p>
-        """, unsafe_allow_html=True)
-    
-    # Grafik
-    fig, ax = plt.subplots(figsize=(14, 10))
-    draw_pitch(ax)
-    
-    # Pasları çiz
-    for _, row in pass_counts.iterrows():
-        if row['from'] in avg_positions and row['to'] in avg_positions:
-            x1, y1 = avg_positions[row['from']]
-            x2, y2 = avg_positions[row['to']]
-            
-            ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
-                       arrowprops=dict(arrowstyle='->', color='cyan', 
-                                     lw=row['count']/5, alpha=0.5))
-    
-    # Oyuncuları çiz
-    for player, (x, y) in avg_positions.items():
-        total_passes = pass_counts[
-            (pass_counts['from'] == player) | (pass_counts['to'] == player)
-        ]['count'].sum()
-        
-        ax.scatter(x, y, c='yellow', s=total_passes*10, 
-                  alpha=0.8, edgecolors='white', linewidths=2, zorder=3)
-        ax.text(x, y-3, player.split()[-1], ha='center', 
-               fontsize=9, color='white', fontweight='bold', zorder=4)
-    
-    ax.set_title(f'{team_name} - Passing Network', fontsize=16, color='white', pad=20)
-    fig.patch.set_facecolor('#0e1117')
-    return fig
+@observed(st.cache_data(ttl=3600), "Match Overview", "figure", ttl=3600, match_arg="match_id")
+def shot_map_png(match_id, team_name, version=None):
+    """Statik şut haritası PNG olarak (maç başına önbellekli, warm-up sonrası diskten)"""
+    if has_local_events(match_id):
+        return load_figure_png(match_id, 'shot_map', team_name)
+    fig = plot_shot_map(load_events(match_id), team_name)
+    return figure_png(fig) if fig else None
 
-def calculate_team_stats(events_df, team_name):
-    """Takım istatistikleri hesapla"""
-    # Team bilgisini string'e çevir
-    events_df_copy = events_df.copy()
-    events_df_copy['team_name'] = events_df_copy['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    
-    team_events = events_df_copy[events_df_copy['team_name'] == team_name]
-    
-    # Şutlar
-    shots = team_events[team_events['type'].apply(lambda x: x['name'] == 'Shot')]
-    goals = shots[shots['shot'].apply(
-        lambda x: x.get('outcome', {}).get('name') == 'Goal' if isinstance(x, dict) else False
-    )]
-    xg = shots['shot'].apply(
-        lambda x: x.get('statsbomb_xg', 0) if isinstance(x, dict) else 0
-    ).sum()
-    
-    # Paslar
-    passes = team_events[team_events['type'].apply(lambda x: x['name'] == 'Pass')]
-    successful_passes = passes[passes['pass'].apply(
-        lambda x: x.get('outcome') is None if isinstance(x, dict) else False
-    )]
-    pass_accuracy = (len(successful_passes) / len(passes) * 100) if len(passes) > 0 else 0
-    
-    # Top hakimiyeti (olaylar bazında yaklaşık)
-    total_events = len(events_df_copy)
-    team_event_count = len(team_events)
-    possession = (team_event_count / total_events * 100) if total_events > 0 else 0
-    
-    # Defansif aksiyonlar
-    tackles = len(team_events[team_events['type'].apply(lambda x: x.get('name') == 'Duel')])
-    interceptions = len(team_events[team_events['type'].apply(lambda x: x.get('name') == 'Interception')])
-    
-    return {
-        'shots': len(shots),
-        'goals': len(goals),
-        'xg': xg,
-        'passes': len(passes),
-        'pass_accuracy': pass_accuracy,
-        'possession': possession,
-        'tackles': tackles,
-        'interceptions': interceptions
-    }
+@observed(st.cache_data(ttl=3600), "Match Overview", "figure", ttl=3600, match_arg="match_id")
+def pass_network_png(match_id, team_name, version=None):
+    """Statik paslaşma ağı PNG'si ve debug satırları (maç başına önbellekli, warm-up sonrası diskten)"""
+    if has_local_events(match_id):
+        return (load_figure_png(match_id, 'pass_network', team_name),
+                load_figure_debug(match_id, 'pass_network', team_name))
+    lines = []
+    fig = plot_pass_network(load_events(match_id), team_name, min_passes=2,
+                            on_debug=lambda tooltip, text: lines.append((tooltip, text)))
+    return (figure_png(fig) if fig else None), lines
+
+def show_debug(tooltip, text):
+    """Paslaşma ağı debug satırını göster"""
+    if tooltip is None:
+        st.write(text)
+        return
+    st.markdown(f"""
+        <p title="{tooltip}">
+            {text}
+        </p>
+    """, unsafe_allow_html=True)
+
+def show_chart(chart):
+    """Grafiği göster (payload ise tarayıcıda, figure/PNG ise resim olarak)"""
+    with span("show_chart", "transfer"):
+        if isinstance(chart, dict):
+            st.vega_lite_chart(spec=vega_lite_spec(chart), theme=None)
+        elif isinstance(chart, bytes):
+            st.image(chart, use_container_width=True)
+        else:
+            st.pyplot(chart)
 
 def main():
     st.markdown("# ⚽ Match Detail Analysis")
     
+    # data/ izleyicisi: değişen maç dosyalarının önbelleğini arka planda siler
+    start_watcher()
+    
     # Match ID
     MATCH_ID = 3895292
+    # Lokal dosyaların sürümü önbellek anahtarının parçası
+    version = match_version(MATCH_ID)
+    
+    # Çizim modu: sunucuda PNG veya tarayıcıda interaktif (zoom/hover)
+    render_mode = st.sidebar.radio(
+        "🖼️ Chart Rendering",
+        ["Static (matplotlib)", "Interactive (browser)"],
+        help="Interactive mode sends only the chart data to the browser"
+    )
+    interactive = render_mode == "Interactive (browser)"
+    
+    if st.sidebar.button("🔄 Refresh This Match", help="Reload only this match; other cached matches stay warm"):
+        refresh_match(MATCH_ID)
+        st.rerun()
     
     st.markdown(f"""
         <div style='text-align: center; padding: 1rem; background-color: #f0f2f6; border-radius: 10px; margin-bottom: 1rem;'>
@@ -419,9 +218,16 @@ def main():
     
     # Veri yükle
     with st.spinner('📥 Loading match data...'):
-        match_info = load_match_info(MATCH_ID)
-        events = load_events(MATCH_ID)
-        lineups = load_lineups(MATCH_ID)
+        # Üç bağımsız yükleme aynı anda: süre toplam değil en yavaşı kadar
+        with span("load_match_data", "load"):
+            loaded = load_concurrently({
+                'load_match_info': lambda: load_match_info(MATCH_ID),
+                'load_events': lambda: load_events(MATCH_ID),
+                'load_lineups': lambda: load_lineups(MATCH_ID, version),
+            })
+        match_info = loaded['load_match_info']
+        events = loaded['load_events']
+        lineups = loaded['load_lineups'] or []
     
     if match_info is None or events is None:
         st.error("❌ Failed to load match data!")
@@ -445,8 +251,9 @@ def main():
     # İstatistikler
     st.markdown("## 📊 Match Statistics")
     
-    home_stats = calculate_team_stats(events, home_team)
-    away_stats = calculate_team_stats(events, away_team)
+    with span("calculate_team_stats", "compute"):
+        home_stats = team_stats(MATCH_ID, home_team, version)
+        away_stats = team_stats(MATCH_ID, away_team, version)
     
     # Karşılaştırmalı istatistikler
     col1, col2, col3 = st.columns(3)
@@ -500,17 +307,25 @@ def main():
     
     with col1:
         st.markdown(f"### {home_team}")
-        fig_home = plot_shot_map(events, home_team)
+        with span("shot_map_home", "render"):
+            if interactive:
+                fig_home = shot_map_payload(events, home_team)
+            else:
+                fig_home = shot_map_png(MATCH_ID, home_team, version)
         if fig_home:
-            st.pyplot(fig_home)
+            show_chart(fig_home)
         else:
             st.info("No shot data available")
     
     with col2:
         st.markdown(f"### {away_team}")
-        fig_away = plot_shot_map(events, away_team)
+        with span("shot_map_away", "render"):
+            if interactive:
+                fig_away = shot_map_payload(events, away_team)
+            else:
+                fig_away = shot_map_png(MATCH_ID, away_team, version)
         if fig_away:
-            st.pyplot(fig_away)
+            show_chart(fig_away)
         else:
             st.info("No shot data available")
     
@@ -523,17 +338,29 @@ def main():
     
     with col1:
         st.markdown(f"### {home_team}")
-        fig_pass_home = plot_pass_network(events, home_team, min_passes=2, debug=True)
+        with span("pass_network_home", "render"):
+            if interactive:
+                fig_pass_home = pass_network_payload(events, home_team, min_passes=2, on_debug=show_debug)
+            else:
+                fig_pass_home, debug_lines = pass_network_png(MATCH_ID, home_team, version)
+                for tooltip, text in debug_lines:
+                    show_debug(tooltip, text)
         if fig_pass_home:
-            st.pyplot(fig_pass_home)
+            show_chart(fig_pass_home)
         else:
             st.info("Not enough passing data (minimum 2 passes between players required)")
     
     with col2:
         st.markdown(f"### {away_team}")
-        fig_pass_away = plot_pass_network(events, away_team, min_passes=2, debug=True)
+        with span("pass_network_away", "render"):
+            if interactive:
+                fig_pass_away = pass_network_payload(events, away_team, min_passes=2, on_debug=show_debug)
+            else:
+                fig_pass_away, debug_lines = pass_network_png(MATCH_ID, away_team, version)
+                for tooltip, text in debug_lines:
+                    show_debug(tooltip, text)
         if fig_pass_away:
-            st.pyplot(fig_pass_away)
+            show_chart(fig_pass_away)
         else:
             st.info("Not enough passing data (minimum 2 passes between players required)")
     
@@ -545,6 +372,19 @@ def main():
     if lineups and len(lineups) > 0:
         st.markdown("## 👥 Lineups")
         
+        with span("load_intervals", "load"):
+            intervals = load_intervals(MATCH_ID, version)
+        
+        # Sahada olma: giriş/çıkış saati ve dakika (oyuncu başına ilk giriş, son çıkış)
+        on_pitch = None
+        if intervals is not None and len(intervals):
+            played = intervals.frame().groupby('player_id').agg(
+                started=('started', 'any'), on=('on', 'first'), off=('off', 'last'), minutes=('minutes', 'sum'))
+            last_minute = int(intervals.clock.label(intervals.clock.duration).split(":")[0])
+            minute = st.slider("⏱️ On the pitch at minute", 0, last_minute, min(63, last_minute),
+                               help="Players on the pitch at this match-clock minute (2nd half from 45')")
+            on_pitch = set(intervals.on_pitch(minute))
+        
         col1, col2 = st.columns(2)
         
         for i, team_lineup in enumerate(lineups):
@@ -552,8 +392,19 @@ def main():
                 st.markdown(f"### {team_lineup['team_name']}")
                 
                 players_df = pd.DataFrame(team_lineup['lineup'])
-                players_df = players_df[['player_name', 'jersey_number']].sort_values('jersey_number')
-                players_df.columns = ['Player', 'Number']
+                if on_pitch is None:
+                    players_df = players_df[['player_name', 'jersey_number']].sort_values('jersey_number')
+                    players_df.columns = ['Player', 'Number']
+                else:
+                    players_df = players_df[['player_id', 'player_name', 'jersey_number']].join(played, on='player_id')
+                    players_df['started'] = players_df['started'].fillna(False).astype(bool)
+                    players_df['minutes'] = players_df['minutes'].fillna(0).round(0).astype(int)
+                    players_df['on_pitch'] = players_df['player_id'].isin(on_pitch)
+                    players_df = players_df.sort_values(['started', 'minutes', 'jersey_number'],
+                                                        ascending=[False, False, True])
+                    players_df = players_df[['jersey_number', 'player_name', 'started', 'on', 'off',
+                                             'minutes', 'on_pitch']]
+                    players_df.columns = ['Number', 'Player', 'Started', 'On', 'Off', 'Minutes', f"On at {minute}'"]
                 
                 st.dataframe(players_df, hide_index=True, use_container_width=True)
     
@@ -566,4 +417,6 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with trace_page("Match Overview") as trace:
+        main()
+    show_perf_panel(trace)
@@ -8,16 +8,21 @@ streamlit run pass_analysis.py
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import requests
-import time
-from matplotlib.patches import Rectangle, Arc, FancyArrowPatch
-import os
-import json
 
-# Doğru BASE URL
-BASE_URL = "https://raw.githubusercontent.com/statsbomb/open-data/refs/heads/master/data/"
+from core.loaders import BASE_URL, url_to_local_path, read_json, raw_exists, events_path
+from core.plots import plot_pass_diagram, figure_png
+from core.payloads import pass_diagram_payload, vega_lite_spec
+from core.metrics import analyze_passes, pass_connections
+from core.export import frame_chunks, season_event_chunks, season_pass_connection_chunks
+from core.loaders import load_season_matches
+from core.catalog import load_catalog, local_seasons
+from core.density import LAYERS, season_layer, plot_density_map
+from core.match_cache import has_local_events
+from core.perf import span, trace_page, show_perf_panel
+from core.cache import observed
+from core.event_store import shared_events
+from core.watch import refresh_match, start_watcher
+from ui.export_panel import export_panel
 
 # Sayfa konfigürasyonu
 st.set_page_config(
@@ -45,34 +50,18 @@ st.markdown("""
 
 def load_from_local(url):
     """Lokal dosyadan veri oku"""
-    import os
-    import json
-    
-    # URL'den dosya yolunu çıkar
-    # Örnek: ".../data/events/123.json" → "data/events/123.json"
-    if "/competitions.json" in url:
-        local_path = "data/competitions.json"
-    elif "/matches/" in url:
-        parts = url.split("/matches/")[1]  # "11/90.json"
-        local_path = f"data/matches/{parts}"
-    elif "/events/" in url:
-        parts = url.split("/events/")[1]  # "3895292.json"
-        local_path = f"data/events/{parts}"
-    elif "/lineups/" in url:
-        parts = url.split("/lineups/")[1]
-        local_path = f"data/lineups/{parts}"
-    else:
+    local_path = url_to_local_path(url)
+    if local_path is None:
         return None
     
-    # Dosya varsa oku
-    if os.path.exists(local_path):
-        with open(local_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    # Dosya varsa oku (sıkıştırılmış hali de)
+    if raw_exists(local_path):
+        return read_json(local_path)
     else:
         st.error(f"❌ File not found: {local_path}")
         return None
 
-@st.cache_data(ttl=3600)
+@observed(st.cache_data(ttl=3600), "Pass Networks", "loader", ttl=3600, match_arg="match_id")
 def load_match_info(match_id):
     """Maç bilgilerini yükle (ev sahibi/deplasman bilgisi için)"""
     competitions_url = f"{BASE_URL}competitions.json"
@@ -96,277 +85,115 @@ def load_match_info(match_id):
     
     return None
 
-@st.cache_data(ttl=3600)
 def load_events(match_id):
-    """Maç olaylarını yükle"""
-    url = f"{BASE_URL}events/{match_id}.json"
-    data = load_from_local(url)
-    
-    if data:
-        return pd.DataFrame(data)
-    return None
-
-def draw_pitch(ax, pitch_color='#1e3a1e', line_color='white'):
-    """Futbol sahası çiz"""
-    pitch_length = 120
-    pitch_width = 80
-    
-    ax.add_patch(Rectangle((0, 0), pitch_length, pitch_width, 
-                           facecolor=pitch_color, edgecolor=line_color, linewidth=2))
-    
-    ax.plot([0, 0], [0, pitch_width], color=line_color, linewidth=2)
-    ax.plot([0, pitch_length], [pitch_width, pitch_width], color=line_color, linewidth=2)
-    ax.plot([pitch_length, pitch_length], [pitch_width, 0], color=line_color, linewidth=2)
-    ax.plot([pitch_length, 0], [0, 0], color=line_color, linewidth=2)
-    
-    ax.plot([pitch_length/2, pitch_length/2], [0, pitch_width], color=line_color, linewidth=2)
-    
-    center_circle = plt.Circle((pitch_length/2, pitch_width/2), 9.15, 
-                               color=line_color, fill=False, linewidth=2)
-    ax.add_patch(center_circle)
-    
-    ax.add_patch(Rectangle((0, 18), 18, 44, fill=False, edgecolor=line_color, linewidth=2))
-    ax.add_patch(Rectangle((0, 30), 6, 20, fill=False, edgecolor=line_color, linewidth=2))
+    """Maç olaylarını yükle (paylaşılan depodan; ayrı önbellek katmanı yok)"""
+    events = shared_events(match_id)
     
-    ax.add_patch(Rectangle((102, 18), 18, 44, fill=False, edgecolor=line_color, linewidth=2))
-    ax.add_patch(Rectangle((114, 30), 6, 20, fill=False, edgecolor=line_color, linewidth=2))
-    
-    ax.plot(12, 40, 'o', color=line_color, markersize=4)
-    ax.plot(108, 40, 'o', color=line_color, markersize=4)
-    
-    ax.set_xlim(-2, pitch_length + 2)
-    ax.set_ylim(-2, pitch_width + 2)
-    ax.axis('off')
-    ax.set_aspect('equal')
-
-def plot_pass_diagram(events_df, selected_team, passer, receiver, is_home_team):
-    """Belirli bir ikili için pas diyagramı çiz"""
-    events_df_copy = events_df.copy()
-    events_df_copy['team_name'] = events_df_copy['team'].apply(
-        lambda x: x['name'] if isinstance(x, dict) else x
-    )
-    
-    passes = events_df_copy[
-        (events_df_copy['type'].apply(lambda x: x['name'] == 'Pass')) &
-        (events_df_copy['team_name'] == selected_team)
-    ].copy()
-    
-    player_passes = []
-    for _, row in passes.iterrows():
-        passer_info = row.get('player')
-        if isinstance(passer_info, dict):
-            current_passer = passer_info.get('name')
-        else:
-            current_passer = passer_info
-        
-        pass_dict = row.get('pass')
-        if isinstance(pass_dict, dict):
-            recipient_info = pass_dict.get('recipient')
-            if isinstance(recipient_info, dict):
-                current_receiver = recipient_info.get('name')
-            else:
-                current_receiver = recipient_info
-            
-            if current_passer == passer and current_receiver == receiver:
-                start_loc = row.get('location')
-                end_loc = pass_dict.get('end_location')
-                successful = pass_dict.get('outcome') is None
-                period = row.get('period', 1)
-                
-                if start_loc and end_loc:
-                    if period == 1:
-                        if is_home_team:
-                            start_x, start_y = start_loc[0], start_loc[1]
-                            end_x, end_y = end_loc[0], end_loc[1]
-                        else:
-                            start_x, start_y = 120 - start_loc[0], 80 - start_loc[1]
-                            end_x, end_y = 120 - end_loc[0], 80 - end_loc[1]
-                    else:
-                        if is_home_team:
-                            start_x, start_y = 120 - start_loc[0], 80 - start_loc[1]
-                            end_x, end_y = 120 - end_loc[0], 80 - end_loc[1]
-                        else:
-                            start_x, start_y = start_loc[0], start_loc[1]
-                            end_x, end_y = end_loc[0], end_loc[1]
-                    
-                    player_passes.append({
-                        'start': (start_x, start_y),
-                        'end': (end_x, end_y),
-                        'successful': successful,
-                        'period': period
-                    })
-    
-    if len(player_passes) == 0:
+    if events is None:
+        st.error(f"❌ File not found: {events_path(match_id)}")
         return None
-    
-    fig, ax = plt.subplots(figsize=(14, 10))
-    draw_pitch(ax)
-    
-    # Atak yönü göstergesi
-    # Koordinatları normalize ettik (her zaman soldan sağa göster)
-    # Ama deplasman takımı için text'i ters yaz
-    arrow_y = 75
-    
-    ax.annotate('', xy=(110, arrow_y), xytext=(10, arrow_y),
-               arrowprops=dict(arrowstyle='->', lw=4, color='yellow', alpha=0.7))
-    
-    if is_home_team:
-        ax.text(60, arrow_y + 3, f'{selected_team} ATTACKING DIRECTION →', 
-               ha='center', fontsize=14, color='yellow', fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor='black', alpha=0.7))
-    else:
-        # Deplasman takımı - bilgi ver ama ok yönü aynı (koordinatlar normalize edildi)
-        ax.text(60, arrow_y + 3, f'{selected_team} ATTACKING DIRECTION → (normalized)', 
-               ha='center', fontsize=12, color='yellow', fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor='black', alpha=0.7))
-    
-    for i, pass_info in enumerate(player_passes):
-        start = pass_info['start']
-        end = pass_info['end']
-        successful = pass_info['successful']
-        period = pass_info['period']
-        
-        color = 'lime' if successful else 'red'
-        alpha = 0.6
-        
-        arrow = FancyArrowPatch(
-            (start[0], start[1]), (end[0], end[1]),
-            arrowstyle='->', mutation_scale=20,
-            color=color, alpha=alpha, linewidth=2
-        )
-        ax.add_patch(arrow)
-        
-        if period == 1:
-            ax.plot(start[0], start[1], 'o', color=color, markersize=8, alpha=0.8)
+    return events if len(events) > 0 else None
+
+def show_chart(chart):
+    """Grafiği göster (payload ise tarayıcıda, figure ise PNG olarak)"""
+    with span("show_chart", "transfer"):
+        if isinstance(chart, dict):
+            st.vega_lite_chart(spec=vega_lite_spec(chart), theme=None)
         else:
-            ax.plot(start[0], start[1], 's', color=color, markersize=8, alpha=0.8)
-    
-    period_1_count = sum(1 for p in player_passes if p['period'] == 1)
-    period_2_count = sum(1 for p in player_passes if p['period'] == 2)
-    
-    ax.set_title(f'{passer.split()[-1]} → {receiver.split()[-1]} ({len(player_passes)} passes: {period_1_count} in 1st half, {period_2_count} in 2nd half)', 
-                fontsize=16, color='white', pad=20, fontweight='bold')
-    
-    from matplotlib.lines import Line2D
-    legend_elements = [
-        Line2D([0], [0], color='lime', linewidth=2, label='Successful'),
-        Line2D([0], [0], color='red', linewidth=2, label='Unsuccessful'),
-        Line2D([0], [0], color='yellow', linewidth=4, label='Attack Direction'),
-        Line2D([0], [0], marker='o', color='w', markerfacecolor='gray', markersize=8, label='1st Half', linestyle='None'),
-        Line2D([0], [0], marker='s', color='w', markerfacecolor='gray', markersize=8, label='2nd Half', linestyle='None')
-    ]
-    ax.legend(handles=legend_elements, loc='upper left', fontsize=12)
-    
-    fig.patch.set_facecolor('#0e1117')
-    return fig
+            st.pyplot(chart)
 
-def analyze_passes(events_df, selected_team, is_home_team):
-    """Pasları analiz et"""
-    events_df_copy = events_df.copy()
-    events_df_copy['team_name'] = events_df_copy['team'].apply(
-        lambda x: x['name'] if isinstance(x, dict) else x
-    )
+# Sezon yoğunluk katmanı → başlık
+DENSITY_LAYER_LABELS = {'shots': 'Shots', 'shots_xg': 'xG', 'passes': 'Passes', 'pressures': 'Pressures'}
+
+@observed(st.cache_data(ttl=3600), "Pass Networks", "index", ttl=3600)
+def season_team_matches(seasons):
+    """Seçili sezonlarda olay dosyası lokal olan maçlar: takım → maç ID'leri"""
+    team_matches = {}
+    for competition_id, season_id in seasons:
+        catalog = load_catalog(competition_id, season_id)
+        if catalog is None:
+            continue
+        for match_id, home, away in catalog[['match_id', 'home_team_name', 'away_team_name']].itertuples(index=False):
+            if has_local_events(match_id):
+                team_matches.setdefault(str(home), []).append(int(match_id))
+                team_matches.setdefault(str(away), []).append(int(match_id))
+    return team_matches
+
+@observed(st.cache_data(ttl=3600), "Pass Networks", "figure", ttl=3600)
+def season_density_png(match_ids, team_name, layer, style, title):
+    """Takımın sezon(lar) boyu yoğunluk haritası PNG olarak (maç ızgaraları diskten toplanır)"""
+    grid, n_points, points = season_layer(match_ids, team_name, layer)
+    fig = plot_density_map(grid, title, n_points, points, weighted=(layer == 'shots_xg'), style=style)
+    return figure_png(fig)
+
+def show_season_density(match_id):
+    """Sezon / çoklu sezon yoğunluk haritaları (core/density.py ızgaraları)"""
+    st.markdown("## 🗺️ Season Density Maps")
+    st.caption("Per-match 60x40 grids are summed over every local match of the team, "
+               "so drawing cost does not grow with the number of events.")
+    
+    seasons = local_seasons()
+    if not seasons:
+        st.info("💡 No season files in data/matches/")
+        return
     
-    passes = events_df_copy[
-        (events_df_copy['type'].apply(lambda x: x['name'] == 'Pass')) &
-        (events_df_copy['team_name'] == selected_team)
-    ].copy()
+    # Varsayılan: seçili maçın sezonu
+    default = seasons[:1]
+    match_info = load_match_info(match_id)
+    if match_info is not None and isinstance(match_info.get('competition'), dict):
+        current = (match_info['competition']['competition_id'], match_info['season']['season_id'])
+        if current in seasons:
+            default = [current]
+    
+    selected = st.sidebar.multiselect("Seasons", seasons, default=default,
+                                      format_func=lambda cs: f"{cs[0]} / {cs[1]}")
+    team_matches = season_team_matches(tuple(selected))
+    if not team_matches:
+        st.warning("⚠️ No local events files for the selected seasons")
+        return
     
-    pass_details = []
-    for _, row in passes.iterrows():
-        passer_info = row.get('player')
-        if isinstance(passer_info, dict):
-            passer = passer_info.get('name')
-        else:
-            passer = passer_info
-        
-        period = row.get('period', 1)
-        
-        pass_dict = row.get('pass')
-        recipient = None
-        pass_length = None
-        
-        if isinstance(pass_dict, dict):
-            recipient_info = pass_dict.get('recipient')
-            if isinstance(recipient_info, dict):
-                recipient = recipient_info.get('name')
-            elif isinstance(recipient_info, str):
-                recipient = recipient_info
-            
-            pass_length = pass_dict.get('length')
-        
-        successful = pass_dict.get('outcome') is None if isinstance(pass_dict, dict) else False
-        
-        start_loc = row.get('location')
-        end_loc = pass_dict.get('end_location') if isinstance(pass_dict, dict) else None
-        
-        pass_direction = None
-        if start_loc and end_loc:
-            x_diff = end_loc[0] - start_loc[0]
-            
-            if period == 1:
-                if is_home_team:
-                    if x_diff > 5:
-                        pass_direction = "→ Forward"
-                    elif x_diff < -5:
-                        pass_direction = "← Backward"
-                    else:
-                        pass_direction = "↔ Lateral"
-                else:
-                    if x_diff < -5:
-                        pass_direction = "← Forward"
-                    elif x_diff > 5:
-                        pass_direction = "→ Backward"
-                    else:
-                        pass_direction = "↔ Lateral"
-            else:
-                if is_home_team:
-                    if x_diff < -5:
-                        pass_direction = "← Forward"
-                    elif x_diff > 5:
-                        pass_direction = "→ Backward"
-                    else:
-                        pass_direction = "↔ Lateral"
-                else:
-                    if x_diff > 5:
-                        pass_direction = "→ Forward"
-                    elif x_diff < -5:
-                        pass_direction = "← Backward"
-                    else:
-                        pass_direction = "↔ Lateral"
-        
-        if passer and recipient:
-            pass_details.append({
-                'from': passer,
-                'to': recipient,
-                'successful': successful,
-                'length': pass_length,
-                'direction': pass_direction,
-                'period': period
-            })
-    
-    return pd.DataFrame(pass_details)
+    team = st.sidebar.selectbox("Team", sorted(team_matches))
+    layer = st.sidebar.selectbox("Layer", list(LAYERS), format_func=DENSITY_LAYER_LABELS.get)
+    style = st.sidebar.radio("Density Style", ["grid", "hex"], horizontal=True)
+    
+    match_ids = tuple(sorted(team_matches[team]))
+    st.metric("⚽ Matches", len(match_ids))
+    with span("season_density", "render"):
+        png = season_density_png(match_ids, team, layer, style,
+                                 f"{team} - Season {DENSITY_LAYER_LABELS[layer]}")
+    with span("show_chart", "transfer"):
+        st.image(png, use_container_width=True)
 
 def main():
     st.markdown("# 🔗 Detailed Pass Analysis")
     
+    # data/ izleyicisi: değişen maç dosyalarının önbelleğini arka planda siler
+    start_watcher()
+    
     st.sidebar.header("⚙️ Settings")
     match_id = st.sidebar.number_input("Match ID", value=3895292, step=1)
     
-    if st.sidebar.button("🔄 Load Match Data"):
-        st.cache_data.clear()
+    view = st.sidebar.radio("🗺️ View", ["Match passes", "Season density maps"])
+    if view == "Season density maps":
+        show_season_density(match_id)
+        return
+    
+    if st.sidebar.button("🔄 Refresh This Match", help="Reload only this match; other cached matches stay warm"):
+        refresh_match(match_id)
         st.rerun()
     
     with st.spinner('📥 Loading match data...'):
-        match_info = load_match_info(match_id)
-        events = load_events(match_id)
+        with span("load_match_info", "load"):
+            match_info = load_match_info(match_id)
+        with span("load_events", "load"):
+            events = load_events(match_id)
     
     if events is None:
         st.error("❌ Failed to load match data!")
         return
     
-    events['team_name'] = events['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    teams = events['team_name'].unique().tolist()
+    # Paylaşılan olay tablosu salt okunur: takım adları ayrı bir Series'te
+    teams = events['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x).unique().tolist()
     
     if len(teams) < 2:
         st.error("❌ Could not find team data!")
@@ -407,19 +234,15 @@ def main():
             st.sidebar.warning(f"Selected: {selected_team} (Away)")
     
     with st.spinner('🔄 Analyzing passes...'):
-        pass_df = analyze_passes(events, selected_team, is_home_team)
+        with span("analyze_passes", "compute"):
+            pass_df = analyze_passes(events, selected_team, is_home_team)
     
     if len(pass_df) == 0:
         st.warning("No pass data available for this team")
         return
     
-    grouped = pass_df.groupby(['from', 'to']).agg({
-        'successful': ['sum', 'count'],
-        'length': 'mean'
-    }).reset_index()
-    
-    grouped.columns = ['From', 'To', 'Successful', 'Total', 'Avg Length (m)']
-    grouped['Success Rate (%)'] = (grouped['Successful'] / grouped['Total'] * 100).round(1)
+    with span("pass_connections", "compute"):
+        grouped = pass_connections(pass_df)
     
     sort_by = st.sidebar.selectbox(
         "Sort by",
@@ -429,6 +252,14 @@ def main():
     grouped_sorted = grouped.sort_values(sort_by, ascending=False)
     
     min_passes_filter = st.sidebar.slider("Minimum passes to show", 1, 20, 5)
+    
+    # Çizim modu: sunucuda PNG veya tarayıcıda interaktif (zoom/hover)
+    render_mode = st.sidebar.radio(
+        "🖼️ Chart Rendering",
+        ["Static (matplotlib)", "Interactive (browser)"],
+        help="Interactive mode sends only the chart data to the browser"
+    )
+    interactive = render_mode == "Interactive (browser)"
     grouped_filtered = grouped_sorted[grouped_sorted['Total'] >= min_passes_filter]
     
     st.markdown("## 📊 Overall Statistics")
@@ -471,12 +302,13 @@ def main():
             help="Choose a player-to-player connection"
         )
         
-        st.dataframe(
-            display_df,
-            use_container_width=True,
-            height=500,
-            hide_index=True
-        )
+        with span("connections_table", "transfer"):
+            st.dataframe(
+                display_df,
+                use_container_width=True,
+                height=500,
+                hide_index=True
+            )
         
         if selected_connection_str != "None":
             selected_idx = connection_options.index(selected_connection_str)
@@ -491,10 +323,14 @@ def main():
                 st.markdown(f"## 🎯 Pass Diagram: {passer} → {receiver}")
                 
                 with st.spinner('Drawing passes...'):
-                    fig = plot_pass_diagram(events, selected_team, passer, receiver, is_home_team)
+                    with span("pass_diagram", "render"):
+                        if interactive:
+                            fig = pass_diagram_payload(events, selected_team, passer, receiver, is_home_team)
+                        else:
+                            fig = plot_pass_diagram(events, selected_team, passer, receiver, is_home_team)
                     
                     if fig:
-                        st.pyplot(fig)
+                        show_chart(fig)
                     else:
                         st.warning("Could not generate pass diagram")
             else:
@@ -504,13 +340,25 @@ def main():
     
     st.markdown("---")
     
-    csv = display_df.to_csv(index=False, encoding='utf-8-sig')
-    st.download_button(
-        label="📥 Download Pass Analysis as CSV",
-        data=csv,
-        file_name=f"pass_analysis_{selected_team.replace(' ', '_')}.csv",
-        mime="text/csv"
-    )
+    st.markdown("## 📦 Export")
+    
+    team_slug = selected_team.replace(' ', '_')
+    export_sources = {
+        "Pass connections (this match)": (
+            f"pass_analysis_{team_slug}", lambda: frame_chunks(grouped_filtered)
+        ),
+        "Events (this match)": (
+            f"events_{match_id}", lambda: season_event_chunks([match_id])
+        ),
+    }
+    if match_info is not None and isinstance(match_info.get('competition'), dict):
+        competition_id = match_info['competition']['competition_id']
+        season_id = match_info['season']['season_id']
+        export_sources["Pass connections (whole season, local matches)"] = (
+            f"pass_analysis_{team_slug}_{competition_id}_{season_id}",
+            lambda: season_pass_connection_chunks(load_season_matches(competition_id, season_id), selected_team)
+        )
+    export_panel("pass_export", export_sources)
     
     st.markdown("---")
     st.markdown("""
@@ -520,4 +368,6 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with trace_page("Pass Networks") as trace:
+        main()
+    show_perf_panel(trace)
\ No newline at end of file
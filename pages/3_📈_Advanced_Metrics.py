@@ -8,16 +8,20 @@ Dosya yolu: pages/3_📊_Match_Metrics.py
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import requests
-import time
-import seaborn as sns
 from math import pi
-import os
-import json
 
-# BASE URL
-BASE_URL = "https://raw.githubusercontent.com/statsbomb/open-data/refs/heads/master/data/"
+from core.lazy import lazy_module
+from core.loaders import BASE_URL, url_to_local_path, read_json, raw_exists, events_path
+from core.plots import figure_png
+from core.metrics import calculate_attacking_metrics, calculate_passing_metrics, calculate_defensive_metrics
+from core.perf import span, trace_page, show_perf_panel
+from core.cache import observed
+from core.event_store import shared_events
+from core.watch import match_version, refresh_match, start_watcher
+from core.match_cache import load_match_metrics
+
+# matplotlib yalnızca grafik önbellekte yokken yüklenir
+plt = lazy_module("matplotlib.pyplot")
 
 # Sayfa konfigürasyonu
 st.set_page_config(
@@ -49,34 +53,18 @@ st.markdown("""
 
 def load_from_local(url):
     """Lokal dosyadan veri oku"""
-    import os
-    import json
-    
-    # URL'den dosya yolunu çıkar
-    # Örnek: ".../data/events/123.json" → "data/events/123.json"
-    if "/competitions.json" in url:
-        local_path = "data/competitions.json"
-    elif "/matches/" in url:
-        parts = url.split("/matches/")[1]  # "11/90.json"
-        local_path = f"data/matches/{parts}"
-    elif "/events/" in url:
-        parts = url.split("/events/")[1]  # "3895292.json"
-        local_path = f"data/events/{parts}"
-    elif "/lineups/" in url:
-        parts = url.split("/lineups/")[1]
-        local_path = f"data/lineups/{parts}"
-    else:
+    local_path = url_to_local_path(url)
+    if local_path is None:
         return None
     
-    # Dosya varsa oku
-    if os.path.exists(local_path):
-        with open(local_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    # Dosya varsa oku (sıkıştırılmış hali de)
+    if raw_exists(local_path):
+        return read_json(local_path)
     else:
         st.error(f"❌ File not found: {local_path}")
         return None
 
-@st.cache_data(ttl=3600)
+@observed(st.cache_data(ttl=3600), "Advanced Metrics", "loader", ttl=3600, match_arg="match_id")
 def load_match_info(match_id):
     """Maç bilgilerini yükle"""
     competitions_url = f"{BASE_URL}competitions.json"
@@ -100,171 +88,14 @@ def load_match_info(match_id):
     
     return None
 
-@st.cache_data(ttl=3600)
 def load_events(match_id):
-    """Maç olaylarını yükle"""
-    url = f"{BASE_URL}events/{match_id}.json"
-    data = load_from_local(url)
-    
-    if data:
-        return pd.DataFrame(data)
-    return None
-
-def calculate_attacking_metrics(events_df, team_name):
-    """Ofansif metrikleri hesapla"""
-    # Team events
-    events_df['team_name'] = events_df['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    team_events = events_df[events_df['team_name'] == team_name]
-    
-    # Shots
-    shots = team_events[team_events['type'].apply(lambda x: x['name'] == 'Shot')]
-    
-    # xG
-    total_xg = shots['shot'].apply(
-        lambda x: x.get('statsbomb_xg', 0) if isinstance(x, dict) else 0
-    ).sum()
-    
-    # Goals
-    goals = shots[shots['shot'].apply(
-        lambda x: x.get('outcome', {}).get('name') == 'Goal' if isinstance(x, dict) else False
-    )]
-    
-    # Shots on target
-    on_target = shots[shots['shot'].apply(
-        lambda x: x.get('outcome', {}).get('name') in ['Goal', 'Saved'] if isinstance(x, dict) else False
-    )]
-    
-    # Big chances (xG > 0.3)
-    big_chances = shots[shots['shot'].apply(
-        lambda x: x.get('statsbomb_xg', 0) > 0.3 if isinstance(x, dict) else False
-    )]
-    
-    # Box shots vs outside
-    box_shots = shots[shots['location'].apply(
-        lambda x: x[0] >= 102 if x and len(x) > 0 else False
-    )]
-    
-    metrics = {
-        'Total Shots': len(shots),
-        'Shots on Target': len(on_target),
-        'Goals': len(goals),
-        'xG': total_xg,
-        'xG per Shot': total_xg / len(shots) if len(shots) > 0 else 0,
-        'Conversion Rate (%)': (len(goals) / len(shots) * 100) if len(shots) > 0 else 0,
-        'Shot Accuracy (%)': (len(on_target) / len(shots) * 100) if len(shots) > 0 else 0,
-        'Big Chances': len(big_chances),
-        'Box Shots': len(box_shots),
-        'Outside Box Shots': len(shots) - len(box_shots),
-        'xG Overperformance': len(goals) - total_xg
-    }
-    
-    return metrics, shots
-
-def calculate_passing_metrics(events_df, team_name):
-    """Paslaşma metrikleri hesapla"""
-    events_df['team_name'] = events_df['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    team_events = events_df[events_df['team_name'] == team_name]
-    
-    # All passes - sadece recipient bilgisi olanlar
-    all_passes = team_events[team_events['type'].apply(lambda x: x['name'] == 'Pass')].copy()
-    
-    # Sadece recipient bilgisi olan pasları say (tutarlılık için)
-    passes = []
-    for _, row in all_passes.iterrows():
-        pass_dict = row.get('pass')
-        if isinstance(pass_dict, dict):
-            recipient_info = pass_dict.get('recipient')
-            if recipient_info:  # Recipient varsa
-                passes.append(row)
-    
-    passes = pd.DataFrame(passes) if passes else pd.DataFrame()
-    
-    # Successful passes
-    successful = passes[passes['pass'].apply(
-        lambda x: x.get('outcome') is None if isinstance(x, dict) else False
-    )]
-    
-    # Progressive passes (10m+ forward)
-    progressive = []
-    for _, row in passes.iterrows():
-        start_loc = row.get('location')
-        pass_dict = row.get('pass')
-        if isinstance(pass_dict, dict):
-            end_loc = pass_dict.get('end_location')
-            if start_loc and end_loc:
-                if end_loc[0] - start_loc[0] >= 10:  # 10m+ ileri
-                    progressive.append(row)
-    
-    progressive_df = pd.DataFrame(progressive) if progressive else pd.DataFrame()
-    
-    # Final third passes
-    final_third = passes[passes['location'].apply(
-        lambda x: x[0] >= 80 if x and len(x) > 0 else False
-    )]
-    
-    # Penalty area passes
-    penalty_area = passes[passes['pass'].apply(
-        lambda x: (x.get('end_location', [0, 0])[0] >= 102 and 
-                   18 <= x.get('end_location', [0, 0])[1] <= 62) 
-        if isinstance(x, dict) else False
-    )]
-    
-    # Long passes (30m+)
-    long_passes = passes[passes['pass'].apply(
-        lambda x: x.get('length', 0) >= 30 if isinstance(x, dict) else False
-    )]
-    
-    long_successful = long_passes[long_passes['pass'].apply(
-        lambda x: x.get('outcome') is None if isinstance(x, dict) else False
-    )]
-    
-    metrics = {
-        'Total Passes': len(passes),
-        'Completed Passes': len(successful),
-        'Pass Accuracy (%)': (len(successful) / len(passes) * 100) if len(passes) > 0 else 0,
-        'Progressive Passes': len(progressive_df),
-        'Final Third Passes': len(final_third),
-        'Penalty Area Passes': len(penalty_area),
-        'Long Passes (30m+)': len(long_passes),
-        'Long Pass Accuracy (%)': (len(long_successful) / len(long_passes) * 100) if len(long_passes) > 0 else 0,
-        'Avg Pass Length (m)': passes['pass'].apply(
-            lambda x: x.get('length', 0) if isinstance(x, dict) else 0
-        ).mean() if len(passes) > 0 else 0
-    }
-    
-    return metrics
-
-def calculate_defensive_metrics(events_df, team_name):
-    """Defansif metrikleri hesapla"""
-    events_df['team_name'] = events_df['team'].apply(lambda x: x['name'] if isinstance(x, dict) else x)
-    team_events = events_df[events_df['team_name'] == team_name]
-    
-    # Defensive actions
-    tackles = team_events[team_events['type'].apply(lambda x: x.get('name') == 'Duel')]
-    interceptions = team_events[team_events['type'].apply(lambda x: x.get('name') == 'Interception')]
-    blocks = team_events[team_events['type'].apply(lambda x: x.get('name') == 'Block')]
-    clearances = team_events[team_events['type'].apply(lambda x: x.get('name') == 'Clearance')]
-    pressures = team_events[team_events['type'].apply(lambda x: x.get('name') == 'Pressure')]
-    
-    # PPDA calculation (opponent passes per defensive action)
-    opponent_events = events_df[events_df['team_name'] != team_name]
-    opponent_passes = opponent_events[opponent_events['type'].apply(lambda x: x['name'] == 'Pass')]
-    
-    defensive_actions = len(tackles) + len(interceptions) + len(blocks)
-    ppda = len(opponent_passes) / defensive_actions if defensive_actions > 0 else 0
-    
-    metrics = {
-        'Tackles': len(tackles),
-        'Interceptions': len(interceptions),
-        'Blocks': len(blocks),
-        'Clearances': len(clearances),
-        'Pressures': len(pressures),
-        'Total Defensive Actions': defensive_actions,
-        'PPDA': ppda,
-        'Recoveries': len(team_events[team_events['type'].apply(lambda x: x.get('name') == 'Ball Recovery')])
-    }
+    """Maç olaylarını yükle (salt okunur tablo doğrudan core/event_store.py deposundan)"""
+    events = shared_events(match_id)
     
-    return metrics
+    if events is None:
+        st.error(f"❌ File not found: {events_path(match_id)}")
+        return None
+    return events if len(events) > 0 else None
 
 def plot_xg_comparison(home_metrics, away_metrics, home_team, away_team):
     """xG karşılaştırma grafiği"""
@@ -346,9 +177,43 @@ def plot_radar_chart(home_metrics, away_metrics, home_team, away_team):
     
     return fig
 
+@observed(st.cache_data(ttl=3600), "Advanced Metrics", "metric", ttl=3600, match_arg="match_id")
+def team_metrics(match_id, team_name, version=None):
+    """Takımın hücum, pas ve savunma metrikleri (maç başına önbellekli, warm-up sonrası diskten)"""
+    metrics = load_match_metrics(match_id)
+    if metrics is not None and team_name in metrics:
+        team = metrics[team_name]
+        return team['attacking'], team['passing'], team['defensive']
+    events = load_events(match_id)
+    attacking, _ = calculate_attacking_metrics(events, team_name)
+    passing = calculate_passing_metrics(events, team_name)
+    defensive = calculate_defensive_metrics(events, team_name)
+    return attacking, passing, defensive
+
+@observed(st.cache_data(ttl=3600), "Advanced Metrics", "figure", ttl=3600, match_arg="match_id")
+def xg_comparison_png(match_id, home_team, away_team, version=None):
+    """xG karşılaştırma grafiği PNG olarak (maç başına önbellekli)"""
+    fig = plot_xg_comparison(team_metrics(match_id, home_team, version)[0], team_metrics(match_id, away_team, version)[0], home_team, away_team)
+    return figure_png(fig)
+
+@observed(st.cache_data(ttl=3600), "Advanced Metrics", "figure", ttl=3600, match_arg="match_id")
+def radar_chart_png(match_id, home_team, away_team, version=None):
+    """Radar grafiği PNG olarak (maç başına önbellekli)"""
+    home_attacking, home_passing, home_defensive = team_metrics(match_id, home_team, version)
+    away_attacking, away_passing, away_defensive = team_metrics(match_id, away_team, version)
+    fig = plot_radar_chart(
+        {'attacking': home_attacking, 'passing': home_passing, 'defensive': home_defensive},
+        {'attacking': away_attacking, 'passing': away_passing, 'defensive': away_defensive},
+        home_team, away_team
+    )
+    return figure_png(fig)
+
 def main():
     st.markdown("# 📊 Match Metrics Dashboard")
     
+    # data/ izleyicisi: değişen maç dosyalarının önbelleğini arka planda siler
+    start_watcher()
+    
     # Sidebar - Match ID
     st.sidebar.header("⚙️ Settings")
     
@@ -360,14 +225,19 @@ def main():
     
     match_id = st.sidebar.number_input("Match ID", value=default_match_id, step=1)
     
-    if st.sidebar.button("🔄 Reload Data"):
-        st.cache_data.clear()
+    # Lokal dosyaların sürümü önbellek anahtarının parçası: değişen dosya yeni girdi demek
+    version = match_version(match_id)
+    
+    if st.sidebar.button("🔄 Refresh This Match", help="Reload only this match; other cached matches stay warm"):
+        refresh_match(match_id)
         st.rerun()
     
     # Load data
     with st.spinner('📥 Loading match data...'):
-        match_info = load_match_info(match_id)
-        events = load_events(match_id)
+        with span("load_match_info", "load"):
+            match_info = load_match_info(match_id)
+        with span("load_events", "load"):
+            events = load_events(match_id)
     
     if events is None or match_info is None:
         st.error("❌ Failed to load match data!")
@@ -395,14 +265,9 @@ def main():
     
     # Calculate all metrics
     with st.spinner('📊 Calculating metrics...'):
-        home_attacking, home_shots = calculate_attacking_metrics(events, home_team)
-        away_attacking, away_shots = calculate_attacking_metrics(events, away_team)
-        
-        home_passing = calculate_passing_metrics(events, home_team)
-        away_passing = calculate_passing_metrics(events, away_team)
-        
-        home_defensive = calculate_defensive_metrics(events, home_team)
-        away_defensive = calculate_defensive_metrics(events, away_team)
+        with span("team_metrics", "compute"):
+            home_attacking, home_passing, home_defensive = team_metrics(match_id, home_team, version)
+            away_attacking, away_passing, away_defensive = team_metrics(match_id, away_team, version)
     
     # Quick stats
     col1, col2, col3, col4 = st.columns(4)
@@ -461,8 +326,10 @@ def main():
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            fig_xg = plot_xg_comparison(home_attacking, away_attacking, home_team, away_team)
-            st.pyplot(fig_xg)
+            with span("xg_comparison_png", "render"):
+                png_xg = xg_comparison_png(match_id, home_team, away_team, version)
+            with span("st.image xg", "transfer"):
+                st.image(png_xg, use_container_width=True)
         
         with col2:
             st.markdown("### 📈 Key Insights")
@@ -607,20 +474,10 @@ def main():
             """)
         
         # Radar chart
-        metrics_dict = {
-            'attacking': home_attacking,
-            'passing': home_passing,
-            'defensive': home_defensive
-        }
-        
-        away_metrics_dict = {
-            'attacking': away_attacking,
-            'passing': away_passing,
-            'defensive': away_defensive
-        }
-        
-        fig_radar = plot_radar_chart(metrics_dict, away_metrics_dict, home_team, away_team)
-        st.pyplot(fig_radar)
+        with span("radar_chart_png", "render"):
+            png_radar = radar_chart_png(match_id, home_team, away_team, version)
+        with span("st.image radar", "transfer"):
+            st.image(png_radar, use_container_width=True)
         
         st.markdown("---")
         
@@ -674,4 +531,6 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with trace_page("Advanced Metrics") as trace:
+        main()
+    show_perf_panel(trace)
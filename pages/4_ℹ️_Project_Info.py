@@ -7,6 +7,8 @@ Dosya yolu: pages/4_📋_Project_Info.py
 
 import streamlit as st
 
+from core.perf import trace_page, show_perf_panel
+
 # Sayfa konfigürasyonu
 st.set_page_config(
     page_title="Project Info",
@@ -320,4 +322,6 @@ def calculate_xg(events_df, team_name):
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with trace_page("Project Info") as trace:
+        main()
+    show_perf_panel(trace)
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Cache Monitor
+Önbellek katmanları, süreç içi depolar, bellek kullanımı ve maç bazında temizleme
+
+Dosya yolu: pages/5_🗄️_Cache_Monitor.py
+"""
+
+import os
+import resource
+import sys
+
+import streamlit as st
+import pandas as pd
+
+from core.cache import LAYER_KINDS, layers, cached_match_ids, deep_size, evict_match
+from core.event_store import SHARED_MAX_MATCHES, clear_shared, forget_match, shared_entries
+from core.remote import MEMORY_MAX, loaded_store
+from core.perf import span, trace_page, show_perf_panel
+from core.watch import start_watcher
+
+# Sayfa konfigürasyonu
+st.set_page_config(
+    page_title="Cache Monitor",
+    page_icon="🗄️",
+    layout="wide"
+)
+
+def current_rss_mb():
+    """Sürecin anlık RSS değeri (MB); /proc yoksa tepe değer"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+def store_tables():
+    """Süreç içi depolar: ad → (kapasite, kayıt satırları)
+
+    Paylaşılan olay deposu (core/event_store.py) ve uzak veri deposunun bellek
+    LRU'su (core/remote.py); st.cache_* katmanları dışında en çok bellek tutanlar.
+    """
+    shared = [{'Kind': kind, 'Match ID': match_id, 'Size (KB)': round(deep_size(value) / 1024, 1)}
+              for kind, match_id, value in shared_entries()]
+    store = loaded_store()
+    fetched = [{'Path': path, 'Size (KB)': round(deep_size(data) / 1024, 1)}
+               for path, data in (store.memory_entries() if store else [])]
+    return {
+        'Shared event store': (SHARED_MAX_MATCHES * 2, shared),
+        'Fetch memory LRU': (MEMORY_MAX, fetched),
+    }
+
+def match_footprints(registered, shared_rows):
+    """Maç ID → katmanlar ve paylaşılan depo toplamı bellek (MB)"""
+    sizes = {}
+    rows = [row for layer in registered for row in layer.entry_rows()] + shared_rows
+    for row in rows:
+        if row['Match ID'] is not None:
+            sizes[row['Match ID']] = sizes.get(row['Match ID'], 0.0) + row['Size (KB)'] / 1024
+    return sizes
+
+def main():
+    st.markdown("# 🗄️ Cache Monitor")
+    st.caption("Loader, index, metric and figure caches of this server process, plus the shared event "
+               "store and the fetch memory cache. Layers appear after the page that owns them has run once.")
+    
+    registered = sorted(layers(), key=lambda l: (LAYER_KINDS.index(l.kind), l.page, l.function))
+    
+    with span("layer_stats", "compute"):
+        stats = pd.DataFrame([layer.stats() for layer in registered]
+                             or [{'Entries': 0, 'Size (MB)': 0.0, 'Hits': 0, 'Misses': 0}])
+        stores = store_tables()
+    
+    store_stats = pd.DataFrame([
+        {'Store': name, 'Entries': len(rows), 'Max Entries': capacity,
+         'Size (MB)': round(sum(row['Size (KB)'] for row in rows) / 1024, 2)}
+        for name, (capacity, rows) in stores.items()
+    ])
+    
+    # Özet
+    total_hits = int(stats['Hits'].sum())
+    total_calls = total_hits + int(stats['Misses'].sum())
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🧠 Process RSS", f"{current_rss_mb():.0f} MB")
+    with col2:
+        st.metric("🗄️ Cached Data", f"{stats['Size (MB)'].sum() + store_stats['Size (MB)'].sum():.1f} MB")
+    with col3:
+        st.metric("📦 Entries", int(stats['Entries'].sum() + store_stats['Entries'].sum()))
+    with col4:
+        st.metric("🎯 Hit Ratio", f"{total_hits / total_calls * 100:.1f}%" if total_calls else "-")
+    
+    # Dosya değişikliği izleyicisi (core/watch.py)
+    watcher = start_watcher()
+    invalidated = watcher.invalidated
+    st.caption(f"👀 Data watcher: {f'scanning data/ every {watcher.interval:g}s' if watcher.running else 'off'} · "
+               f"invalidated {invalidated['matches']} matches, {invalidated['seasons']} seasons, "
+               f"{invalidated['entries']} entries")
+    
+    st.markdown("---")
+    
+    # Katmanlar
+    st.markdown("## 📚 Cache Layers")
+    if not registered:
+        st.info("💡 No cache layers yet - open Home or a match page first")
+    else:
+        with span("layers_table", "transfer"):
+            st.dataframe(stats, use_container_width=True, hide_index=True)
+    
+    for layer in registered:
+        rows = layer.entry_rows()
+        with st.expander(f"{layer.name} ({layer.kind}, {len(rows)} entries)", expanded=False):
+            if rows:
+                st.dataframe(pd.DataFrame(rows).sort_values('Size (KB)', ascending=False),
+                             use_container_width=True, hide_index=True)
+            else:
+                st.write("Empty")
+            if st.button("🧹 Clear layer", key=f"clear_{layer.page}_{layer.function}"):
+                layer.clear()
+                st.rerun()
+    
+    st.markdown("---")
+    
+    # Süreç içi depolar (st.cache_* dışında)
+    st.markdown("## 🧩 In-Process Stores")
+    st.dataframe(store_stats, use_container_width=True, hide_index=True)
+    
+    shared_rows = stores['Shared event store'][1]
+    with st.expander(f"Shared event store ({len(shared_rows)} frames)", expanded=False):
+        if shared_rows:
+            st.dataframe(pd.DataFrame(shared_rows).sort_values('Size (KB)', ascending=False),
+                         use_container_width=True, hide_index=True)
+            shared_ids = sorted({row['Match ID'] for row in shared_rows})
+            forget = st.selectbox("Match to drop", shared_ids, key="shared_match")
+            if st.button("🗑️ Drop match from shared store", key="forget_shared"):
+                st.toast(f"✅ {forget_match(forget)} frames removed for match {forget}")
+                st.rerun()
+        else:
+            st.write("Empty")
+        if st.button("🧹 Clear shared store", key="clear_shared"):
+            st.toast(f"✅ {clear_shared()} frames removed")
+            st.rerun()
+    
+    fetched_rows = stores['Fetch memory LRU'][1]
+    with st.expander(f"Fetch memory LRU ({len(fetched_rows)} files)", expanded=False):
+        store = loaded_store()
+        if fetched_rows:
+            st.dataframe(pd.DataFrame(fetched_rows).sort_values('Size (KB)', ascending=False),
+                         use_container_width=True, hide_index=True)
+            path = st.selectbox("File to drop", [row['Path'] for row in fetched_rows], key="fetch_path")
+            if st.button("🗑️ Drop file from memory", key="evict_fetch"):
+                st.toast(f"✅ {store.evict_memory(path)} entries removed")
+                st.rerun()
+        else:
+            st.write("Empty")
+        if store is not None and st.button("🧹 Clear fetch memory", key="clear_fetch"):
+            st.toast(f"✅ {store.evict_memory()} entries removed")
+            st.rerun()
+    
+    st.markdown("---")
+    
+    # Maç bazında bellek ve hedefli temizleme
+    st.markdown("## ⚽ Per-Match Memory")
+    footprints = match_footprints(registered, shared_rows)
+    match_ids = sorted(set(cached_match_ids()) | {row['Match ID'] for row in shared_rows})
+    
+    if not match_ids:
+        st.info("No match-scoped entries cached")
+        return
+    
+    per_match = pd.DataFrame(
+        [{'Match ID': m, 'Size (MB)': round(footprints.get(m, 0.0), 2)} for m in match_ids]
+    ).sort_values('Size (MB)', ascending=False)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.dataframe(per_match, use_container_width=True, hide_index=True)
+    
+    with col2:
+        selected = st.selectbox("Match to evict", match_ids)
+        if st.button("🗑️ Evict match from all caches", type="primary"):
+            removed = evict_match(selected)
+            st.toast(f"✅ {removed} entries removed for match {selected}")
+            st.rerun()
+    
+        # Bellek bütçesi tahmini
+        average = per_match['Size (MB)'].mean()
+        budget = st.number_input("Memory budget (MB)", min_value=64, value=1024, step=64)
+        st.metric("📊 Avg per match", f"{average:.1f} MB")
+        if average > 0:
+            st.metric("🔢 Matches that fit", int(budget // average))
+
+if __name__ == "__main__":
+    with trace_page("Cache Monitor") as trace:
+        main()
+    show_perf_panel(trace)
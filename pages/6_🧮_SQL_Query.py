@@ -0,0 +1,123 @@
+"""
+SQL Query
+Lokal olaylar, kadrolar ve maçlar üzerinde parametreli SQL sorguları
+
+Dosya yolu: pages/6_🧮_SQL_Query.py
+"""
+
+import json
+import time
+
+import streamlit as st
+
+from core.cache import observed
+from core.perf import span, trace_page, show_perf_panel
+from core.sql import DB_PATH, build_database, database_version, query, tables
+
+# Sayfa konfigürasyonu
+st.set_page_config(
+    page_title="SQL Query",
+    page_icon="🧮",
+    layout="wide"
+)
+
+# Ad → (sorgu, parametreler)
+EXAMPLES = {
+    "Progressive passes by player, 2nd half, away games": (
+        "SELECT player, team, COUNT(*) AS progressive_passes, SUM(completed) AS completed\n"
+        "FROM passes\n"
+        "WHERE progressive AND period = :period AND venue = :venue AND player LIKE :player\n"
+        "GROUP BY player, team\n"
+        "ORDER BY progressive_passes DESC",
+        {'period': 2, 'venue': 'away', 'player': '%'},
+    ),
+    "Shots and xG per player": (
+        "SELECT player, team, COUNT(*) AS shots, SUM(is_goal) AS goals, ROUND(SUM(xg), 2) AS xg\n"
+        "FROM shots\n"
+        "GROUP BY player, team\n"
+        "ORDER BY xg DESC\n"
+        "LIMIT :limit",
+        {'limit': 20},
+    ),
+    "Starters with cards": (
+        "SELECT m.match_date, l.team_name, l.player_name, l.jersey_number, l.yellow_cards, l.red_cards\n"
+        "FROM lineups l JOIN matches m USING (match_id)\n"
+        "WHERE l.started AND (l.yellow_cards > 0 OR l.red_cards > 0)\n"
+        "ORDER BY m.match_date",
+        {},
+    ),
+    "Team results": (
+        "SELECT match_date, home_team_name, home_score, away_score, away_team_name\n"
+        "FROM matches\n"
+        "WHERE home_team_name = :team OR away_team_name = :team\n"
+        "ORDER BY match_date",
+        {'team': 'Bayer Leverkusen'},
+    ),
+}
+
+
+@observed(st.cache_data(ttl=3600, max_entries=64), "SQL Query", "metric", ttl=3600)
+def run_query(sql, params_json, version):
+    """Sorgu sonucu; version (veritabanı dosyası sürümü) değişince yeniden çalışır"""
+    return query(sql, json.loads(params_json), use_cache=False)
+
+
+def main():
+    st.markdown("# 🧮 SQL Query")
+    st.caption("Ad-hoc questions over the local events, lineups and matches. "
+               "Views: `events_v` (events + venue, opponent), `passes` (completed, length, progressive), `shots` (is_goal).")
+
+    st.sidebar.header("⚙️ Database")
+    if st.sidebar.button("🔨 Build / Update Database", help="Loads only matches whose files changed"):
+        with st.spinner('🔨 Loading local data into SQLite...'):
+            with span("build_database", "load"):
+                counts = build_database()
+        st.sidebar.success(f"✅ {counts['events']} events, {counts['lineups']} lineup players, "
+                           f"{counts['matches']} matches loaded")
+
+    version = database_version()
+    if version is None:
+        st.info("💡 No database yet - click **🔨 Build / Update Database** (or run `python build_database.py`)")
+        return
+    st.sidebar.caption(f"📁 {DB_PATH}")
+
+    example = st.selectbox("📋 Example queries", list(EXAMPLES))
+    example_sql, example_params = EXAMPLES[example]
+    sql = st.text_area("SQL", example_sql, height=180, key=f"sql_{example}")
+    params_text = st.text_area("Parameters (JSON, for :name placeholders)", json.dumps(example_params),
+                               height=68, key=f"params_{example}")
+
+    try:
+        params = json.loads(params_text or "{}")
+    except json.JSONDecodeError as e:
+        st.error(f"❌ Parameters are not valid JSON: {e}")
+        return
+
+    start = time.perf_counter()
+    try:
+        with span("run_query", "compute"):
+            result = run_query(sql, json.dumps(params, sort_keys=True), version)
+    except Exception as e:
+        st.error(f"❌ Query failed: {e}")
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("📊 Rows", len(result))
+    with col2:
+        st.metric("⏱️ Time", f"{elapsed:.1f} ms")
+
+    with span("result_table", "transfer"):
+        st.dataframe(result, use_container_width=True, hide_index=True)
+    st.download_button("📥 Download CSV", result.to_csv(index=False).encode('utf-8'),
+                       file_name="query.csv", mime="text/csv")
+
+    with st.expander("🗂️ Schema", expanded=False):
+        for name, columns in tables().items():
+            st.markdown(f"**{name}**: {', '.join(columns)}")
+
+if __name__ == "__main__":
+    with trace_page("SQL Query") as trace:
+        main()
+    show_perf_panel(trace)
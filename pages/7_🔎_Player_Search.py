@@ -0,0 +1,97 @@
+"""
+Player Search
+Kadro indeksinden oyuncu araması ve oyuncunun maçları
+
+Dosya yolu: pages/7_🔎_Player_Search.py
+"""
+
+import streamlit as st
+import pandas as pd
+
+from core.cache import observed
+from core.catalog import load_catalog, local_seasons
+from core.perf import span, trace_page, show_perf_panel
+from core.player_index import get_player_index
+
+# Sayfa konfigürasyonu
+st.set_page_config(
+    page_title="Player Search",
+    page_icon="🔎",
+    layout="wide"
+)
+
+
+@observed(st.cache_data(ttl=3600), "Player Search", "index", ttl=3600)
+def load_match_labels(seasons):
+    """Yerel kataloglardan maç ID → tarih, ev sahibi, skor, deplasman"""
+    frames = [load_catalog(competition_id, season_id) for competition_id, season_id in seasons]
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        return pd.DataFrame(columns=['match_id', 'match_date', 'home_team_name', 'score', 'away_team_name'])
+    catalog = pd.concat(frames, ignore_index=True)
+    catalog['score'] = catalog['home_score'].astype(str) + " - " + catalog['away_score'].astype(str)
+    return catalog[['match_id', 'match_date', 'home_team_name', 'score', 'away_team_name']]
+
+
+def main():
+    st.markdown("# 🔎 Player Search")
+    st.caption("Every local match a player appeared in, from the lineup index - no events files are opened.")
+
+    with span("player_index", "load"):
+        index = get_player_index()
+
+    if not index.by_player:
+        st.info("💡 No lineups indexed yet - download lineups into data/lineups/ (or run `python build_player_index.py`)")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("👤 Players", len(index.by_player))
+    with col2:
+        st.metric("🛡️ Teams", len(index.by_team))
+    with col3:
+        st.metric("⚽ Matches", len(index.by_match))
+
+    text = st.text_input("Player name (prefix of any name part, e.g. `flo wir`)", "")
+    if not text.strip():
+        return
+
+    with span("search", "compute"):
+        results = index.search(text)
+    if not results:
+        st.warning(f"⚠️ No player matches '{text}'")
+        return
+
+    labels = {player_id: f"{name} ({count} matches)" for player_id, name, count in results}
+    player_id = st.selectbox("Player", list(labels), format_func=labels.get)
+    started_only = st.checkbox("Started only (Starting XI)")
+
+    with span("appearances", "compute"):
+        frame = index.player_frame(player_id, started=True if started_only else None)
+        frame = frame.merge(load_match_labels(tuple(local_seasons())), on='match_id', how='left')
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("⚽ Appearances", len(frame))
+    with col2:
+        st.metric("🟢 Starts", int(frame['started'].sum()))
+    with col3:
+        st.metric("⏱️ Minutes", f"{frame['minutes'].sum():.0f}")
+
+    columns = ['match_date', 'home_team_name', 'score', 'away_team_name', 'team', 'jersey_number',
+               'started', 'minutes', 'positions', 'cards', 'match_id']
+    with span("appearance_table", "transfer"):
+        st.dataframe(
+            frame[columns].rename(columns={
+                'match_date': 'Date', 'home_team_name': 'Home', 'score': 'Score', 'away_team_name': 'Away',
+                'team': 'Team', 'jersey_number': 'Number', 'started': 'Started', 'minutes': 'Minutes',
+                'positions': 'Positions', 'cards': 'Cards', 'match_id': 'Match ID',
+            }),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+if __name__ == "__main__":
+    with trace_page("Player Search") as trace:
+        main()
+    show_perf_panel(trace)
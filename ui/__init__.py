@@ -0,0 +1,4 @@
+"""
+StatsBomb Analytics - Ortak arayüz parçaları
+Birden fazla sayfada kullanılan Streamlit bileşenleri
+"""
@@ -0,0 +1,74 @@
+"""
+Export Panel
+Sayfalardaki arka plan export paneli (Home ve Pass Networks ortak kullanır)
+
+İşler core.export.ExportJobs ile arka planda yazılır; panel iş sürerken
+fragment ile her saniye durumu yeniler, bitince indirme düğmesi gösterir.
+"""
+
+import streamlit as st
+
+from core.export import ExportJobs
+
+EXPORT_FORMAT_LABELS = {'csv': 'CSV', 'parquet': 'Parquet', 'ndjson': 'NDJSON (gzip)'}
+
+
+@st.cache_resource
+def get_export_jobs():
+    """Arka plan export işleri (oturumlar arasında paylaşılır)"""
+    return ExportJobs()
+
+
+def read_artifact(path):
+    """Export dosyasını indirme anında oku"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def show_export_status(key, job_id):
+    """Export işinin durumu; iş sürerken fragment her saniye yenilenir"""
+    job = get_export_jobs().get(job_id)
+    if job is None:
+        return
+    
+    if job.state in ('queued', 'running'):
+        st.info(f"⏳ Exporting {job.file_name}... ({job.elapsed:.1f}s)")
+    elif job.state == 'failed':
+        st.error(f"❌ Export failed: {job.error}")
+    else:
+        st.success(f"✅ {job.rows} rows exported in {job.elapsed:.1f}s")
+        st.download_button(
+            label=f"📥 Download {job.file_name}",
+            data=lambda: read_artifact(job.path),
+            file_name=job.file_name,
+            mime=job.mime,
+            key=f"{key}_download"
+        )
+    
+    # İş bitti: sayfayı yenile ki fragment'ın periyodik yenilemesi dursun
+    if st.session_state.get(f"{key}_polling") and job.state not in ('queued', 'running'):
+        st.session_state[f"{key}_polling"] = False
+        st.rerun()
+
+
+def export_panel(key, sources):
+    """Export paneli: kaynak ve format seç, arka planda yaz, bitince indir
+
+    sources: {etiket: (dosya adı, parça generator'ı döndüren fonksiyon)}
+    """
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        source = st.selectbox("Export", list(sources), key=f"{key}_source")
+    with col2:
+        fmt = st.selectbox("Format", list(EXPORT_FORMAT_LABELS), format_func=EXPORT_FORMAT_LABELS.get, key=f"{key}_format")
+    with col3:
+        st.markdown("<div style='padding-top: 1.7rem;'></div>", unsafe_allow_html=True)
+        if st.button("📦 Start Export", key=f"{key}_start", use_container_width=True):
+            name, make_chunks = sources[source]
+            st.session_state[f"{key}_job"] = get_export_jobs().submit(name, make_chunks, fmt).job_id
+            st.session_state[f"{key}_polling"] = True
+    
+    job_id = st.session_state.get(f"{key}_job")
+    if job_id:
+        run_every = 1 if st.session_state.get(f"{key}_polling") else None
+        st.fragment(show_export_status, run_every=run_every)(key, job_id)
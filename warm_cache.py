@@ -0,0 +1,142 @@
+"""
+StatsBomb Cache Warm-up
+Deploy sonrası, sunucu trafik almadan önce kalıcı önbellekleri doldur
+
+Seçilen turnuva/sezonların maç kataloglarını oluşturur, sonra lokalde events
+dosyası olan her maç için düz olay tablosunu, takım metriklerini ve varsayılan
+grafikleri (core/match_cache.py) paralel olarak hazırlar. Zaman bütçesi
+dolunca yeni maç başlatılmaz; ısıtılan her maç log dosyasına JSON satırı
+olarak yazılır.
+
+Kullanım:
+python warm_cache.py
+python warm_cache.py --season 9:281 --season 11:90 --workers 4 --budget 300
+python warm_cache.py --all --log data/cache/warmup.jsonl
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import matplotlib
+matplotlib.use("Agg")
+
+from core.catalog import load_catalog, available_seasons
+from core.loaders import DATA_DIR, read_json
+from core.match_cache import CACHE_DIR, has_local_events, warm_match
+
+# Home sayfasının varsayılan sezonu
+DEFAULT_SEASONS = [(9, 281)]
+
+WARMUP_LOG = os.path.join(CACHE_DIR, "warmup.jsonl")
+
+
+def parse_season(value):
+    """"9:281" → (9, 281)"""
+    try:
+        competition_id, season_id = value.split(":")
+        return int(competition_id), int(season_id)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COMPETITION:SEASON, got {value!r}")
+
+
+def _warm_one(match_id):
+    start = time.perf_counter()
+    try:
+        warmed = warm_match(match_id)
+        error = None
+    except Exception as e:
+        warmed, error = [], f"{type(e).__name__}: {e}"
+    return match_id, warmed, error, time.perf_counter() - start
+
+
+def preload_catalogs(seasons):
+    """Katalogları oluştur/oku; (sezon, maç ID'leri) listesi"""
+    result = []
+    for competition_id, season_id in seasons:
+        catalog = load_catalog(competition_id, season_id)
+        if catalog is None:
+            print(f"⚠️  No matches file for {competition_id}:{season_id}")
+            continue
+        match_ids = [int(m) for m in catalog['match_id'] if has_local_events(int(m))]
+        print(f"📚 {competition_id}:{season_id}: {len(catalog)} matches, {len(match_ids)} with local events")
+        result.append(((competition_id, season_id), match_ids))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the persistent match caches before serving traffic")
+    parser.add_argument("--season", type=parse_season, action="append",
+                        help="COMPETITION:SEASON to warm (repeatable, default: 9:281)")
+    parser.add_argument("--all", action="store_true", help="Warm every locally available season")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--budget", type=float, default=600, help="Time budget in seconds")
+    parser.add_argument("--log", default=WARMUP_LOG, help="JSON lines log of warmed matches")
+    args = parser.parse_args()
+
+    if args.all:
+        seasons = sorted(available_seasons(read_json(os.path.join(DATA_DIR, "competitions.json"))))
+    else:
+        seasons = args.season or DEFAULT_SEASONS
+
+    start = time.perf_counter()
+    deadline = start + args.budget
+    print(f"🚀 Warming {len(seasons)} seasons with {args.workers} workers, budget {args.budget:.0f}s\n")
+
+    match_ids = [m for _, ids in preload_catalogs(seasons) for m in ids]
+    print()
+
+    os.makedirs(os.path.dirname(args.log) or ".", exist_ok=True)
+    warmed_count = failed = 0
+    pool = ProcessPoolExecutor(max_workers=args.workers)
+    pending = iter(match_ids)
+    running = set()
+
+    with open(args.log, 'a', encoding='utf-8') as log:
+        # Bütçe dolana kadar her işçiye bir maç; bitenin yerine yenisi
+        for match_id in pending:
+            running.add(pool.submit(_warm_one, match_id))
+            if len(running) >= args.workers:
+                break
+
+        while running:
+            # Bütçe dolduktan sonra yalnızca süren maçların bitmesi beklenir
+            remaining = deadline - time.perf_counter()
+            done, running = wait(running, timeout=remaining if remaining > 0 else None,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                match_id, warmed, error, seconds = future.result()
+                log.write(json.dumps({
+                    'ts': round(time.time(), 3), 'match_id': match_id, 'warmed': warmed,
+                    'seconds': round(seconds, 3), 'error': error,
+                }, ensure_ascii=False) + "\n")
+                if error:
+                    failed += 1
+                    print(f"❌ {match_id}: {error}")
+                else:
+                    warmed_count += 1
+                    print(f"✅ {match_id}: {', '.join(warmed)} ({seconds:.1f}s)")
+
+            if time.perf_counter() >= deadline:
+                continue
+            for match_id in pending:
+                running.add(pool.submit(_warm_one, match_id))
+                if len(running) >= args.workers:
+                    break
+
+    pool.shutdown()
+    skipped = len(match_ids) - warmed_count - failed
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Warmed {warmed_count}/{len(match_ids)} matches in {elapsed:.1f}s")
+    if failed:
+        print(f"❌ {failed} matches failed")
+    if skipped:
+        print(f"⚠️  Budget reached: {skipped} matches not warmed")
+    print(f"📄 Log: {args.log}")
+
+
+if __name__ == "__main__":
+    main()